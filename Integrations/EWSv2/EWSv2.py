@@ -6,6 +6,7 @@ import traceback
 import json
 import os
 import hashlib
+import time
 from datetime import timedelta
 from cStringIO import StringIO
 import logging
@@ -107,6 +108,16 @@ SERVER_BUILD = ""
 MARK_AS_READ = demisto.params().get('markAsRead', False)
 MAX_FETCH = min(50, int(demisto.params().get('maxFetch', 50)))
 LAST_RUN_IDS_QUEUE_SIZE = 500
+AUTODISCOVERY_TIME = "discovery_time"
+AUTODISCOVERY_TTL = 60 * 60  # seconds to trust the cached auto-discovery config without verifying it
+USES_CACHED_AUTODISCOVERY = False  # whether the execution uses an auto-discovery config it did not discover or verify
+# commands which do not change the mailbox, so they can run again after a failure
+READ_ONLY_COMMANDS = frozenset([
+    'test-module', 'fetch-incidents', 'ews-get-attachment', 'ews-get-searchable-mailboxes', 'ews-search-mailboxes',
+    'ews-search-mailbox', 'ews-get-contacts', 'ews-get-out-of-office', 'ews-find-folders', 'ews-get-items-from-folder',
+    'ews-get-items', 'ews-get-folder', 'ews-o365-get-compliance-search', 'ews-o365-get-compliance-search-purge-status',
+    'ews-get-autodiscovery-config', 'ews-expand-group', 'ews-get-items-as-eml',
+])
 
 START_COMPLIANCE = """
 [CmdletBinding()]
@@ -392,9 +403,21 @@ def create_context_dict(account):
     }
 
 
+def set_autodiscovery_context(context_dict):
+    global USES_CACHED_AUTODISCOVERY
+    USES_CACHED_AUTODISCOVERY = False
+    context_dict = dict(context_dict)
+    context_dict[AUTODISCOVERY_TIME] = int(time.time())
+    demisto.setIntegrationContext(context_dict)
+
+
+def is_autodiscovery_context_expired(context_dict):
+    return time.time() - context_dict.get(AUTODISCOVERY_TIME, 0) > AUTODISCOVERY_TTL
+
+
 def prepare_context(credentials):
     context_dict = demisto.getIntegrationContext()
-    global SERVER_BUILD, EWS_SERVER
+    global SERVER_BUILD, EWS_SERVER, USES_CACHED_AUTODISCOVERY
     if not context_dict:
         try:
             account = Account(
@@ -405,7 +428,7 @@ def prepare_context(credentials):
             if not USE_PROXY:
                 os.environ['NO_PROXY'] = EWS_SERVER
             SERVER_BUILD = account.protocol.version.build
-            demisto.setIntegrationContext(create_context_dict(account))
+            set_autodiscovery_context(create_context_dict(account))
         except AutoDiscoverFailed:
             return_error("Auto discovery failed. Check credentials or configure manually")
         except Exception as e:
@@ -413,6 +436,17 @@ def prepare_context(credentials):
     else:
         SERVER_BUILD = get_build_autodiscover(context_dict)
         EWS_SERVER = get_endpoint_autodiscover(context_dict)
+        USES_CACHED_AUTODISCOVERY = True
+
+
+def rediscover():
+    """
+    Drops the cached auto-discovery config and discovers the server again.
+    """
+    global EWS_SERVER
+    demisto.setIntegrationContext({})
+    EWS_SERVER = demisto.params()['ewsServer']
+    return prepare()
 
 
 def prepare():
@@ -493,7 +527,10 @@ def get_account_autodiscover(account_email, access_type=ACCESS_TYPE):
                 primary_smtp_address=account_email, autodiscover=False, config=Configuration(**config_args),
                 access_type=access_type,
             )
-            account.root.effective_rights.read  # pylint: disable=E1101
+            # verify the cached config only once it expires, so most executions skip the extra round trip
+            if is_autodiscovery_context_expired(context_dict):
+                account.root.effective_rights.read  # pylint: disable=E1101
+                set_autodiscovery_context(context_dict)
             return account
         except Exception, original_exc:
             pass
@@ -506,11 +543,11 @@ def get_account_autodiscover(account_email, access_type=ACCESS_TYPE):
         return_error("Auto discovery failed. Check credentials or configure manually")
 
     autodiscover_result = create_context_dict(account)
-    if autodiscover_result == context_dict:
+    if context_dict and all(context_dict.get(key) == value for key, value in autodiscover_result.items()):
         raise original_exc  # pylint: disable=E0702
 
     if account_email == ACCOUNT_EMAIL:
-        demisto.setIntegrationContext(create_context_dict(account))
+        set_autodiscovery_context(autodiscover_result)
     return account
 
 
@@ -911,21 +948,29 @@ def get_last_run():
 
 
 def fetch_last_emails(account, folder_name='Inbox', since_datetime=None, exclude_ids=None):
-    qs = get_folder_by_path(account, folder_name, is_public=IS_PUBLIC_FOLDER)
+    folder = get_folder_by_path(account, folder_name, is_public=IS_PUBLIC_FOLDER)
+    qs = folder
     if since_datetime:
         qs = qs.filter(datetime_received__gte=since_datetime)
     else:
         if not FETCH_ALL_HISTORY:
             last_10_min = EWSDateTime.now(tz=EWSTimeZone.timezone('UTC')) - timedelta(minutes=10)
             qs = qs.filter(datetime_received__gte=last_10_min)
-    qs = qs.filter().only(*map(lambda x: x.name, Message.FIELDS))
     qs = qs.filter().order_by('datetime_received')
 
-    result = qs.all()
-    result = [x for x in result if isinstance(x, Message)]
-    if exclude_ids and len(exclude_ids) > 0:
-        exclude_ids = set(exclude_ids)
-        result = [x for x in result if x.message_id not in exclude_ids]
+    # select the emails server side, ordered and limited, getting only the fields needed to select them
+    exclude_ids = set(exclude_ids or [])
+    candidates = qs.only('message_id')[:MAX_FETCH + len(exclude_ids)]
+    selected = [x for x in candidates if isinstance(x, Message) and x.message_id and x.message_id not in exclude_ids]
+    selected = selected[:MAX_FETCH]
+    if not selected:
+        return []
+
+    # and get the full items for the selected emails only
+    result = [x for x in account.fetch(ids=selected) if isinstance(x, Message)]
+    if exchangelib.__version__ != "1.12.0":  # Docker BC
+        for item in result:
+            item.folder = folder
     return result
 
 
@@ -1961,6 +2006,66 @@ def encode_and_submit_results(obj):
     demisto.results(str_to_unicode(obj))
 
 
+def execute_command(protocol, args):
+    if demisto.command() == 'test-module':
+        test_module()
+    elif demisto.command() == 'fetch-incidents':
+        incidents = fetch_emails_as_incidents(ACCOUNT_EMAIL, FOLDER_NAME)
+        demisto.incidents(str_to_unicode(incidents))
+    elif demisto.command() == 'ews-get-attachment':
+        encode_and_submit_results(fetch_attachments_for_message(**args))
+    elif demisto.command() == 'ews-delete-attachment':
+        encode_and_submit_results(delete_attachments_for_message(**args))
+    elif demisto.command() == 'ews-get-searchable-mailboxes':
+        encode_and_submit_results(get_searchable_mailboxes(protocol))
+    elif demisto.command() == 'ews-search-mailboxes':
+        encode_and_submit_results(search_mailboxes(protocol, **args))
+    elif demisto.command() == 'ews-move-item-between-mailboxes':
+        encode_and_submit_results(move_item_between_mailboxes(**args))
+    elif demisto.command() == 'ews-move-item':
+        encode_and_submit_results(move_item(**args))
+    elif demisto.command() == 'ews-delete-items':
+        encode_and_submit_results(delete_items(**args))
+    elif demisto.command() == 'ews-search-mailbox':
+        encode_and_submit_results(search_items_in_mailbox(**args))
+    elif demisto.command() == 'ews-get-contacts':
+        encode_and_submit_results(get_contacts(**args))
+    elif demisto.command() == 'ews-get-out-of-office':
+        encode_and_submit_results(get_out_of_office_state(**args))
+    elif demisto.command() == 'ews-recover-messages':
+        encode_and_submit_results(recover_soft_delete_item(**args))
+    elif demisto.command() == 'ews-create-folder':
+        encode_and_submit_results(create_folder(**args))
+    elif demisto.command() == 'ews-mark-item-as-junk':
+        encode_and_submit_results(mark_item_as_junk(**args))
+    elif demisto.command() == 'ews-find-folders':
+        encode_and_submit_results(find_folders(**args))
+    elif demisto.command() == 'ews-get-items-from-folder':
+        encode_and_submit_results(get_items_from_folder(**args))
+    elif demisto.command() == 'ews-get-items':
+        encode_and_submit_results(get_items(**args))
+    elif demisto.command() == 'ews-get-folder':
+        encode_and_submit_results(get_folder(**args))
+    elif demisto.command() == 'ews-o365-start-compliance-search':
+        encode_and_submit_results(start_compliance_search(**args))
+    elif demisto.command() == 'ews-o365-get-compliance-search':
+        encode_and_submit_results(get_compliance_search(**args))
+    elif demisto.command() == 'ews-o365-purge-compliance-search-results':
+        encode_and_submit_results(purge_compliance_search(**args))
+    elif demisto.command() == 'ews-o365-get-compliance-search-purge-status':
+        encode_and_submit_results(check_purge_compliance_search(**args))
+    elif demisto.command() == 'ews-o365-remove-compliance-search':
+        encode_and_submit_results(remove_compliance_search(**args))
+    elif demisto.command() == 'ews-get-autodiscovery-config':
+        encode_and_submit_results(get_autodiscovery_config())
+    elif demisto.command() == 'ews-expand-group':
+        encode_and_submit_results(get_expanded_group(protocol, **args))
+    elif demisto.command() == 'ews-mark-items-as-read':
+        encode_and_submit_results(mark_item_as_read(**args))
+    elif demisto.command() == 'ews-get-items-as-eml':
+        encode_and_submit_results(get_item_as_eml(**args))
+
+
 def sub_main():
     global EWS_SERVER, USERNAME, ACCOUNT_EMAIL, PASSWORD
     global config, credentials
@@ -1972,65 +2077,18 @@ def sub_main():
     args = prepare_args(demisto.args())
     fix_2010()
     try:
-        protocol = get_protocol()
-        if demisto.command() == 'test-module':
-            test_module()
-        elif demisto.command() == 'fetch-incidents':
-            incidents = fetch_emails_as_incidents(ACCOUNT_EMAIL, FOLDER_NAME)
-            demisto.incidents(str_to_unicode(incidents))
-        elif demisto.command() == 'ews-get-attachment':
-            encode_and_submit_results(fetch_attachments_for_message(**args))
-        elif demisto.command() == 'ews-delete-attachment':
-            encode_and_submit_results(delete_attachments_for_message(**args))
-        elif demisto.command() == 'ews-get-searchable-mailboxes':
-            encode_and_submit_results(get_searchable_mailboxes(protocol))
-        elif demisto.command() == 'ews-search-mailboxes':
-            encode_and_submit_results(search_mailboxes(protocol, **args))
-        elif demisto.command() == 'ews-move-item-between-mailboxes':
-            encode_and_submit_results(move_item_between_mailboxes(**args))
-        elif demisto.command() == 'ews-move-item':
-            encode_and_submit_results(move_item(**args))
-        elif demisto.command() == 'ews-delete-items':
-            encode_and_submit_results(delete_items(**args))
-        elif demisto.command() == 'ews-search-mailbox':
-            encode_and_submit_results(search_items_in_mailbox(**args))
-        elif demisto.command() == 'ews-get-contacts':
-            encode_and_submit_results(get_contacts(**args))
-        elif demisto.command() == 'ews-get-out-of-office':
-            encode_and_submit_results(get_out_of_office_state(**args))
-        elif demisto.command() == 'ews-recover-messages':
-            encode_and_submit_results(recover_soft_delete_item(**args))
-        elif demisto.command() == 'ews-create-folder':
-            encode_and_submit_results(create_folder(**args))
-        elif demisto.command() == 'ews-mark-item-as-junk':
-            encode_and_submit_results(mark_item_as_junk(**args))
-        elif demisto.command() == 'ews-find-folders':
-            encode_and_submit_results(find_folders(**args))
-        elif demisto.command() == 'ews-get-items-from-folder':
-            encode_and_submit_results(get_items_from_folder(**args))
-        elif demisto.command() == 'ews-get-items':
-            encode_and_submit_results(get_items(**args))
-        elif demisto.command() == 'ews-get-folder':
-            encode_and_submit_results(get_folder(**args))
-        elif demisto.command() == 'ews-o365-start-compliance-search':
-            encode_and_submit_results(start_compliance_search(**args))
-        elif demisto.command() == 'ews-o365-get-compliance-search':
-            encode_and_submit_results(get_compliance_search(**args))
-        elif demisto.command() == 'ews-o365-purge-compliance-search-results':
-            encode_and_submit_results(purge_compliance_search(**args))
-        elif demisto.command() == 'ews-o365-get-compliance-search-purge-status':
-            encode_and_submit_results(check_purge_compliance_search(**args))
-        elif demisto.command() == 'ews-o365-remove-compliance-search':
-            encode_and_submit_results(remove_compliance_search(**args))
-        elif demisto.command() == 'ews-get-autodiscovery-config':
-            encode_and_submit_results(get_autodiscovery_config())
-        elif demisto.command() == 'ews-expand-group':
-            encode_and_submit_results(get_expanded_group(protocol, **args))
-        elif demisto.command() == 'ews-mark-items-as-read':
-            encode_and_submit_results(mark_item_as_read(**args))
-        elif demisto.command() == 'ews-get-items-as-eml':
-            encode_and_submit_results(get_item_as_eml(**args))
-
+        protocol = None
+        try:
+            protocol = get_protocol()
+            execute_command(protocol, args)
+        except (AutoDiscoverFailed, TransportError, ConnectionError), e:
+            # the cached auto-discovery config may be stale, so discover the server again and retry once. A command
+            # which may have changed the mailbox before failing is retried only if it failed while connecting.
+            if not USES_CACHED_AUTODISCOVERY or (protocol is not None and demisto.command() not in READ_ONLY_COMMANDS):
+                raise
+            demisto.debug('Retrying with a new auto-discovery config after: {}'.format(e))
+            config, credentials = rediscover()
+            execute_command(get_protocol(), args)
     except Exception, e:
         import time
 
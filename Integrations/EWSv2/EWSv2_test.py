@@ -1,5 +1,6 @@
 import EWSv2
 import logging
+import time
 
 
 def test_keys_to_camel_case():
@@ -18,3 +19,104 @@ def test_start_logging():
     EWSv2.start_logging()
     logging.getLogger().debug("test this")
     assert "test this" in EWSv2.log_stream.getvalue()
+
+
+def test_fetch_last_emails_selects_server_side(mocker):
+    from exchangelib.items import Message
+    emails = [Message(message_id='<{}@demisto.com>'.format(i), item_id=str(i), changekey=str(i)) for i in range(100)]
+    queryset = mocker.MagicMock()
+    queryset.filter.return_value = queryset
+    queryset.order_by.return_value = queryset
+    queryset.only.return_value = queryset
+    queryset.__getitem__.side_effect = lambda s: emails[s]
+    mocker.patch.object(EWSv2, 'get_folder_by_path', return_value=queryset)
+    account = mocker.Mock()
+    account.fetch.side_effect = lambda ids: ids
+
+    result = EWSv2.fetch_last_emails(account, exclude_ids=['<0@demisto.com>', '<1@demisto.com>'])
+    queryset.only.assert_called_with('message_id')
+    queryset.__getitem__.assert_called_with(slice(None, EWSv2.MAX_FETCH + 2))
+    assert [email.message_id for email in result] == ['<{}@demisto.com>'.format(i)
+                                                      for i in range(2, EWSv2.MAX_FETCH + 2)]
+
+
+def test_get_account_autodiscover_skips_verification_in_ttl(mocker):
+    context = {'auth_type': 'basic', 'service_endpoint': 'https://outlook.office365.com/EWS/Exchange.asmx',
+               'build': '15.20.2.1', 'api_version': 'Exchange2016', EWSv2.AUTODISCOVERY_TIME: int(time.time())}
+    mocker.patch.object(EWSv2.demisto, 'getIntegrationContext', return_value=context)
+    mocker.patch.object(EWSv2.demisto, 'setIntegrationContext')
+    mocker.patch.object(EWSv2, 'Configuration')
+    account = mocker.patch.object(EWSv2, 'Account')
+
+    EWSv2.get_account_autodiscover('test@demisto.com')
+    assert account.call_count == 1
+    assert not EWSv2.demisto.setIntegrationContext.called
+
+    context[EWSv2.AUTODISCOVERY_TIME] -= EWSv2.AUTODISCOVERY_TTL + 1
+    EWSv2.get_account_autodiscover('test@demisto.com')
+    assert account.call_count == 2
+    assert EWSv2.demisto.setIntegrationContext.call_args[0][0][EWSv2.AUTODISCOVERY_TIME] > \
+        context[EWSv2.AUTODISCOVERY_TIME]
+
+
+def run_sub_main_with_error(mocker, command, get_protocol_error=None, cached=True):
+    """Runs a command which fails once on a connection error, with a cached auto-discovery config by default"""
+    from exchangelib.errors import TransportError
+    params = {'ewsServer': '', 'credentials': {'identifier': 'user', 'password': 'password'},
+              'defaultTargetMailbox': 'test@demisto.com'}
+    mocker.patch.object(EWSv2.demisto, 'params', return_value=params)
+    mocker.patch.object(EWSv2.demisto, 'command', return_value=command)
+    mocker.patch.object(EWSv2.demisto, 'setIntegrationContext')
+    mocker.patch.object(EWSv2.demisto, 'results')
+    mocker.patch.object(EWSv2, 'fix_2010')
+    mocker.patch.object(EWSv2, 'exchangelib_cleanup')
+    mocker.patch.object(EWSv2, 'log_stream', None)
+    mocker.patch('time.sleep')
+    if get_protocol_error:
+        mocker.patch.object(EWSv2, 'get_protocol', side_effect=[get_protocol_error, mocker.Mock()])
+        execute_command = mocker.patch.object(EWSv2, 'execute_command')
+    else:
+        mocker.patch.object(EWSv2, 'get_protocol')
+        execute_command = mocker.patch.object(EWSv2, 'execute_command',
+                                              side_effect=[TransportError('timed out'), None])
+
+    def prepare_cached_context():
+        EWSv2.USES_CACHED_AUTODISCOVERY = cached
+        return None, None
+
+    mocker.patch.object(EWSv2, 'prepare', side_effect=prepare_cached_context)
+    EWSv2.sub_main()
+    return execute_command
+
+
+def test_sub_main_rediscovers_on_connection_error(mocker):
+    # the cached auto-discovery config is dropped, and a read only command is retried once with a new one
+    execute_command = run_sub_main_with_error(mocker, 'ews-get-items')
+    assert execute_command.call_count == 2
+    assert EWSv2.prepare.call_count == 2
+    EWSv2.demisto.setIntegrationContext.assert_called_once_with({})
+    assert not EWSv2.demisto.results.called
+
+
+def test_sub_main_does_not_retry_changes(mocker):
+    # a command which may have changed the mailbox is not run again
+    execute_command = run_sub_main_with_error(mocker, 'ews-delete-items')
+    assert execute_command.call_count == 1
+    assert not EWSv2.demisto.setIntegrationContext.called
+    assert EWSv2.demisto.results.call_args[0][0]['Type'] == EWSv2.entryTypes['error']
+
+
+def test_sub_main_retries_connecting(mocker):
+    # any command is retried when it failed while connecting, before it changed the mailbox
+    from exchangelib.errors import TransportError
+    execute_command = run_sub_main_with_error(mocker, 'ews-delete-items', get_protocol_error=TransportError('timed out'))
+    assert execute_command.call_count == 1
+    EWSv2.demisto.setIntegrationContext.assert_called_once_with({})
+    assert not EWSv2.demisto.results.called
+
+
+def test_sub_main_does_not_rediscover_new_config(mocker):
+    # a config discovered or verified by this execution is not discovered again
+    execute_command = run_sub_main_with_error(mocker, 'ews-get-items', cached=False)
+    assert execute_command.call_count == 1
+    assert EWSv2.demisto.results.call_args[0][0]['Type'] == EWSv2.entryTypes['error']
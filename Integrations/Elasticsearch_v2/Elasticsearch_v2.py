@@ -42,6 +42,11 @@ FETCH_TIME = demisto.params().get('fetch_time', '3 days')
 FETCH_SIZE = int(demisto.params().get('fetch_size', 50))
 INSECURE = not demisto.params().get('insecure', False)
 TIME_METHOD = demisto.params().get('time_method', 'Simple-Date')
+FETCH_SEARCH_AFTER = demisto.params().get('fetch_search_after', False)
+# _id is not sortable by default from Elasticsearch 7.6, as its fielddata is disabled. _doc is always sortable, but is
+# only unique within a shard and may change when segments are merged, so a unique keyword field should be configured.
+TIEBREAKER_FIELD = demisto.params().get('fetch_tiebreaker_field') or '_doc'
+SCROLL_TIMEOUT = '2m'
 
 
 def get_timestamp_first_fetch(last_fetch):
@@ -207,6 +212,7 @@ def search_command():
     size = int(demisto.args().get('size'))
     sort_field = demisto.args().get('sort-field')
     sort_order = demisto.args().get('sort-order')
+    all_results = 'true' == demisto.args().get('all_results')
 
     es = elasticsearch_builder()
 
@@ -223,8 +229,31 @@ def search_command():
     if sort_field is not None:
         search = search.sort({sort_field: {'order': sort_order}})
 
+    if all_results:
+        # stream all the hits in chunks of the requested size, each one returned as a page of results
+        body = search.to_dict()
+        body.pop('from', None)
+        body.pop('size', None)
+        page = 0
+        for response in scroll_search(es, index, body, size):
+            search_results_to_outputs(index, query, page, size, response)
+            page += size
+        return
+
     response = search.execute().to_dict()
+    search_results_to_outputs(index, query, base_page, size, response)
+
+
+def search_results_to_outputs(index, query, base_page, size, response):
+    """Returns the results of a search to the war room and the context.
 
+    Args:
+        index(str): the index in which the search was made.
+        query(str): the query of the search.
+        base_page(int): the base page from which the results start.
+        size(int): the amount of results to return.
+        response(dict): the raw response of the results.
+    """
     total_dict, total_results = get_total_results(response)
     search_context, meta_headers, hit_tables, hit_headers = results_to_context(index, query, base_page,
                                                                                size, total_dict, response)
@@ -239,6 +268,35 @@ def search_command():
     return_outputs(total_human_readable, full_context, response)
 
 
+def scroll_search(es, index, body, chunk_size):
+    """Streams the results of a search in chunks through the scroll API.
+
+    Notes:
+        unlike from/size paging, this is not capped by index.max_result_window and the cluster does not
+        re-sort all the preceding hits for every chunk.
+
+    Args:
+        es(Elasticsearch): an Elasticsearch object to search with.
+        index(str): the index in which to search.
+        body(dict): the search request body.
+        chunk_size(int): the amount of hits in each chunk.
+
+    Returns:
+        (generator).The raw response of each chunk.
+    """
+    response = es.search(index=index, body=body, scroll=SCROLL_TIMEOUT, size=chunk_size)
+    scroll_id = response.get('_scroll_id')
+    try:
+        while response.get('hits', {}).get('hits'):
+            yield response
+            response = es.scroll(body={'scroll_id': scroll_id, 'scroll': SCROLL_TIMEOUT})
+            scroll_id = response.get('_scroll_id', scroll_id)
+
+    finally:
+        if scroll_id:
+            es.clear_scroll(body={'scroll_id': [scroll_id]}, ignore=(404,))
+
+
 def fetch_params_check():
     """If is_fetch is ticked, this function checks that all the necessary parameters for the fetch are entered."""
     str_error = []  # type:List
@@ -433,6 +491,53 @@ def incident_label_maker(source):
     return labels
 
 
+def hit_to_incident(hit, occurred):
+    """Creates an incident from a single hit.
+
+    Args:
+        hit(dict): a single hit of the search results.
+        occurred(str): the date of the hit in the format YYYY-MM-DDThh:mm:ssZ.
+
+    Returns:
+        (dict).The incident.
+    """
+    return {
+        'name': 'Elasticsearch: Index: ' + str(hit.get('_index')) + ", ID: " + str(hit.get('_id')),
+        'rawJSON': json.dumps(hit),
+        'labels': incident_label_maker(hit.get('_source')),
+        'occurred': occurred
+    }
+
+
+def results_to_incidents_search_after(response):
+    """Converts all the hits of a search_after page into incidents.
+
+    Notes:
+        the hits of the page come strictly after the previous page by (time field, tiebreaker), so none of them
+        are duplicates, even when many hits share the same time.
+
+    Args:
+        response(dict): the raw search results from Elasticsearch.
+
+    Returns:
+        (list).The incidents.
+        (num or str).The time of the last hit, in the format of the last run time.
+    """
+    incidents = []
+    last_fetch = None
+    for hit in response.get('hits', {}).get('hits'):
+        if hit.get('_source') is not None and hit.get('_source').get(str(TIME_FIELD)) is not None:
+            if 'Timestamp' in TIME_METHOD:
+                last_fetch = int(hit.get('_source')[str(TIME_FIELD)])
+                occurred = timestamp_to_date(str(last_fetch)).isoformat() + 'Z'
+            else:
+                occurred = format_to_iso(parse(str(hit.get('_source')[str(TIME_FIELD)])).isoformat())
+                last_fetch = occurred
+            incidents.append(hit_to_incident(hit, occurred))
+
+    return incidents, last_fetch
+
+
 def results_to_incidents_timestamp(response, last_fetch):
     """Converts the current results into incidents.
 
@@ -458,13 +563,7 @@ def results_to_incidents_timestamp(response, last_fetch):
 
             # avoid duplication due to weak time query
             if hit_timestamp > current_fetch:
-                inc = {
-                    'name': 'Elasticsearch: Index: ' + str(hit.get('_index')) + ", ID: " + str(hit.get('_id')),
-                    'rawJSON': json.dumps(hit),
-                    'labels': incident_label_maker(hit.get('_source')),
-                    'occurred': hit_date.isoformat() + 'Z'
-                }
-                incidents.append(inc)
+                incidents.append(hit_to_incident(hit, hit_date.isoformat() + 'Z'))
 
     return incidents, last_fetch
 
@@ -496,16 +595,10 @@ def results_to_incidents_datetime(response, last_fetch):
 
             # avoid duplication due to weak time query
             if hit_timestamp > current_fetch:
-                inc = {
-                    'name': 'Elasticsearch: Index: ' + str(hit.get('_index')) + ", ID: " + str(hit.get('_id')),
-                    'rawJSON': json.dumps(hit),
-                    'labels': incident_label_maker(hit.get('_source')),
-                    # parse function returns iso format sometimes as YYYY-MM-DDThh:mm:ss+00:00
-                    # and sometimes as YYYY-MM-DDThh:mm:ss
-                    # we want to return format: YYYY-MM-DDThh:mm:ssZ in our incidents
-                    'occurred': format_to_iso(hit_date.isoformat())
-                }
-                incidents.append(inc)
+                # parse function returns iso format sometimes as YYYY-MM-DDThh:mm:ss+00:00
+                # and sometimes as YYYY-MM-DDThh:mm:ss
+                # we want to return format: YYYY-MM-DDThh:mm:ssZ in our incidents
+                incidents.append(hit_to_incident(hit, format_to_iso(hit_date.isoformat())))
 
     return incidents, format_to_iso(last_fetch.isoformat())
 
@@ -530,6 +623,9 @@ def format_to_iso(date_string):
 
 def fetch_incidents():
     last_run = demisto.getLastRun()
+    if FETCH_SEARCH_AFTER:
+        return fetch_incidents_search_after(last_run)
+
     last_fetch = last_run.get('time')
 
     # handle first time fetch
@@ -572,6 +668,59 @@ def fetch_incidents():
     demisto.incidents(incidents)
 
 
+def fetch_incidents_search_after(last_run):
+    """Fetches incidents with search_after keyset paging.
+
+    Notes:
+        the hits are sorted by the time field and a tiebreaker field, and the sort values of the last fetched hit are
+        kept in the last run, so a burst of more than fetch_size hits with the same time is fetched over the next
+        fetches instead of being skipped, and every page costs the same no matter how deep it is.
+        with the default _doc tiebreaker, hits of different shards with the same time and _doc may be skipped.
+
+    Args:
+        last_run(dict): the last run of the fetch.
+    """
+    es = elasticsearch_builder()
+
+    query = QueryString(query=FETCH_QUERY + " AND " + TIME_FIELD + ":*")
+    search = Search(using=es, index=FETCH_INDEX).query(query)
+    search = search.sort({TIME_FIELD: {'order': 'asc'}}, {TIEBREAKER_FIELD: {'order': 'asc'}})[0:FETCH_SIZE]
+
+    if last_run.get('search_after'):
+        search = search.extra(search_after=last_run['search_after'])
+
+    else:
+        # first fetch with search_after - start from the last fetch time, or the first fetch time
+        last_fetch = last_run.get('time')
+        if last_fetch is None:
+            last_fetch, _ = parse_date_range(date_range=FETCH_TIME, utc=False)
+            last_fetch_timestamp = int(last_fetch.timestamp() * 1000)
+            if 'Timestamp' in TIME_METHOD:
+                last_fetch_timestamp = get_timestamp_first_fetch(last_fetch)
+
+        elif 'Timestamp' in TIME_METHOD:
+            last_fetch_timestamp = int(last_fetch)
+
+        else:
+            last_fetch_timestamp = int(parse(str(last_fetch)).timestamp() * 1000)
+
+        search = search.filter({'range': {TIME_FIELD: {'gt': last_fetch_timestamp}}})
+
+    response = search.execute().to_dict()
+    hits = response.get('hits', {}).get('hits')
+
+    incidents = []  # type: List
+    if hits:
+        incidents, last_fetch = results_to_incidents_search_after(response)
+        new_last_run = {'search_after': hits[-1].get('sort')}
+        if last_fetch is not None:
+            new_last_run['time'] = last_fetch
+        demisto.setLastRun(new_last_run)
+        demisto.info('extract {} incidents'.format(len(incidents)))
+
+    demisto.incidents(incidents)
+
+
 def main():
     try:
         LOG('command is %s' % (demisto.command(),))
@@ -1,6 +1,11 @@
 from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import patch
+from urllib.parse import urlparse, parse_qs
 from dateutil.parser import parse
+import json
+import threading
+import pytest
 
 """MOCKED RESPONSES"""
 
@@ -414,3 +419,102 @@ def test_format_to_iso():
     assert format_to_iso(date_string_2) == iso_format
     assert format_to_iso(date_string_3) == iso_format
     assert format_to_iso(iso_format) == iso_format
+
+
+class FakeElasticsearchHandler(BaseHTTPRequestHandler):
+    """Answers _search (with sort, size and search_after) and scroll requests over FAKE_ES_DOCS."""
+    protocol_version = 'HTTP/1.1'
+    scrolls = {}  # type: dict
+    last_search = {}  # type: dict
+
+    def do_request(self):
+        path = urlparse(self.path).path
+        params = parse_qs(urlparse(self.path).query)
+        length = int(self.headers.get('Content-Length') or 0)
+        body = json.loads(self.rfile.read(length) or '{}')
+
+        if path == '/_search/scroll' and self.command == 'DELETE':
+            response = {'succeeded': True}
+        elif path == '/_search/scroll':
+            hits, size = self.scrolls[body['scroll_id']]
+            response = self.page(hits[:size], scroll_id=body['scroll_id'])
+            self.scrolls[body['scroll_id']] = hits[size:], size
+        else:
+            FakeElasticsearchHandler.last_search = body
+            hits = sorted(FAKE_ES_DOCS, key=lambda doc: (doc['_source']['Date'], doc['_id']))
+            for hit in hits:
+                hit['sort'] = [hit['_source']['Date'], hit['_id']]
+            if body.get('search_after'):
+                hits = [hit for hit in hits if hit['sort'] > body['search_after']]
+            size = int(params.get('size', [body.get('size', 10)])[0])
+            if 'scroll' in params:
+                self.scrolls['scroll-1'] = hits[size:], size
+                response = self.page(hits[:size], scroll_id='scroll-1')
+            else:
+                response = self.page(hits[:size])
+
+        response_body = json.dumps(response).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(response_body)))
+        self.end_headers()
+        self.wfile.write(response_body)
+
+    do_GET = do_POST = do_DELETE = do_request
+
+    @staticmethod
+    def page(hits, scroll_id=None):
+        response = {'took': 1, 'timed_out': False,
+                    'hits': {'total': {'value': len(FAKE_ES_DOCS), 'relation': 'eq'}, 'max_score': None, 'hits': hits}}
+        if scroll_id:
+            response['_scroll_id'] = scroll_id
+        return response
+
+    def log_message(self, *args):
+        pass
+
+
+# a burst of 5 events in the same second, more than the fetch size
+FAKE_ES_DOCS = [{'_index': 'events', '_type': '_doc', '_id': str(i), '_score': None,
+                 '_source': {'Date': '2019-08-29T14:45:00Z' if i < 5 else '2019-08-29T14:46:00Z'}} for i in range(7)]
+
+
+@pytest.fixture
+def fake_es():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeElasticsearchHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    with patch('Elasticsearch_v2.SERVER', 'http://127.0.0.1:{}'.format(server.server_port)):
+        yield
+    server.shutdown()
+
+
+@patch("Elasticsearch_v2.TIME_METHOD", 'Simple-Date')
+@patch("Elasticsearch_v2.TIME_FIELD", 'Date')
+@patch("Elasticsearch_v2.FETCH_INDEX", 'events')
+@patch("Elasticsearch_v2.FETCH_QUERY", '*')
+@patch("Elasticsearch_v2.FETCH_SIZE", 3)
+@patch("Elasticsearch_v2.FETCH_SEARCH_AFTER", True)
+def test_fetch_incidents_search_after(fake_es, mocker):
+    import demistomock as demisto
+    from Elasticsearch_v2 import fetch_incidents
+    last_run = {'time': '2019-08-29T14:44:00Z'}
+    mocker.patch.object(demisto, 'getLastRun', side_effect=lambda: last_run)
+    mocker.patch.object(demisto, 'setLastRun', side_effect=last_run.update)
+    mocker.patch.object(demisto, 'incidents')
+
+    fetched_ids = []
+    for _ in range(4):
+        fetch_incidents()
+        fetched_ids += [json.loads(incident['rawJSON'])['_id'] for incident in demisto.incidents.call_args[0][0]]
+
+    assert fetched_ids == ['0', '1', '2', '3', '4', '5', '6']
+    assert last_run == {'time': '2019-08-29T14:46:00Z', 'search_after': ['2019-08-29T14:46:00Z', '6']}
+    assert FakeElasticsearchHandler.last_search['sort'] == [{'Date': {'order': 'asc'}}, {'_doc': {'order': 'asc'}}]
+
+
+def test_scroll_search(fake_es):
+    from Elasticsearch_v2 import elasticsearch_builder, scroll_search
+    chunks = list(scroll_search(elasticsearch_builder(), 'events', {'query': {'match_all': {}}}, 3))
+    chunk_ids = [[hit['_id'] for hit in chunk['hits']['hits']] for chunk in chunks]
+    assert chunk_ids == [['0', '1', '2'], ['3', '4', '5'], ['6']]
+    assert FakeElasticsearchHandler.scrolls['scroll-1'][0] == []
@@ -5,6 +5,7 @@ from CommonServerPython import *
 import requests
 from pykafka import KafkaClient, SslConfig
 from pykafka.common import OffsetType
+from Queue import Empty
 import logging
 from cStringIO import StringIO
 import traceback
@@ -14,6 +15,10 @@ requests.packages.urllib3.disable_warnings()
 
 ''' GLOBALS/PARAMS '''
 
+DEFAULT_LINGER_MS = 100
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_CONSUMER_TIMEOUT_MS = 2000
+
 # Logging
 log_stream = None
 log_handler = None
@@ -319,6 +324,77 @@ def fetch_partitions(client):
         return_error('Topic {} was not found in Kafka'.format(topic))
 
 
+def encode_message(value):
+    """
+    Encodes a message value to the bytes pykafka produces - strings as utf-8 and other values as json
+    """
+    if isinstance(value, unicode):
+        return value.encode('utf-8')
+    if isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+
+def produce_messages(client):
+    """
+    Producing many messages to kafka topic through one batched asynchronous producer
+    """
+    topic = demisto.args().get('topic')
+    values = demisto.args().get('values')
+    partitioning_key = str(demisto.args().get('partitioning_key'))
+    linger_ms = int(demisto.args().get('linger_ms', DEFAULT_LINGER_MS))
+    batch_size = int(demisto.args().get('batch_size', DEFAULT_BATCH_SIZE))
+
+    if isinstance(values, (unicode, str)):
+        try:
+            values = json.loads(values)
+        except ValueError:
+            values = argToList(values)
+    if not isinstance(values, list):
+        values = [values]
+
+    if partitioning_key.isdigit():
+        partitioning_key = int(partitioning_key)  # type: ignore
+    else:
+        partitioning_key = None  # type: ignore
+
+    if topic in client.topics:
+        kafka_topic = client.topics[topic]
+        failed_messages = 0
+        with kafka_topic.get_producer(sync=False, linger_ms=linger_ms, min_queued_messages=batch_size,
+                                      delivery_reports=True) as producer:
+            for value in values:
+                producer.produce(
+                    message=encode_message(value),
+                    partition_key=partitioning_key
+                )
+        # the producer is flushed when stopped, so all the delivery reports are ready
+        while True:
+            try:
+                _, exception = producer.get_delivery_report(block=False)
+            except Empty:
+                break
+            if exception is not None:
+                failed_messages += 1
+        if failed_messages:
+            return_error('Failed to produce {} out of {} messages to topic \'{}\''.format(
+                failed_messages, len(values), topic))
+        demisto.results('{} messages were successfully produced to topic \'{}\''.format(len(values), topic))
+    else:
+        return_error('Topic {} was not found in Kafka'.format(topic))
+
+
+def get_last_messages_offsets(kafka_topic):
+    """
+    :param kafka_topic: topic to check the latest offsets of
+    :type kafka_topic: :class:`pykafka.topic.Topic`
+    :return: partition id to the offset of its last message (-1 for an empty partition), in one request per broker
+    :rtype: dict
+    """
+    return {partition_id: response.offset[0] - 1
+            for partition_id, response in kafka_topic.latest_available_offsets().items()}
+
+
 def fetch_incidents(client):
     """
     Fetches incidents
@@ -336,8 +412,17 @@ def fetch_incidents(client):
         max_messages = int(max_messages)
     except ValueError:
         max_messages = 50
+    consumer_timeout_ms = demisto.params().get('consumer_timeout_ms') or DEFAULT_CONSUMER_TIMEOUT_MS
+    try:
+        consumer_timeout_ms = int(consumer_timeout_ms)
+    except ValueError:
+        consumer_timeout_ms = DEFAULT_CONSUMER_TIMEOUT_MS
+    high_throughput = demisto.params().get('high_throughput', False)
 
-    last_fetched_partitions_offset = json.loads(demisto.getLastRun().get('last_fetched_partitions_offset', '{}'))
+    last_fetched_partitions_offset = demisto.getLastRun().get('last_fetched_partitions_offset', {})
+    if isinstance(last_fetched_partitions_offset, (unicode, str)):
+        # offsets were kept as a JSON string by previous versions
+        last_fetched_partitions_offset = json.loads(last_fetched_partitions_offset)
     incidents = []
 
     message_counter = 0
@@ -346,36 +431,57 @@ def fetch_incidents(client):
         kafka_topic = client.topics[topic]
 
         consumer_args = {
-            'consumer_timeout_ms': 2000,  # wait max 2 seconds for new messages
+            'consumer_timeout_ms': consumer_timeout_ms,  # wait for new messages up to the timeout
             'reset_offset_on_start': True
         }
+        if high_throughput:
+            consumer_args['queued_max_messages'] = max(max_messages, DEFAULT_BATCH_SIZE)
 
+        partitions = list(kafka_topic.partitions.values())
         if partition_to_fetch_from:
-            partitions = []
-            for partition in kafka_topic.partitions.values():
-                partition_id = str(partition.id)
-                if partition_id in partition_to_fetch_from:
-                    partitions.append(partition)
+            partitions = [partition for partition in partitions if str(partition.id) in partition_to_fetch_from]
             consumer_args['partitions'] = partitions  # type: ignore
 
-        consumer = kafka_topic.get_simple_consumer(**consumer_args)
-
-        offsets = [(p, last_fetched_partitions_offset.get(str(p.id), offset_to_fetch_from)) for p in consumer._partitions]
-        consumer.reset_offsets(offsets)
-
-        for message in consumer:
-            if message and message.value:
-                incidents.append(create_incident(message=message, topic=kafka_topic.name))
-                if message.offset > last_fetched_partitions_offset.get(str(message.partition_id), offset_to_fetch_from):
-                    last_fetched_partitions_offset[str(message.partition_id)] = message.offset
-                message_counter += 1
-            if message_counter == max_messages:
-                break
-        consumer.stop()
+        partitions_offsets = {p.id: last_fetched_partitions_offset.get(str(p.id), offset_to_fetch_from)
+                              for p in partitions}
+        pending_partitions = {}
+        if high_throughput:
+            # stop as soon as every partition is consumed up to its latest offset, instead of waiting for the timeout
+            last_messages_offsets = get_last_messages_offsets(kafka_topic)
+            for partition_id, offset in partitions_offsets.items():
+                last_message_offset = last_messages_offsets.get(partition_id, -1)
+                if offset == OffsetType.LATEST:
+                    # nothing to catch up on, track the partition from its current end on the next fetch
+                    last_fetched_partitions_offset[str(partition_id)] = \
+                        last_message_offset if last_message_offset >= 0 else OffsetType.EARLIEST
+                elif last_message_offset >= 0 and last_message_offset > offset:
+                    pending_partitions[partition_id] = last_message_offset
+
+        if not high_throughput or pending_partitions:
+            consumer = kafka_topic.get_simple_consumer(**consumer_args)
+
+            offsets = [(p, partitions_offsets.get(p.id, offset_to_fetch_from)) for p in consumer._partitions]
+            consumer.reset_offsets(offsets)
+
+            for message in consumer:
+                if message and message.value:
+                    incidents.append(create_incident(message=message, topic=kafka_topic.name))
+                    if message.offset > last_fetched_partitions_offset.get(str(message.partition_id),
+                                                                           offset_to_fetch_from):
+                        last_fetched_partitions_offset[str(message.partition_id)] = message.offset
+                    message_counter += 1
+                if message_counter == max_messages:
+                    break
+                if high_throughput and message and \
+                        message.offset >= pending_partitions.get(message.partition_id, float('inf')):
+                    del pending_partitions[message.partition_id]
+                    if not pending_partitions:
+                        break
+            consumer.stop()
     else:
         return_error('No such topic \'{}\' to fetch incidents from.'.format(topic))
 
-    demisto.setLastRun({'last_fetched_partitions_offset': json.dumps(last_fetched_partitions_offset)})
+    demisto.setLastRun({'last_fetched_partitions_offset': last_fetched_partitions_offset})
     demisto.incidents(incidents)
 
 
@@ -412,6 +518,8 @@ def main():
             print_topics(client)
         elif demisto.command() == 'kafka-publish-msg':
             produce_message(client)
+        elif demisto.command() == 'kafka-publish-msgs':
+            produce_messages(client)
         elif demisto.command() == 'kafka-consume-msg':
             consume_message(client)
         elif demisto.command() == 'kafka-fetch-partitions':
@@ -1,6 +1,106 @@
-from Kafka_V2 import create_certificate
+from collections import namedtuple
+from Queue import Empty
+
+import demistomock as demisto
+from Kafka_V2 import create_certificate, produce_messages, fetch_incidents
+from pykafka.common import OffsetType
 import os
 
+OffsetPartitionResponse = namedtuple('OffsetPartitionResponse', ['offset', 'err'])
+
+
+class FakeMessage(object):
+    def __init__(self, partition_id, offset, value):
+        self.partition_id = partition_id
+        self.offset = offset
+        self.value = value
+        self.timestamp_dt = None
+
+
+class FakePartition(object):
+    def __init__(self, partition_id, values=()):
+        self.id = partition_id
+        self.messages = [FakeMessage(partition_id, offset, value) for offset, value in enumerate(values)]
+
+
+class FakeProducer(object):
+    def __init__(self, topic):
+        self.topic = topic
+        self.delivery_reports = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def produce(self, message, partition_key=None):
+        if not isinstance(message, bytes):
+            raise TypeError("Producer.produce accepts a bytes object as message, but it got '%s'" % type(message))
+        partition = self.topic.partitions[partition_key or 0]
+        partition.messages.append(FakeMessage(partition.id, len(partition.messages), message))
+        self.delivery_reports.append((message, None))
+
+    def get_delivery_report(self, block=True):
+        if not self.delivery_reports:
+            raise Empty()
+        return self.delivery_reports.pop(0)
+
+
+class FakeConsumer(object):
+    def __init__(self, topic, partitions=None):
+        self._partitions = {partition: None for partition in partitions or topic.partitions.values()}
+        self.next_offsets = {}
+        self.timed_out = False
+
+    def reset_offsets(self, partition_offsets):
+        for partition, offset in partition_offsets:
+            if offset == OffsetType.EARLIEST:
+                self.next_offsets[partition.id] = 0
+            elif offset == OffsetType.LATEST:
+                self.next_offsets[partition.id] = len(partition.messages)
+            else:
+                self.next_offsets[partition.id] = offset + 1
+
+    def __iter__(self):
+        for partition in self._partitions:
+            for message in partition.messages[self.next_offsets[partition.id]:]:
+                yield message
+        # a real consumer would have waited for consumer_timeout_ms here
+        self.timed_out = True
+
+    def stop(self):
+        pass
+
+
+class FakeTopic(object):
+    """
+    In-process broker for a single topic
+    """
+    def __init__(self, name, partitions):
+        self.name = name
+        self.partitions = {partition.id: partition for partition in partitions}
+        self.producer_args = None
+        self.consumers = []
+
+    def get_producer(self, **kwargs):
+        self.producer_args = kwargs
+        return FakeProducer(self)
+
+    def get_simple_consumer(self, partitions=None, **kwargs):
+        consumer = FakeConsumer(self, partitions)
+        self.consumers.append(consumer)
+        return consumer
+
+    def latest_available_offsets(self):
+        return {partition.id: OffsetPartitionResponse([len(partition.messages)], 0)
+                for partition in self.partitions.values()}
+
+
+class FakeClient(object):
+    def __init__(self, *topics):
+        self.topics = {topic.name: topic for topic in topics}
+
 
 def test_create_certificate():
     ca_cert = 'dummy_cert'
@@ -18,3 +118,59 @@ def test_create_certificate():
     with open(res.keyfile, 'rb') as f:
         assert f.read() == key
     os.remove(res.keyfile)
+
+
+def test_produce_messages(mocker):
+    topic = FakeTopic('test-topic', [FakePartition(0), FakePartition(1)])
+    mocker.patch.object(demisto, 'args', return_value={'topic': 'test-topic', 'values': u'["a", "\u05d0", {"c": 1}]',
+                                                       'partitioning_key': '1', 'batch_size': '500'})
+    mocker.patch.object(demisto, 'results')
+    produce_messages(FakeClient(topic))
+    assert [message.value for message in topic.partitions[1].messages] == ['a', '\xd7\x90', '{"c": 1}']
+    assert topic.producer_args == {'sync': False, 'linger_ms': 100, 'min_queued_messages': 500,
+                                   'delivery_reports': True}
+    assert demisto.results.call_args[0][0] == "3 messages were successfully produced to topic 'test-topic'"
+
+
+def test_produce_messages_list(mocker):
+    topic = FakeTopic('test-topic', [FakePartition(0)])
+    mocker.patch.object(demisto, 'args', return_value={'topic': 'test-topic', 'values': u'a,b'})
+    mocker.patch.object(demisto, 'results')
+    produce_messages(FakeClient(topic))
+    assert [message.value for message in topic.partitions[0].messages] == ['a', 'b']
+
+
+def test_fetch_incidents_high_throughput(mocker):
+    topic = FakeTopic('test-topic', [FakePartition(0, ['a', 'b', 'c']), FakePartition(1, ['d', 'e'])])
+    mocker.patch.object(demisto, 'params', return_value={'topic': 'test-topic', 'offset': '-2',
+                                                         'max_messages': '1000', 'high_throughput': True})
+    mocker.patch.object(demisto, 'getLastRun', return_value={})
+    mocker.patch.object(demisto, 'setLastRun')
+    mocker.patch.object(demisto, 'incidents')
+    fetch_incidents(FakeClient(topic))
+    assert len(demisto.incidents.call_args[0][0]) == 5
+    assert not topic.consumers[0].timed_out
+    last_run = demisto.setLastRun.call_args[0][0]
+    assert last_run == {'last_fetched_partitions_offset': {'0': 2, '1': 1}}
+
+    # nothing new was produced, so no consumer is started
+    mocker.patch.object(demisto, 'getLastRun', return_value=last_run)
+    fetch_incidents(FakeClient(topic))
+    assert demisto.incidents.call_args[0][0] == []
+    assert len(topic.consumers) == 1
+
+    topic.partitions[1].messages.append(FakeMessage(1, 2, 'f'))
+    fetch_incidents(FakeClient(topic))
+    assert [incident['details'] for incident in demisto.incidents.call_args[0][0]] == ['f']
+    assert not topic.consumers[1].timed_out
+
+
+def test_fetch_incidents_legacy_last_run(mocker):
+    topic = FakeTopic('test-topic', [FakePartition(0, ['a', 'b', 'c'])])
+    mocker.patch.object(demisto, 'params', return_value={'topic': 'test-topic', 'offset': '-2'})
+    mocker.patch.object(demisto, 'getLastRun', return_value={'last_fetched_partitions_offset': '{"0": 0}'})
+    mocker.patch.object(demisto, 'setLastRun')
+    mocker.patch.object(demisto, 'incidents')
+    fetch_incidents(FakeClient(topic))
+    assert [incident['details'] for incident in demisto.incidents.call_args[0][0]] == ['b', 'c']
+    assert demisto.setLastRun.call_args[0][0] == {'last_fetched_partitions_offset': {'0': 2}}
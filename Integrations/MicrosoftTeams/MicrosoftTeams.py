@@ -41,6 +41,11 @@ MESSAGE_TYPES: dict = {
     'status_changed': 'incidentStatusChanged'
 }
 
+# Team members indexed by ID and by name / principal name, keyed by the cached teams they were built from
+TEAM_MEMBERS_INDEX: dict = {'teams': None, 'id': {}, 'name': {}}
+# The cached teams last checked by the channel mirror loop with no channel left to mirror
+MIRRORED_TEAMS: dict = {'teams': None}
+
 ''' HELPER FUNCTIONS '''
 
 
@@ -202,15 +207,12 @@ def get_team_member(integration_context: dict, team_member_id: str) -> dict:
     :return: Found team member object
     """
     team_member: dict = dict()
-    teams: list = json.loads(integration_context.get('teams', '[]'))
+    member: Optional[dict] = get_team_members_index(integration_context, 'id').get(team_member_id)
 
-    for team in teams:
-        team_members: list = team.get('team_members', [])
-        for member in team_members:
-            if member.get('id') == team_member_id:
-                team_member['username'] = member.get('name', '')
-                team_member['user_email'] = member.get('userPrincipalName', '')
-                return team_member
+    if member:
+        team_member['username'] = member.get('name', '')
+        team_member['user_email'] = member.get('userPrincipalName', '')
+        return team_member
 
     raise ValueError('Team member was not found')
 
@@ -222,17 +224,35 @@ def get_team_member_id(requested_team_member: str, integration_context: dict) ->
     :param integration_context: Cached object to search for team member in
     :return: Team member ID
     """
-    teams: list = json.loads(integration_context.get('teams', '[]'))
+    team_member: Optional[dict] = get_team_members_index(integration_context, 'name').get(requested_team_member)
 
-    for team in teams:
-        team_members: list = team.get('team_members', [])
-        for team_member in team_members:
-            if requested_team_member in {team_member.get('name', ''), team_member.get('userPrincipalName', '')}:
-                return team_member.get('id')
+    if team_member:
+        return team_member.get('id')
 
     raise ValueError(f'Team member {requested_team_member} was not found')
 
 
+def get_team_members_index(integration_context: dict, field: str) -> dict:
+    """
+    Gets the team members of all cached teams indexed by a lookup field, rebuilt only when the cached teams change
+    :param integration_context: Cached object to index the team members of
+    :param field: Lookup field to get the index for - id or name (which includes the principal name)
+    :return: Dict of lookup value to the first team member that has it
+    """
+    teams_value: str = integration_context.get('teams', '[]')
+    if TEAM_MEMBERS_INDEX['teams'] != teams_value:
+        members_by_id: dict = dict()
+        members_by_name: dict = dict()
+        for team in json.loads(teams_value):
+            for team_member in team.get('team_members', []):
+                members_by_id.setdefault(team_member.get('id'), team_member)
+                for name in (team_member.get('name', ''), team_member.get('userPrincipalName', '')):
+                    members_by_name.setdefault(name, team_member)
+        TEAM_MEMBERS_INDEX.update({'teams': teams_value, 'id': members_by_id, 'name': members_by_name})
+
+    return TEAM_MEMBERS_INDEX[field]
+
+
 def create_adaptive_card(body: list, actions: list = None) -> dict:
     """
     Creates Microsoft Teams adaptive card object given body and actions
@@ -1212,7 +1232,11 @@ def channel_mirror_loop():
         found_channel_to_mirror: bool = False
         try:
             integration_context = demisto.getIntegrationContext()
-            teams: list = json.loads(integration_context.get('teams', '[]'))
+            teams_value: str = integration_context.get('teams', '[]')
+            if teams_value == MIRRORED_TEAMS['teams']:
+                # Nothing changed since the last check, there is no channel to mirror
+                continue
+            teams: list = json.loads(teams_value)
             for team in teams:
                 mirrored_channels = team.get('mirrored_channels', [])
                 channel: dict
@@ -1238,6 +1262,8 @@ def channel_mirror_loop():
                         break
                 if found_channel_to_mirror:
                     break
+            if not found_channel_to_mirror:
+                MIRRORED_TEAMS['teams'] = teams_value
         except Exception as e:
             demisto.error(f'An error occurred in channel mirror loop: {str(e)}')
             demisto.updateModuleHealth(f'An error occurred: {str(e)}')
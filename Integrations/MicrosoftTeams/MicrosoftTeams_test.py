@@ -870,6 +870,25 @@ def test_get_team_member_id():
     assert str(e.value) == 'Team member TheRock was not found'
 
 
+def test_get_team_member_index_updated(mocker):
+    import MicrosoftTeams
+    mocker.patch.object(MicrosoftTeams.json, 'loads', wraps=json.loads)
+    context: dict = dict(integration_context)
+    assert MicrosoftTeams.get_team_member_id('Denzel Washington', context)
+    MicrosoftTeams.get_team_member_id('bwillis@email.com', context)
+    # teams were not changed, so they are indexed only once
+    assert MicrosoftTeams.json.loads.call_count <= 1
+
+    teams: list = json.loads(context['teams'])
+    teams[0]['team_members'].append({'id': 'new-member-id', 'name': 'Tom Hanks', 'userPrincipalName': 'th@email.com'})
+    context['teams'] = json.dumps(teams)
+    assert MicrosoftTeams.get_team_member_id('th@email.com', context) == 'new-member-id'
+    assert MicrosoftTeams.get_team_member(context, 'new-member-id') == {
+        'username': 'Tom Hanks',
+        'user_email': 'th@email.com'
+    }
+
+
 def test_create_adaptive_card():
     from MicrosoftTeams import create_adaptive_card
     body: list = [{
@@ -5,8 +5,9 @@ from CommonServerUserPython import *
 ''' IMPORTS '''
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import time
 import uuid
-import json
 import requests
 
 # disable insecure warnings
@@ -20,6 +21,16 @@ URL = demisto.params()['server'].rstrip('/:') + ':' + demisto.params().get('port
 API_KEY = str(demisto.params().get('key'))
 USE_SSL = not demisto.params().get('insecure')
 
+# one pooled session for the whole execution, so consecutive API calls reuse the keep-alive connection
+SESSION = requests.Session()
+SESSION.mount('https://', requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=10))
+SESSION.mount('http://', requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=10))
+
+# logs query jobs are retrieved concurrently over the session pool
+LOG_JOBS_MAX_WORKERS = 5
+LOG_JOBS_POLLING_INTERVAL = 2
+LOG_JOBS_MAX_POLLING_INTERVAL = 30
+
 # determine a vsys or a device-group
 VSYS = demisto.params().get('vsys')
 if demisto.args() and demisto.args().get('device-group', None):
@@ -109,12 +120,19 @@ class PAN_OS_Not_Found(Exception):
         pass
 
 
+def parse_xml_response(xml_text: str) -> Dict:
+    """
+    Parses a PAN-OS XML response to a dict, same as json.loads(xml2json(xml_text))
+    """
+    return xml2dict(xml_text)
+
+
 def http_request(uri: str, method: str, headers: Dict = {},
                  body: Dict = {}, params: Dict = {}, files=None) -> Any:
     """
     Makes an API call with the given arguments
     """
-    result = requests.request(
+    result = SESSION.request(
         method,
         uri,
         headers=headers,
@@ -131,7 +149,7 @@ def http_request(uri: str, method: str, headers: Dict = {},
     if params.get('type') == 'export':
         return result
 
-    json_result = json.loads(xml2json(result.text))
+    json_result = parse_xml_response(result.text)
 
     # handle non success
     if json_result['response']['@status'] != 'success':
@@ -2995,7 +3013,7 @@ def panorama_list_pcaps_command():
         raise Exception('can not provide dlp-pcap without password')
 
     result = http_request(URL, 'GET', params=params)
-    json_result = json.loads(xml2json(result.text))['response']
+    json_result = parse_xml_response(result.text)['response']
     if json_result['@status'] != 'success':
         raise Exception('Request to get list of Pcaps Failed.\nStatus code: ' + str(
             json_result['response']['@code']) + '\nWith message: ' + str(json_result['response']['msg']['line']))
@@ -4000,13 +4018,46 @@ def panorama_query_logs_command():
     })
 
 
+def is_log_job_done(result: Dict) -> bool:
+    response = result.get('response', {})
+    return response.get('@status') == 'error' or demisto.get(response, 'result.job.status') == 'FIN'
+
+
+def panorama_get_logs_jobs(job_ids: List[str], wait_for_completion: bool = False, timeout: int = 120) -> List[Dict]:
+    """
+    Retrieves the logs query jobs with a bounded worker pool, keeping the order of job_ids.
+    If wait_for_completion is set, the pending jobs are polled together with backoff
+    until all of them are done or the timeout is reached.
+    """
+    if not job_ids:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(len(job_ids), LOG_JOBS_MAX_WORKERS)) as executor:
+        results = list(executor.map(panorama_get_traffic_logs, job_ids))
+        if wait_for_completion:
+            deadline = time.time() + timeout
+            interval = LOG_JOBS_POLLING_INTERVAL
+            pending = [index for index, result in enumerate(results) if not is_log_job_done(result)]
+            while pending and time.time() + interval <= deadline:
+                time.sleep(interval)
+                interval = min(interval * 2, LOG_JOBS_MAX_POLLING_INTERVAL)
+                pending_results = executor.map(panorama_get_traffic_logs, [job_ids[index] for index in pending])
+                for index, result in zip(pending, pending_results):
+                    results[index] = result
+                pending = [index for index in pending if not is_log_job_done(results[index])]
+
+    return results
+
+
 def panorama_check_logs_status_command():
     """
     Check query logs status
     """
     job_ids = argToList(demisto.args().get('job_id'))
-    for job_id in job_ids:
-        result = panorama_get_traffic_logs(job_id)
+    wait_for_completion = argToBoolean(demisto.args().get('wait_for_completion', 'false'))
+    timeout = int(demisto.args().get('timeout', 120))
+    results = panorama_get_logs_jobs(job_ids, wait_for_completion, timeout)
+    for job_id, result in zip(job_ids, results):
 
         if result['response']['@status'] == 'error':
             if 'msg' in result['response'] and 'line' in result['response']['msg']:
@@ -4131,8 +4182,10 @@ def prettify_logs(logs):
 def panorama_get_logs_command():
     ignore_auto_extract = demisto.args().get('ignore_auto_extract') == 'true'
     job_ids = argToList(demisto.args().get('job_id'))
-    for job_id in job_ids:
-        result = panorama_get_traffic_logs(job_id)
+    wait_for_completion = argToBoolean(demisto.args().get('wait_for_completion', 'false'))
+    timeout = int(demisto.args().get('timeout', 120))
+    results = panorama_get_logs_jobs(job_ids, wait_for_completion, timeout)
+    for job_id, result in zip(job_ids, results):
         log_type_dt = demisto.dt(demisto.context(), f'Panorama.Monitor(val.JobID === "{job_id}").LogType')
         if isinstance(log_type_dt, list):
             log_type = log_type_dt[0]
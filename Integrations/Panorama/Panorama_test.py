@@ -197,3 +197,50 @@ def test_validate_search_time():
     with pytest.raises(Exception):
         assert validate_search_time('219/12/26 00:00:00')
         assert validate_search_time('219/10/35')
+
+
+@pytest.mark.parametrize('file_name', ['show_addresses_response.xml', 'get_security_rules_response.xml',
+                                       'commit_status_response.xml', 'error_response.xml'])
+def test_parse_xml_response(file_name):
+    from Panorama import parse_xml_response
+    from CommonServerPython import xml2json
+    import json
+    with open(f'test_data/{file_name}') as xml_file:
+        xml_text = xml_file.read()
+    assert parse_xml_response(xml_text) == json.loads(xml2json(xml_text))
+
+
+def test_http_request_uses_pooled_session(mocker):
+    import Panorama
+    with open('test_data/commit_status_response.xml') as xml_file:
+        response = mocker.Mock(status_code=200, text=xml_file.read())
+    session_request = mocker.patch.object(Panorama.SESSION, 'request', return_value=response)
+    Panorama.http_request(Panorama.URL, 'POST', params={'type': 'op'})
+    Panorama.http_request(Panorama.URL, 'POST', params={'type': 'op'})
+    assert session_request.call_count == 2
+
+
+def test_panorama_get_logs_jobs_keeps_order(mocker):
+    import Panorama
+    mocker.patch.object(Panorama, 'panorama_get_traffic_logs',
+                        side_effect=lambda job_id: {'response': {'@status': 'success',
+                                                                 'result': {'job': {'id': job_id, 'status': 'FIN'}}}})
+    results = Panorama.panorama_get_logs_jobs(['3', '1', '2', '5', '4', '7', '6'])
+    assert [result['response']['result']['job']['id'] for result in results] == ['3', '1', '2', '5', '4', '7', '6']
+
+
+def test_panorama_get_logs_jobs_wait_for_completion(mocker):
+    import Panorama
+    polls = {'1': 0, '2': 0}
+
+    def get_traffic_logs(job_id):
+        polls[job_id] += 1
+        status = 'FIN' if polls[job_id] >= int(job_id) + 1 else 'ACT'
+        return {'response': {'@status': 'success', 'result': {'job': {'id': job_id, 'status': status}}}}
+
+    mocker.patch.object(Panorama, 'panorama_get_traffic_logs', side_effect=get_traffic_logs)
+    sleep = mocker.patch.object(Panorama.time, 'sleep')
+    results = Panorama.panorama_get_logs_jobs(['1', '2'], wait_for_completion=True, timeout=60)
+    assert all(Panorama.is_log_job_done(result) for result in results)
+    assert polls == {'1': 2, '2': 3}
+    assert [call[0][0] for call in sleep.call_args_list] == [2, 4]
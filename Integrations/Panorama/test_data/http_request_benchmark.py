@@ -0,0 +1,79 @@
+"""
+Benchmark of Panorama.http_request - compares a connection per call with xml2json decoding against the pooled
+session with direct XML decoding, over the recorded responses in this directory.
+
+Run from the integration directory (next to CommonServerPython.py and demistomock.py):
+    python test_data/http_request_benchmark.py
+"""
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import demistomock as demisto
+
+demisto.params = lambda: {'server': 'http://127.0.0.1', 'port': '0', 'vsys': 'vsys1', 'key': 'key'}  # noqa: E731
+
+import requests  # noqa: E402
+from CommonServerPython import xml2json  # noqa: E402
+import Panorama  # noqa: E402
+
+TEST_DATA = os.path.dirname(os.path.abspath(__file__))
+RESPONSES = ['show_addresses_response.xml', 'get_security_rules_response.xml', 'commit_status_response.xml']
+CALLS = 200
+
+
+class RecordedResponseHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    body = b''
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/xml')
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+def connection_per_call(url):
+    result = requests.request('GET', url, params={'type': 'config'})
+    return json.loads(xml2json(result.text))
+
+
+def pooled_session(url):
+    result = Panorama.SESSION.request('GET', url, params={'type': 'config'})
+    return Panorama.parse_xml_response(result.text)
+
+
+def measure(func, url):
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    for _ in range(CALLS):
+        func(url)
+    return (time.perf_counter() - wall_start) / CALLS * 1000, (time.process_time() - cpu_start) / CALLS * 1000
+
+
+def main():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), RecordedResponseHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_port}/api/'
+
+    for file_name in RESPONSES:
+        with open(os.path.join(TEST_DATA, file_name), 'rb') as xml_file:
+            RecordedResponseHandler.body = xml_file.read()
+        assert connection_per_call(url) == pooled_session(url)
+        before = measure(connection_per_call, url)
+        after = measure(pooled_session, url)
+        print(f'{file_name} ({len(RecordedResponseHandler.body)} bytes, {CALLS} calls)')
+        print(f'    before: {before[0]:.2f} ms/call wall, {before[1]:.2f} ms/call CPU')
+        print(f'    after:  {after[0]:.2f} ms/call wall, {after[1]:.2f} ms/call CPU')
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -52,6 +52,16 @@ if VERSION:
 
 SERVER_URL = get_server_url() + API
 
+# one pooled session for all the requests of the execution
+SESSION = requests.Session()
+SESSION.auth = (USERNAME, PASSWORD)
+SESSION.verify = VERIFY_SSL
+
+# records queried in a single request, larger queries are paged by sys_updated_on and sys_id
+QUERY_PAGE_SIZE = 1000
+# sys_ids in a single sys_idIN query
+GET_RECORDS_CHUNK_SIZE = 100
+
 TICKET_STATES = {
     'incident': {
         '1': '1 - New',
@@ -174,14 +184,12 @@ def send_request(path, method='get', body=None, params=None, headers=None, file=
             shutil.copy(demisto.getFilePath(file_entry)['path'], file_name)
             with open(file_name, 'rb') as f:
                 files = {'file': f}
-                res = requests.request(method, url, headers=headers, params=params, data=body, files=files,
-                                       auth=(USERNAME, PASSWORD), verify=VERIFY_SSL)
+                res = SESSION.request(method, url, headers=headers, params=params, data=body, files=files)
             shutil.rmtree(demisto.getFilePath(file_entry)['name'], ignore_errors=True)
         except Exception as e:
             raise Exception('Failed to upload file - ' + str(e))
     else:
-        res = requests.request(method, url, headers=headers, data=json.dumps(body) if body else {}, params=params,
-                               auth=(USERNAME, PASSWORD), verify=VERIFY_SSL)
+        res = SESSION.request(method, url, headers=headers, data=json.dumps(body) if body else {}, params=params)
 
     try:
         obj = res.json()
@@ -550,7 +558,7 @@ def get_ticket_attachment_entries(ticket_id):
         links = [(attachment['download_link'], attachment['file_name']) for attachment in attachments]
 
     for link in links:
-        file_res = requests.get(link[0], auth=(USERNAME, PASSWORD), verify=VERIFY_SSL)
+        file_res = SESSION.get(link[0])
         if file_res is not None:
             entries.append(fileResult(link[1], file_res.content))
 
@@ -921,8 +929,13 @@ def query_table_command():
     sysparm_query = args.get('query')
     sysparm_offset = args.get('offset', DEFAULTS['offset'])
     fields = args.get('fields')
+    if fields:
+        fields = argToList(fields)
+        if 'sys_id' not in fields:
+            # ID is added by default
+            fields.append('sys_id')
 
-    res = query(table_name, sysparm_limit, sysparm_offset, sysparm_query)
+    res = query(table_name, sysparm_limit, sysparm_offset, sysparm_query, fields)
 
     if not res or 'result' not in res or len(res['result']) == 0:
         return 'No results found'
@@ -932,50 +945,141 @@ def query_table_command():
         'Contents': res,
         'ContentsFormat': formats['json']
     }
-
-    result = res['result']
-
-    if fields:
-        fields = argToList(fields)
-        if 'sys_id' not in fields:
-            # ID is added by default
-            fields.append('sys_id')
-        # Filter the records according to the given fields
-        records = [dict(filter(lambda kv_pair: kv_pair[0] in fields, r.iteritems())) for r in res['result']]
-        for r in records:
-            r['ID'] = r.pop('sys_id')
-            for k, v in r.iteritems():
-                if isinstance(v, dict):
-                    # For objects that refer to a record in the database, take their value (system ID).
-                    r[k] = v.get('value', v)
-        entry['ReadableContentsFormat'] = formats['markdown']
-        entry['HumanReadable'] = tableToMarkdown('ServiceNow records', records, removeNull=True)
-        entry['EntryContext'] = {
-            'ServiceNow.Record(val.ID===obj.ID)': createContext(records)
-        }
-    else:
-        mapped_records = [{DEFAULT_RECORD_FIELDS[k]: r[k] for k in DEFAULT_RECORD_FIELDS if k in r} for r in result]
-        entry['ReadableContentsFormat'] = formats['markdown']
-        entry['HumanReadable'] = tableToMarkdown('ServiceNow records', mapped_records, removeNull=True)
-        entry['EntryContext'] = {
-            'ServiceNow.Record(val.ID===obj.ID)': createContext(mapped_records)
-        }
+    entry.update(get_records_entry_outputs(res['result'], fields))
 
     return entry
 
 
-def query(table_name, sysparm_limit, sysparm_offset, sysparm_query):
+def query(table_name, sysparm_limit, sysparm_offset, sysparm_query, sysparm_fields=None):
     query_params = {}
     query_params['sysparm_limit'] = sysparm_limit
     query_params['sysparm_offset'] = sysparm_offset
     if sysparm_query:
         query_params['sysparm_query'] = sysparm_query
+    if sysparm_fields:
+        query_params['sysparm_fields'] = ','.join(sysparm_fields)
 
     path = 'table/' + table_name
 
+    if int(sysparm_limit) > QUERY_PAGE_SIZE and not int(sysparm_offset) and is_keyset_query(sysparm_query):
+        return {'result': list(query_by_keyset(path, int(sysparm_limit), sysparm_query, sysparm_fields))}
+
     return send_request(path, 'get', params=query_params)
 
 
+def is_keyset_query(sysparm_query):
+    # keyset paging orders the records by their timestamp, so it is not used for queries with their own order
+    return not sysparm_query or 'ORDERBY' not in sysparm_query
+
+
+def build_keyset_query(sysparm_query, timestamp_field, last_time, last_sys_id):
+    """
+    Builds a query for the records after the (last_time, last_sys_id) record, ordered by timestamp_field and sys_id.
+    The ordering of sysparm_query is dropped, and the keyset condition is added to each of its ^NQ queries.
+    """
+    order_by = 'ORDERBY{0}^ORDERBYsys_id'.format(timestamp_field)
+    terms = [term for term in (sysparm_query or '').split('^') if term and not term.startswith('ORDERBY')]
+    queries = '^'.join(terms).split('^NQ')
+    if last_time is None:
+        conditions = ['']
+    elif last_sys_id is None:
+        conditions = ['{0}>{1}'.format(timestamp_field, last_time)]
+    else:
+        conditions = ['{0}>{1}'.format(timestamp_field, last_time),
+                      '{0}={1}^sys_id>{2}'.format(timestamp_field, last_time, last_sys_id)]
+    keyset_queries = ['^'.join(part for part in (query, condition) if part)
+                      for query in queries for condition in conditions]
+    return '^'.join(part for part in ('^NQ'.join(keyset_queries), order_by) if part)
+
+
+def query_by_keyset(path, limit, sysparm_query, sysparm_fields=None, timestamp_field='sys_updated_on'):
+    """
+    Yields up to limit records, querying them in pages of QUERY_PAGE_SIZE records. Every page starts right after
+    the last record of the previous page, so the paging is not slowed by offsets and does not skip or repeat records
+    which change while paging.
+    """
+    if sysparm_fields:
+        sysparm_fields = list(sysparm_fields) + [f for f in (timestamp_field, 'sys_id') if f not in sysparm_fields]
+    last_time = last_sys_id = None
+    count = 0
+    while count < limit:
+        query_params = {
+            'sysparm_limit': min(QUERY_PAGE_SIZE, limit - count),
+            'sysparm_query': build_keyset_query(sysparm_query, timestamp_field, last_time, last_sys_id)
+        }
+        if sysparm_fields:
+            query_params['sysparm_fields'] = ','.join(sysparm_fields)
+        records = send_request(path, 'get', params=query_params).get('result', [])
+        for record in records:
+            yield record
+        count += len(records)
+        if len(records) < query_params['sysparm_limit']:
+            break
+        last_time, last_sys_id = records[-1][timestamp_field], records[-1]['sys_id']
+
+
+def get_records(table_name, record_ids, sysparm_fields=None):
+    """
+    Gets the records of the given system IDs, in chunks of GET_RECORDS_CHUNK_SIZE IDs per request.
+    """
+    path = 'table/' + table_name
+    records = []
+    for i in range(0, len(record_ids), GET_RECORDS_CHUNK_SIZE):
+        chunk = record_ids[i:i + GET_RECORDS_CHUNK_SIZE]
+        query_params = {
+            'sysparm_query': 'sys_idIN' + ','.join(chunk),
+            'sysparm_limit': len(chunk)
+        }
+        if sysparm_fields:
+            query_params['sysparm_fields'] = ','.join(sysparm_fields)
+        records.extend(send_request(path, 'get', params=query_params).get('result', []))
+    return records
+
+
+def get_records_command():
+    args = unicode_to_str_recur(demisto.args())
+    table_name = args['table_name']
+    record_ids = argToList(args['ids'])
+    fields = argToList(args.get('fields'))
+    if fields and 'sys_id' not in fields:
+        # ID is added by default
+        fields.append('sys_id')
+
+    records = get_records(table_name, record_ids, fields or None)
+    if not records:
+        return 'Cannot find records'
+
+    res = {'result': records}
+    entry = {
+        'Type': entryTypes['note'],
+        'Contents': res,
+        'ContentsFormat': formats['json']
+    }
+    entry.update(get_records_entry_outputs(records, fields))
+    return entry
+
+
+def get_records_entry_outputs(records, fields):
+    if fields:
+        # Filter the records according to the given fields
+        records = [dict(filter(lambda kv_pair: kv_pair[0] in fields, r.iteritems())) for r in records]
+        for r in records:
+            r['ID'] = r.pop('sys_id')
+            for k, v in r.iteritems():
+                if isinstance(v, dict):
+                    # For objects that refer to a record in the database, take their value (system ID).
+                    r[k] = v.get('value', v)
+    else:
+        records = [{DEFAULT_RECORD_FIELDS[k]: r[k] for k in DEFAULT_RECORD_FIELDS if k in r} for r in records]
+    return {
+        'ReadableContentsFormat': formats['markdown'],
+        'HumanReadable': tableToMarkdown('ServiceNow records', records, removeNull=True),
+        'EntryContext': {
+            'ServiceNow.Record(val.ID===obj.ID)': createContext(records)
+        }
+    }
+
+
 def upload_file_command():
     args = unicode_to_str_recur(demisto.args())
     ticket_type = get_table_name(args.get('ticket_type'))
@@ -1390,14 +1494,10 @@ def fetch_incidents():
         snow_time, _ = parse_date_range(fetch_time, '%Y-%m-%d %H:%M:%S')
     else:
         snow_time = last_run['time']
+    # continue right after the last fetched ticket, tickets with the same timestamp are ordered by their ID
+    snow_sys_id = last_run.get('sys_id')
 
-    query = ''
-    if SYSPARM_QUERY:
-        query += SYSPARM_QUERY + '^'
-    query += 'ORDERBY{0}^{0}>{1}'.format(TIMESTAMP_FIELD, snow_time)
-
-    if query:
-        query_params['sysparm_query'] = query
+    query_params['sysparm_query'] = build_keyset_query(SYSPARM_QUERY, TIMESTAMP_FIELD, snow_time, snow_sys_id)
 
     query_params['sysparm_limit'] = SYSPARM_LIMIT
 
@@ -1459,9 +1559,10 @@ def fetch_incidents():
 
         count += 1
         snow_time = result[TIMESTAMP_FIELD]
+        snow_sys_id = result.get('sys_id')
 
     demisto.incidents(incidents)
-    demisto.setLastRun({'time': snow_time})
+    demisto.setLastRun({'time': snow_time, 'sys_id': snow_sys_id})
 
 
 def test_module():
@@ -1524,6 +1625,8 @@ try:
         demisto.results(get_groups_command())
     elif demisto.command() == 'servicenow-get-record':
         demisto.results(get_record_command())
+    elif demisto.command() == 'servicenow-get-records':
+        demisto.results(get_records_command())
     elif demisto.command() == 'servicenow-update-record':
         demisto.results(update_record_command())
     elif demisto.command() == 'servicenow-create-record':
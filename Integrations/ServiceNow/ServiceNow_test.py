@@ -0,0 +1,149 @@
+import json
+
+import pytest
+
+import demistomock as demisto
+
+PARAMS = {
+    'url': 'https://example.service-now.com',
+    'credentials': {'identifier': 'user', 'password': 'password'},
+    'proxy': True,
+    'fetch_time': '10 minutes',
+    'timestamp_field': 'sys_updated_on'
+}
+
+
+@pytest.fixture
+def snow(mocker):
+    mocker.patch.object(demisto, 'params', return_value=PARAMS)
+    import ServiceNow
+    return ServiceNow
+
+
+class FakeResponse(object):
+    status_code = 200
+    content = 'content'
+    headers = {}
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def json(self):
+        return self.obj
+
+
+def match_query(record, query):
+    """Evaluates the subset of the encoded query syntax built by build_keyset_query"""
+    for condition in query.split('^'):
+        if condition.startswith('ORDERBY'):
+            continue
+        for operator in ('>', '='):
+            if operator in condition:
+                field, value = condition.split(operator, 1)
+                if not (record[field] > value if operator == '>' else record[field] == value):
+                    return False
+                break
+    return True
+
+
+def fake_table(records):
+    """Returns a session request function which queries the records, ordered by sys_updated_on and sys_id"""
+    def request(method, url, params=None, **kwargs):
+        queries = params['sysparm_query'].split('^NQ')
+        matching = [record for record in records if any(match_query(record, query) for query in queries)]
+        matching.sort(key=lambda record: (record['sys_updated_on'], record['sys_id']))
+        return FakeResponse({'result': matching[:int(params['sysparm_limit'])]})
+    return request
+
+
+TIME_1 = '2020-01-01 10:00:00'
+TIME_2 = '2020-01-01 11:00:00'
+
+
+@pytest.mark.parametrize('sysparm_query, last_time, last_sys_id, expected', [
+    (None, None, None, 'ORDERBYsys_updated_on^ORDERBYsys_id'),
+    ('active=true', None, None, 'active=true^ORDERBYsys_updated_on^ORDERBYsys_id'),
+    ('active=true', TIME_1, None, 'active=true^sys_updated_on>{}^ORDERBYsys_updated_on^ORDERBYsys_id'.format(TIME_1)),
+    ('active=true', TIME_1, 'b',
+     'active=true^sys_updated_on>{0}^NQactive=true^sys_updated_on={0}^sys_id>b^ORDERBYsys_updated_on^ORDERBYsys_id'
+     .format(TIME_1)),
+    (None, TIME_1, 'b',
+     'sys_updated_on>{0}^NQsys_updated_on={0}^sys_id>b^ORDERBYsys_updated_on^ORDERBYsys_id'.format(TIME_1)),
+    # the ordering of the query is replaced by the keyset ordering
+    ('active=true^ORDERBYDESCnumber', TIME_1, None,
+     'active=true^sys_updated_on>{}^ORDERBYsys_updated_on^ORDERBYsys_id'.format(TIME_1)),
+    # ^OR conditions bind tighter than ^, so the keyset condition applies to the whole query
+    ('priority=1^ORpriority=2', TIME_1, 'b',
+     'priority=1^ORpriority=2^sys_updated_on>{0}^NQpriority=1^ORpriority=2^sys_updated_on={0}^sys_id>b'
+     '^ORDERBYsys_updated_on^ORDERBYsys_id'.format(TIME_1)),
+    # the keyset condition is added to each ^NQ query
+    ('active=true^NQpriority=1', TIME_1, None,
+     'active=true^sys_updated_on>{0}^NQpriority=1^sys_updated_on>{0}^ORDERBYsys_updated_on^ORDERBYsys_id'
+     .format(TIME_1)),
+])
+def test_build_keyset_query(snow, sysparm_query, last_time, last_sys_id, expected):
+    assert snow.build_keyset_query(sysparm_query, 'sys_updated_on', last_time, last_sys_id) == expected
+
+
+def test_is_keyset_query(snow):
+    assert snow.is_keyset_query(None)
+    assert snow.is_keyset_query('active=true^NQpriority=1')
+    assert not snow.is_keyset_query('active=true^ORDERBYnumber')
+
+
+def test_query_by_keyset_timestamp_tie(snow, mocker):
+    """
+    Given: records with the same timestamp on both sides of a page boundary
+    When: querying them in pages of 2 records
+    Then: every record is returned once, in timestamp and ID order
+    """
+    records = [{'sys_id': sys_id, 'sys_updated_on': TIME_1 if sys_id < 'e' else TIME_2} for sys_id in 'fbdace']
+    mocker.patch.object(snow, 'QUERY_PAGE_SIZE', 2)
+    request = mocker.patch.object(snow.SESSION, 'request', side_effect=fake_table(records))
+    result = list(snow.query_by_keyset('table/incident', 10, None))
+    assert [record['sys_id'] for record in result] == ['a', 'b', 'c', 'd', 'e', 'f']
+    # the last page is full, so an empty page ends the query
+    assert request.call_count == 4
+    assert request.call_args_list[1][1]['params']['sysparm_query'] == \
+        'sys_updated_on>{0}^NQsys_updated_on={0}^sys_id>b^ORDERBYsys_updated_on^ORDERBYsys_id'.format(TIME_1)
+
+
+def test_query_pages_by_keyset(snow, mocker):
+    records = [{'sys_id': sys_id, 'sys_updated_on': TIME_1} for sys_id in 'abcde']
+    mocker.patch.object(snow, 'QUERY_PAGE_SIZE', 2)
+    mocker.patch.object(snow.SESSION, 'request', side_effect=fake_table(records))
+    assert [record['sys_id'] for record in snow.query('incident', 4, 0, None)['result']] == ['a', 'b', 'c', 'd']
+
+
+def test_get_records_chunks(snow, mocker):
+    mocker.patch.object(snow, 'GET_RECORDS_CHUNK_SIZE', 2)
+    request = mocker.patch.object(snow.SESSION, 'request', side_effect=lambda method, url, params=None, **kwargs:
+                                  FakeResponse({'result': [{'sys_id': sys_id}
+                                                           for sys_id in params['sysparm_query'][8:].split(',')]}))
+    records = snow.get_records('incident', ['a', 'b', 'c'])
+    assert [record['sys_id'] for record in records] == ['a', 'b', 'c']
+    assert [c[1]['params']['sysparm_query'] for c in request.call_args_list] == ['sys_idINa,b', 'sys_idINc']
+
+
+def test_fetch_incidents_timestamp_tie(snow, mocker):
+    """
+    Given: tickets with the same timestamp, more than the fetch limit
+    When: fetching twice
+    Then: the second fetch continues right after the last fetched ticket
+    """
+    records = [{'sys_id': sys_id, 'sys_updated_on': TIME_1, 'number': sys_id} for sys_id in 'abc']
+    mocker.patch.object(snow, 'SYSPARM_LIMIT', 2)
+    mocker.patch.object(snow, 'TIMESTAMP_FIELD', 'sys_updated_on')
+    mocker.patch.object(snow.SESSION, 'request', side_effect=fake_table(records))
+    mocker.patch.object(demisto, 'incidents')
+    mocker.patch.object(demisto, 'setLastRun')
+
+    mocker.patch.object(demisto, 'getLastRun', return_value={'time': '2020-01-01 09:00:00'})
+    snow.fetch_incidents()
+    assert [json.loads(i['rawJSON'])['sys_id'] for i in demisto.incidents.call_args[0][0]] == ['a', 'b']
+    last_run = demisto.setLastRun.call_args[0][0]
+    assert last_run == {'time': TIME_1, 'sys_id': 'b'}
+
+    mocker.patch.object(demisto, 'getLastRun', return_value=last_run)
+    snow.fetch_incidents()
+    assert [json.loads(i['rawJSON'])['sys_id'] for i in demisto.incidents.call_args[0][0]] == ['c']
@@ -10,7 +10,8 @@ import asyncio
 import concurrent
 import requests
 import ssl
-from typing import Tuple, Dict, List, Optional
+import threading
+from typing import Tuple, Dict, List, Optional, Callable, Any
 
 # disable unsecure warnings
 requests.packages.urllib3.disable_warnings()
@@ -45,6 +46,24 @@ POLL_INTERVAL_MINUTES: Dict[Tuple, float] = {
     (60, ): 5
 }
 DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+LOOP_INTERVAL_SECONDS = 5
+# The lookup keys indexed for each JSON list kept in the integration context
+CONTEXT_INDEX_FIELDS: Dict[str, Dict[str, Callable[[dict], List[str]]]] = {
+    'users': {
+        'id': lambda u: [u.get('id', '')],
+        'name': lambda u: [u.get('name', '').lower(), u.get('profile', {}).get('email', '').lower(),
+                           u.get('real_name', '').lower()]
+    },
+    'conversations': {
+        'id': lambda c: [c.get('id', '')]
+    },
+    'mirrors': {
+        'investigation_id': lambda m: [m.get('investigation_id', '')]
+    },
+    'questions': {
+        'thread': lambda q: [q.get('thread', '')]
+    }
+}
 
 ''' GLOBALS '''
 
@@ -67,6 +86,14 @@ BOT_NAME: str
 BOT_ICON_URL: str
 MAX_LIMIT_TIME: int
 PAGINATED_COUNT: int
+# Indexed views of the integration context lists, keyed by the JSON string they were built from
+CONTEXT_INDEXES: Dict[str, Tuple[str, Dict[str, Dict[str, dict]]]] = {}
+# The questions last processed by the long running loop and the time the next one is due
+ANSWERS_STATE: Dict[str, Any] = {'questions': None, 'next_poll': datetime.min}
+# The mirrors last processed by the long running loop
+MIRRORS_STATE: Dict[str, Any] = {'mirrors': None}
+# Set when questions or mirrors are changed by this process to wake up the long running loop
+STATE_CHANGED = threading.Event()
 
 ''' HELPER FUNCTIONS '''
 
@@ -116,19 +143,14 @@ def get_user_by_name(user_to_search: str) -> dict:
     :return: A slack user object
     """
 
-    user: dict = {}
     users: list = []
     integration_context = demisto.getIntegrationContext()
 
     user_to_search = user_to_search.lower()
-    if integration_context.get('users'):
-        users = json.loads(integration_context['users'])
-        users_filter = list(filter(lambda u: u.get('name', '').lower() == user_to_search
-                                             or u.get('profile', {}).get('email', '').lower() == user_to_search
-                                             or u.get('real_name', '').lower() == user_to_search, users))
-        if users_filter:
-            user = users_filter[0]
+    user = get_context_index(integration_context, 'users', 'name').get(user_to_search, {})
     if not user:
+        if integration_context.get('users'):
+            users = json.loads(integration_context['users'])
         body = {
             'limit': PAGINATED_COUNT
         }
@@ -190,12 +212,7 @@ def find_mirror_by_investigation() -> dict:
     investigation = demisto.investigation()
     if investigation:
         integration_context = demisto.getIntegrationContext()
-        if integration_context.get('mirrors'):
-            mirrors = json.loads(integration_context['mirrors'])
-            investigation_filter = list(filter(lambda m: investigation.get('id') == m['investigation_id'],
-                                               mirrors))
-            if investigation_filter:
-                mirror = investigation_filter[0]
+        mirror = get_context_index(integration_context, 'mirrors', 'investigation_id').get(investigation.get('id'), {})
 
     return mirror
 
@@ -212,10 +229,44 @@ def set_to_latest_integration_context(key: str, value, wait: bool = False):
 
     integration_context = demisto.getIntegrationContext()
 
-    integration_context[key] = json.dumps(value)
+    value = json.dumps(value)
+    if integration_context.get(key) == value:
+        # Nothing changed, no need to persist the whole context again
+        return
+
+    integration_context[key] = value
 
     demisto.setIntegrationContext(integration_context)
 
+    if key in ('questions', 'mirrors'):
+        STATE_CHANGED.set()
+
+
+def get_context_index(integration_context: dict, key: str, field: str) -> Dict[str, dict]:
+    """
+    Gets an index of a JSON list kept in the integration context by one of its lookup fields.
+    The list is parsed and indexed only when its stored value changes.
+    :param integration_context: The integration context.
+    :param key: The context key of the list, one of CONTEXT_INDEX_FIELDS.
+    :param field: The lookup field to get the index for.
+    :return: A dict of lookup value to the first object in the list that has it.
+    """
+    raw_value = integration_context.get(key) or ''
+    cached = CONTEXT_INDEXES.get(key)
+    if cached and cached[0] == raw_value:
+        return cached[1][field]
+
+    indexes: Dict[str, Dict[str, dict]] = {index_field: {} for index_field in CONTEXT_INDEX_FIELDS[key]}
+    for obj in json.loads(raw_value) if raw_value else []:
+        for index_field, get_lookup_values in CONTEXT_INDEX_FIELDS[key].items():
+            for lookup_value in get_lookup_values(obj):
+                if lookup_value:
+                    indexes[index_field].setdefault(lookup_value, obj)
+
+    CONTEXT_INDEXES[key] = (raw_value, indexes)
+
+    return indexes[field]
+
 
 def set_name_and_icon(body, method):
     """
@@ -321,12 +372,7 @@ async def get_slack_name(slack_id: str, client) -> str:
 
     if prefix in ['C', 'D', 'G']:
         slack_id = slack_id.split('|')[0]
-        conversation: dict = {}
-        if integration_context.get('conversations'):
-            conversations = list(filter(lambda c: c['id'] == slack_id,
-                                        json.loads(integration_context['conversations'])))
-            if conversations:
-                conversation = conversations[0]
+        conversation = get_context_index(integration_context, 'conversations', 'id').get(slack_id, {})
         if not conversation:
             body = {
                 'channel': slack_id
@@ -336,11 +382,7 @@ async def get_slack_name(slack_id: str, client) -> str:
                                                            body=body)).get('channel', {})
         slack_name = conversation.get('name', '')
     elif prefix == 'U':
-        user: dict = {}
-        if integration_context.get('users'):
-            users = list(filter(lambda u: u['id'] == slack_id, json.loads(integration_context['users'])))
-            if users:
-                user = users[0]
+        user = get_context_index(integration_context, 'users', 'id').get(slack_id, {})
         if not user:
             body = {
                 'user': slack_id
@@ -562,6 +604,8 @@ def mirror_investigation():
 def long_running_loop():
     """
     Runs in a long running container - checking for newly mirrored investigations and answered questions.
+    Wakes up when questions or mirrors are changed by this process, or every LOOP_INTERVAL_SECONDS for changes
+    made by other executions.
     """
     while True:
         error = ''
@@ -576,7 +620,8 @@ def long_running_loop():
             if error:
                 demisto.error(error)
                 demisto.updateModuleHealth(error)
-            time.sleep(5)
+            STATE_CHANGED.wait(LOOP_INTERVAL_SECONDS)
+            STATE_CHANGED.clear()
 
 
 def check_for_answers():
@@ -586,12 +631,13 @@ def check_for_answers():
 
     integration_context = demisto.getIntegrationContext()
     questions = integration_context.get('questions', [])
-    users = integration_context.get('users', [])
+    now = get_current_utc_time()
+    if questions == ANSWERS_STATE['questions'] and now < ANSWERS_STATE['next_poll']:
+        # The questions did not change and none of them is due for polling yet
+        return
+
     if questions:
         questions = json.loads(questions)
-    if users:
-        users = json.loads(users)
-    now = get_current_utc_time()
     now_string = datetime.strftime(now, DATE_FORMAT)
 
     for question in questions:
@@ -644,10 +690,9 @@ def check_for_answers():
         if actions:
             demisto.info('Slack - received answer from user for entitlement {}.'.format(question.get('entitlement')))
             user_id = payload.get('user', {}).get('id')
-            user_filter = list(filter(lambda u: u['id'] == user_id, users))
-            if user_filter:
-                user = user_filter[0]
-            else:
+            user = get_context_index(integration_context, 'users', 'id').get(user_id)
+            if not user:
+                users = json.loads(integration_context['users']) if integration_context.get('users') else []
                 body = {
                     'user': user_id
                 }
@@ -660,6 +705,28 @@ def check_for_answers():
 
     questions = list(filter(lambda q: q.get('remove', False) is False, questions))
     set_to_latest_integration_context('questions', questions)
+    ANSWERS_STATE['questions'] = json.dumps(questions)
+    ANSWERS_STATE['next_poll'] = get_next_poll_time(now, questions)
+
+
+def get_next_poll_time(current_time: datetime, questions: list) -> datetime:
+    """
+    Get the earliest time one of the questions should be polled for an answer or expires.
+    :param current_time: The current time.
+    :param questions: The questions waiting for an answer.
+    :return: The next time to check for answers.
+    """
+    next_poll = datetime.max
+    for question in questions:
+        if not question.get('last_poll_time'):
+            return current_time
+        last_poll_time = datetime.strptime(question['last_poll_time'], DATE_FORMAT)
+        next_poll = min(next_poll, last_poll_time + timedelta(minutes=get_poll_minutes(current_time,
+                                                                                       question.get('sent'))))
+        if question.get('expiry'):
+            next_poll = min(next_poll, datetime.strptime(question['expiry'], DATE_FORMAT))
+
+    return next_poll
 
 
 def get_poll_minutes(current_time: datetime, sent: Optional[str]) -> float:
@@ -720,7 +787,7 @@ def check_for_mirrors():
     Checks for newly created mirrors and handles the mirroring process
     """
     integration_context = demisto.getIntegrationContext()
-    if integration_context.get('mirrors'):
+    if integration_context.get('mirrors') and integration_context['mirrors'] != MIRRORS_STATE['mirrors']:
         mirrors = json.loads(integration_context['mirrors'])
         for mirror in mirrors:
             if not mirror['mirrored']:
@@ -746,6 +813,9 @@ def check_for_mirrors():
 
                 set_to_latest_integration_context('mirrors', mirrors)
 
+        # All the mirrors in this state are handled, skip it until it changes
+        MIRRORS_STATE['mirrors'] = json.dumps(mirrors)
+
 
 def invite_to_mirrored_channel(channel_id: str, users: List[Dict]):
     """
@@ -1075,14 +1145,11 @@ async def listen(**payload):
 
 
 async def get_user_by_id_async(client, integration_context, user_id):
-    user: dict = {}
     users: list = []
-    if integration_context.get('users'):
-        users = json.loads(integration_context['users'])
-        user_filter = list(filter(lambda u: u['id'] == user_id, users))
-        if user_filter:
-            user = user_filter[0]
+    user = get_context_index(integration_context, 'users', 'id').get(user_id, {})
     if not user:
+        if integration_context.get('users'):
+            users = json.loads(integration_context['users'])
         body = {
             'user': user_id
         }
@@ -1129,9 +1196,8 @@ async def check_and_handle_entitlement(text: str, user: dict, thread_id: str) ->
         return 'Thank you for your response.'
     else:
         integration_context = demisto.getIntegrationContext()
-        questions = integration_context.get('questions', [])
-        if questions and thread_id:
-            questions = json.loads(questions)
+        if thread_id and get_context_index(integration_context, 'questions', 'thread').get(thread_id):
+            questions = json.loads(integration_context['questions'])
             question_filter = list(filter(lambda q: q.get('thread') == thread_id, questions))
             if question_filter:
                 demisto.info('Slack - handling entitlement in thread.')
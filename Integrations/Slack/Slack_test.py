@@ -2106,6 +2106,83 @@ def test_get_poll_minutes(sent, expected_minutes):
     assert minutes == expected_minutes
 
 
+def test_check_for_answers_not_due(mocker, requests_mock):
+    import Slack
+
+    # Set
+    mocker.patch.object(demisto, 'getIntegrationContext', side_effect=get_integration_context)
+    mocker.patch.object(demisto, 'setIntegrationContext', side_effect=set_integration_context)
+    mocker.patch.object(Slack, 'add_info_headers')
+    mocker.patch.object(Slack, 'get_current_utc_time', return_value=datetime.datetime(2019, 9, 26, 18, 38, 25))
+    requests_mock.post(
+        'https://oproxy.demisto.ninja/slack-poll',
+        json={}
+    )
+
+    integration_context = get_integration_context()
+    integration_context['questions'] = js.dumps([{
+        'thread': 'cool',
+        'entitlement': 'e95cb5a1-e394-4bc5-8ce0-508973aaf298@22|43',
+        'reply': 'Thanks bro',
+        'expiry': '3000-09-26 18:38:25',
+        'sent': '2019-09-26 18:38:25',
+        'default_response': 'NoResponse'
+    }])
+
+    set_integration_context(integration_context)
+
+    # Arrange
+    Slack.check_for_answers()
+    Slack.check_for_answers()
+    Slack.get_current_utc_time.return_value = datetime.datetime(2019, 9, 26, 18, 39, 25)
+    Slack.check_for_answers()
+
+    # Assert
+    # The second check is skipped as the question was just polled, and the third polls it again a minute later
+    assert requests_mock.call_count == 2
+    assert demisto.setIntegrationContext.call_count == 2
+
+
+def test_get_context_index(mocker):
+    import Slack
+
+    # Set
+    mocker.patch.object(Slack.json, 'loads', wraps=js.loads)
+    integration_context = get_integration_context()
+
+    # Arrange
+    user = Slack.get_context_index(integration_context, 'users', 'name').get('spengler@ghostbusters.example.com')
+    same_user = Slack.get_context_index(integration_context, 'users', 'id').get(user['id'])
+    loads_count = Slack.json.loads.call_count
+
+    users = js.loads(USERS)
+    users.append({'id': 'U0NEW', 'name': 'stantz', 'profile': {'email': 'stantz@ghostbusters.example.com'}})
+    integration_context['users'] = js.dumps(users)
+    new_user = Slack.get_context_index(integration_context, 'users', 'name').get('stantz')
+
+    # Assert
+    assert same_user is user
+    assert loads_count <= 1
+    assert new_user['id'] == 'U0NEW'
+
+
+def test_set_to_latest_integration_context_unchanged(mocker):
+    from Slack import set_to_latest_integration_context
+
+    # Set
+    mocker.patch.object(demisto, 'getIntegrationContext', side_effect=get_integration_context)
+    mocker.patch.object(demisto, 'setIntegrationContext', side_effect=set_integration_context)
+
+    # Arrange
+    set_to_latest_integration_context('users', js.loads(USERS))
+    set_to_latest_integration_context('users', js.loads(USERS))
+
+    # Assert
+    # The second call does not change the users, so the context is written only once
+    assert demisto.setIntegrationContext.call_count == 1
+    assert demisto.getIntegrationContext()['users'] == js.dumps(js.loads(USERS))
+
+
 def test_check_for_answers_no_answer(mocker, requests_mock):
     import Slack
 
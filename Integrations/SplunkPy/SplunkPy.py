@@ -21,6 +21,13 @@ SPLUNK_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
 VERIFY_CERTIFICATE = not bool(demisto.params().get('unsecure'))
 FETCH_LIMIT = int(demisto.params().get('fetch_limit', 50))
 FETCH_LIMIT = max(min(200, FETCH_LIMIT), 1)
+# fields added to the export fetch query to checkpoint on, removed from the fetched events
+EXPORT_FETCH_INDEX_TIME_FIELD = 'demisto_fetch_indextime'
+EXPORT_FETCH_ID_FIELD = 'demisto_fetch_id'
+# events indexed more than this many seconds after their time are not fetched by the export fetch
+EXPORT_FETCH_MAX_EVENT_DELAY = 24 * 60 * 60
+# seconds of index time read by the first export fetch query, doubled for each following query while they find nothing
+EXPORT_FETCH_WINDOW = 5 * 60
 
 
 class ResponseReaderWrapper(io.RawIOBase):
@@ -344,18 +351,67 @@ def parse_batch_of_results(current_batch_of_results, max_results_to_add, app):
     return parsed_batch_results, batch_dbot_scores
 
 
+def iter_export_results(query, **kwargs):
+    """
+    Streams the results of a search through the export endpoint, as Splunk produces them. The search is not
+    run as a job, and closing the generator stops reading the results.
+    """
+    export_stream = service.jobs.export(query, **kwargs)  # type: ignore
+    try:
+        results_reader = results.ResultsReader(io.BufferedReader(ResponseReaderWrapper(export_stream)))
+        for item in results_reader:
+            if isinstance(item, results.Message):
+                if "Error in" in item.message:
+                    raise ValueError(item.message)
+            elif isinstance(item, dict) and not results_reader.is_preview:
+                yield item
+    finally:
+        export_stream.close()
+
+
+def splunk_search_to_file(args, query, search_kwargs, results_limit):
+    search_kwargs.pop('exec_mode', None)
+    file_name = 'splunk_search_results.json'
+    file_id = demisto.uniqueFile()
+    results_count = 0
+    with open(demisto.investigation()['id'] + '_' + file_id, 'wb') as results_file:
+        export_results = iter_export_results(query, **search_kwargs)
+        for item in export_results:
+            if search_kwargs.get('app'):
+                item['app'] = search_kwargs['app']
+            results_file.write(json.dumps(item) + '\n')
+            results_count += 1
+            if results_count >= results_limit:
+                break
+        export_results.close()
+
+    demisto.results({
+        'Type': entryTypes['file'],
+        'File': file_name,
+        'FileID': file_id,
+        'Contents': '',
+        'ContentsFormat': formats['text'],
+        'HumanReadable': 'Splunk Search for query: {} wrote {} results to the file {}, one JSON per line.'.format(
+            args['query'], results_count, file_name)
+    })
+
+
 def splunk_search_command():
     args = demisto.args()
 
     query = build_search_query(args)
     search_kwargs = build_search_kwargs(args)
-    search_job = service.jobs.create(query, **search_kwargs)  # type: ignore
-    num_of_results_from_query = search_job["resultCount"]
-
     results_limit = float(demisto.args().get("event_limit", 100))
     if results_limit == 0.0:
         # In Splunk, a result limit of 0 means no limit.
         results_limit = float("inf")
+    if args.get('write_to_file') == 'true':
+        splunk_search_to_file(args, query, search_kwargs, results_limit)
+        return
+
+    search_job = service.jobs.create(query, **search_kwargs)  # type: ignore
+    num_of_results_from_query = search_job["resultCount"]
+
     batch_size = int(demisto.args().get("batch_limit", 25000))
 
     results_offset = 0
@@ -426,6 +482,18 @@ def splunk_results_command():
         demisto.results({"Type": 1, "ContentsFormat": "json", "Contents": json.dumps(res)})
 
 
+def build_fetch_query():
+    fetch_query = demisto.params()['fetchQuery']
+
+    if demisto.get(demisto.params(), 'extractFields'):
+        extractFields = demisto.params()['extractFields']
+        extra_raw_arr = extractFields.split(',')
+        for field in extra_raw_arr:
+            field_trimmed = field.strip()
+            fetch_query = fetch_query + ' | eval ' + field_trimmed + '=' + field_trimmed
+    return fetch_query
+
+
 def fetch_incidents():
     lastRun = demisto.getLastRun() and demisto.getLastRun()['time']
     search_offset = demisto.getLastRun().get('offset', 0)
@@ -450,14 +518,7 @@ def fetch_incidents():
     kwargs_oneshot = {earliest_fetch_time_fieldname: lastRun,
                       latest_fetch_time_fieldname: now, "count": FETCH_LIMIT, 'offset': search_offset}
 
-    searchquery_oneshot = demisto.params()['fetchQuery']
-
-    if demisto.get(demisto.params(), 'extractFields'):
-        extractFields = demisto.params()['extractFields']
-        extra_raw_arr = extractFields.split(',')
-        for field in extra_raw_arr:
-            field_trimmed = field.strip()
-            searchquery_oneshot = searchquery_oneshot + ' | eval ' + field_trimmed + '=' + field_trimmed
+    searchquery_oneshot = build_fetch_query()
 
     oneshotsearch_results = service.jobs.oneshot(searchquery_oneshot, **kwargs_oneshot)  # type: ignore
     reader = results.ResultsReader(oneshotsearch_results)
@@ -472,6 +533,62 @@ def fetch_incidents():
         demisto.setLastRun({'time': lastRun, 'offset': search_offset + FETCH_LIMIT})
 
 
+def fetch_incidents_by_export():
+    """
+    Fetches the events through the export endpoint. The events indexed since the last run are read in windows of
+    index time, each sorted by index time, and reading stops once FETCH_LIMIT new events were read. A window is
+    widened while the windows before it have no new events.
+    The last run holds the index time of the last fetched event and the ids of the events fetched with that index
+    time, so that the next fetch continues right after them.
+    """
+    last_run = demisto.getLastRun() or {}
+    now = int((datetime.utcnow() - datetime(1970, 1, 1)).total_seconds())
+    index_time = last_run.get('index_time')
+    fetched_ids = set(last_run.get('index_time_ids', []))
+    if index_time is None:
+        index_time = now - 10 * 60
+
+    fetch_query = build_fetch_query() + ' | eval {0}=_indextime, {1}=coalesce(event_id, _cd, md5(_raw))' \
+                                        ' | sort 0 {0} {1}'.format(EXPORT_FETCH_INDEX_TIME_FIELD, EXPORT_FETCH_ID_FIELD)
+    events = []  # type: list
+    read_keys = set()
+    window_start, window = index_time, EXPORT_FETCH_WINDOW
+    while len(events) < FETCH_LIMIT:
+        window_end = min(window_start + window, now)
+        export_results = iter_export_results(fetch_query, index_earliest=window_start, index_latest=window_end,
+                                             earliest_time=window_start - EXPORT_FETCH_MAX_EVENT_DELAY)
+        window_events = 0
+        for item in export_results:
+            item_index_time = int(float(item.pop(EXPORT_FETCH_INDEX_TIME_FIELD, window_start)))
+            item_id = item.pop(EXPORT_FETCH_ID_FIELD, None)
+            key = (item_index_time, item_id)
+            if item_index_time < index_time or (item_index_time == index_time and item_id in fetched_ids) \
+                    or key in read_keys:
+                continue
+            read_keys.add(key)
+            events.append((item_index_time, item_id, item))
+            window_events += 1
+            if len(events) >= FETCH_LIMIT:
+                break
+        export_results.close()
+        if window_end >= now:
+            break
+        if not window_events:
+            window *= 2
+        window_start = window_end
+
+    if events:
+        last_index_time = events[-1][0]
+        if last_index_time > index_time:
+            index_time = last_index_time
+            fetched_ids = set()
+        fetched_ids.update(item_id for item_index_time, item_id, _ in events if item_index_time == index_time)
+
+    demisto.incidents([notable_to_incident(item) for _, _, item in events])
+    last_run.update({'index_time': index_time, 'index_time_ids': list(fetched_ids)})
+    demisto.setLastRun(last_run)
+
+
 def splunk_get_indexes_command():
     indexes = service.indexes  # type: ignore
     indexesNames = []
@@ -611,7 +728,10 @@ if demisto.command() == 'splunk-job-create':
 if demisto.command() == 'splunk-results':
     splunk_results_command()
 if demisto.command() == 'fetch-incidents':
-    fetch_incidents()
+    if demisto.params().get('useExportFetch'):
+        fetch_incidents_by_export()
+    else:
+        fetch_incidents()
 if demisto.command() == 'splunk-get-indexes':
     splunk_get_indexes_command()
 if demisto.command() == 'splunk-submit-event':
@@ -0,0 +1,164 @@
+import io
+import json
+import os
+import time
+from xml.sax.saxutils import escape
+
+import pytest
+import splunklib.client as client
+
+import demistomock as demisto
+
+PARAMS = {
+    'host': 'splunk.example.com',
+    'port': '8089',
+    'proxy': False,
+    'authentication': {'identifier': 'user', 'password': 'password'},
+    'fetchQuery': 'search index=notable',
+    'fetch_limit': '2'
+}
+
+
+@pytest.fixture
+def splunk(mocker):
+    mocker.patch.object(demisto, 'params', return_value=PARAMS)
+    mocker.patch.object(client, 'connect')
+    import SplunkPy
+    mocker.patch.object(SplunkPy, 'service')
+    mocker.patch.object(SplunkPy, 'FETCH_LIMIT', 2)
+    return SplunkPy
+
+
+def export_stream(events, preview_events=()):
+    """Builds an export endpoint response, with the preview results followed by the final results"""
+    def results_xml(preview, results_events):
+        results_xml = "<?xml version='1.0' encoding='UTF-8'?>\n<results preview='{}'>\n".format(int(preview))
+        for offset, event in enumerate(results_events):
+            results_xml += "<result offset='{}'>{}</result>\n".format(offset, ''.join(
+                "<field k='{}'><value><text>{}</text></value></field>".format(key, escape(str(value)))
+                for key, value in event.items()))
+        return results_xml + '</results>\n'
+
+    return io.BytesIO(results_xml(True, preview_events) + results_xml(False, events))
+
+
+def event(index_time, event_id):
+    return {'rule_name': event_id, 'demisto_fetch_indextime': index_time, 'demisto_fetch_id': event_id}
+
+
+def fake_export(events, preview_events=()):
+    """Returns an export function which streams the events in the requested index time window, sorted"""
+    def export(query, index_earliest, index_latest, **kwargs):
+        window_events = [e for e in events if index_earliest <= e['demisto_fetch_indextime'] <= index_latest]
+        window_events.sort(key=lambda e: (e['demisto_fetch_indextime'], e['demisto_fetch_id']))
+        return export_stream(window_events, preview_events)
+    return export
+
+
+def fetch(splunk, mocker, last_run, events):
+    mocker.patch.object(demisto, 'getLastRun', return_value=last_run)
+    mocker.patch.object(demisto, 'setLastRun')
+    mocker.patch.object(demisto, 'incidents')
+    splunk.service.jobs.export.side_effect = fake_export(events, preview_events=[event(1, 'preview')])
+    splunk.fetch_incidents_by_export()
+    incidents = [json.loads(incident['rawJSON'])['rule_name'] for incident in demisto.incidents.call_args[0][0]]
+    return incidents, demisto.setLastRun.call_args[0][0]
+
+
+def test_fetch_incidents_by_export(splunk, mocker):
+    now = int(time.time())
+    start = now - 3600
+    events = [event(start + 2, 'c'), event(start, 'a'), event(start + 1, 'b2'), event(start + 1, 'b1')]
+    incidents, last_run = fetch(splunk, mocker, {'index_time': start}, events)
+    assert incidents == ['a', 'b1']
+    assert last_run == {'index_time': start + 1, 'index_time_ids': ['b1']}
+    export_args = splunk.service.jobs.export.call_args
+    assert export_args[0][0].endswith('| sort 0 demisto_fetch_indextime demisto_fetch_id')
+    assert export_args[1]['index_earliest'] == start
+    assert export_args[1]['index_latest'] == start + splunk.EXPORT_FETCH_WINDOW
+    assert export_args[1]['earliest_time'] == start - splunk.EXPORT_FETCH_MAX_EVENT_DELAY
+
+    # resuming from the last run skips the events fetched at its index time
+    incidents, last_run = fetch(splunk, mocker, last_run, events)
+    assert incidents == ['b2', 'c']
+    assert last_run == {'index_time': start + 2, 'index_time_ids': ['c']}
+
+    # all the events at the last index time were fetched, so its ids are kept
+    incidents, last_run = fetch(splunk, mocker, last_run, events + [event(start + 2, 'd')])
+    assert incidents == ['d']
+    assert sorted(last_run['index_time_ids']) == ['c', 'd']
+
+    # nothing new, the last run is unchanged
+    incidents, new_last_run = fetch(splunk, mocker, last_run, events + [event(start + 2, 'd')])
+    assert incidents == []
+    assert new_last_run == last_run
+
+
+def test_fetch_incidents_by_export_widens_empty_windows(splunk, mocker):
+    # the windows are read one after the other, each twice as wide as the empty one before it
+    now = int(time.time())
+    start = now - 3600
+    window = splunk.EXPORT_FETCH_WINDOW
+    incidents, last_run = fetch(splunk, mocker, {'index_time': start}, [event(start + 4 * window, 'a')])
+    assert incidents == ['a']
+    windows = [(c[1]['index_earliest'], c[1]['index_latest']) for c in splunk.service.jobs.export.call_args_list]
+    assert windows[:3] == [(start, start + window), (start + window, start + 3 * window),
+                           (start + 3 * window, start + 7 * window)]
+    # the windows cover the time up to now
+    assert windows[-1][1] == now
+
+
+def test_fetch_incidents_by_export_stops_at_limit(splunk, mocker):
+    """
+    Given: a backlog of more events than the fetch limit
+    When: fetching
+    Then: the export results are read only up to the fetch limit
+    """
+    now = int(time.time())
+    read = []
+
+    def iter_export_results(query, **kwargs):
+        for i in range(100):
+            assert len(read) < splunk.FETCH_LIMIT, 'read past the fetch limit'
+            read.append(i)
+            yield {'rule_name': str(i), 'demisto_fetch_indextime': now - 3600, 'demisto_fetch_id': '{:03}'.format(i)}
+
+    mocker.patch.object(splunk, 'iter_export_results', side_effect=iter_export_results)
+    mocker.patch.object(demisto, 'getLastRun', return_value={'index_time': now - 3600})
+    mocker.patch.object(demisto, 'setLastRun')
+    mocker.patch.object(demisto, 'incidents')
+    splunk.fetch_incidents_by_export()
+    assert len(demisto.incidents.call_args[0][0]) == splunk.FETCH_LIMIT
+    assert splunk.iter_export_results.call_count == 1
+
+
+def test_fetch_incidents_by_export_first_run(splunk, mocker):
+    # the first fetch starts from the events indexed in the last 10 minutes
+    now = int(time.time())
+    incidents, last_run = fetch(splunk, mocker, {}, [event(now - 3600, 'old'), event(now, 'a')])
+    assert incidents == ['a']
+    assert last_run == {'index_time': now, 'index_time_ids': ['a']}
+    assert now - 600 - 5 <= splunk.service.jobs.export.call_args_list[0][1]['index_earliest'] <= now - 600
+    assert 'demisto_fetch_id' not in json.dumps(demisto.incidents.call_args[0][0])
+
+
+def test_iter_export_results_stops_reading(splunk):
+    stream = export_stream([event(1, 'a'), event(2, 'b')])
+    splunk.service.jobs.export.return_value = stream
+    export_results = splunk.iter_export_results('search *')
+    assert next(export_results)['demisto_fetch_id'] == 'a'
+    export_results.close()
+    assert stream.closed
+
+
+def test_splunk_search_to_file(splunk, mocker):
+    mocker.patch.object(demisto, 'results')
+    splunk.service.jobs.export.return_value = export_stream([{'a': 1}, {'a': 2}, {'a': 3}], preview_events=[{'a': 0}])
+    splunk.splunk_search_to_file({'query': 'search *'}, 'search *', {'exec_mode': 'blocking', 'app': 'search'}, 2)
+    assert 'exec_mode' not in splunk.service.jobs.export.call_args[1]
+    entry = demisto.results.call_args[0][0]
+    assert 'wrote 2 results' in entry['HumanReadable']
+    file_path = demisto.investigation()['id'] + '_' + entry['FileID']
+    with open(file_path, 'rb') as results_file:
+        assert [json.loads(line) for line in results_file] == [{'a': '1', 'app': 'search'}, {'a': '2', 'app': 'search'}]
+    os.remove(file_path)
@@ -6,16 +6,22 @@ Note that adding code to CommonServerUserPython can override functions in Common
 from __future__ import print_function
 
 import base64
+import binascii
+import bisect
+import hashlib
 import json
 import logging
 import os
+import random
 import re
 import socket
 import sys
+import threading
 import time
 import xml.etree.cElementTree as ET
 from collections import OrderedDict
 from datetime import datetime, timedelta
+from email.utils import parsedate_tz, mktime_tz
 
 import demistomock as demisto
 
@@ -679,6 +685,43 @@ def encode_string_results(text):
         return text.encode("utf8", "replace")
 
 
+def strings_to_regex(strings):
+    """
+       Builds a regex that matches any of the given strings, where the longest string is matched first.
+       The strings are arranged in a prefix tree, so matching is done in a single pass over the text
+       regardless of the number of strings.
+
+       :type strings: ``list``
+       :param strings: The strings to match (required)
+
+       :return: The regex pattern
+       :rtype: ``str``
+    """
+    trie = {}  # type: dict
+    for string in strings:
+        node = trie
+        for char in string:
+            node = node.setdefault(char, {})
+        # the empty key marks the end of a string
+        node[''] = {}
+
+    def node_to_regex(node):
+        pattern = ''
+        chars = sorted(char for char in node if char)
+        # follow a chain of single chars without recursing
+        while len(chars) == 1 and '' not in node:
+            pattern += re.escape(chars[0])
+            node = node[chars[0]]
+            chars = sorted(char for char in node if char)
+        if not chars:
+            return pattern
+        pattern += '(?:' + '|'.join(re.escape(char) + node_to_regex(node[char]) for char in chars) + ')'
+        # a string that ends here is matched only if none of the longer ones does
+        return pattern + '?' if '' in node else pattern
+
+    return node_to_regex(trie)
+
+
 class IntegrationLogger(object):
     """
       a logger for python integrations:
@@ -697,6 +740,9 @@ class IntegrationLogger(object):
         self.messages = []  # type: list
         self.write_buf = []  # type: list
         self.replace_strs = []  # type: list
+        # the replace strings as a single regex, rebuilt when replace_strs changes
+        self.replace_regex = None
+        self.replace_regex_size = 0
         self.buffering = True
         # if for some reason you don't want to auto add credentials.password to replace strings
         # set the os env COMMON_SERVER_NO_AUTO_REPLACE_STRS. Either in CommonServerUserPython, or docker env
@@ -727,10 +773,18 @@ class IntegrationLogger(object):
                 res = message.encode('utf-8', 'replace')  # type: ignore
             else:
                 res = "Failed encoding message with error: {}".format(exception)
-        for s in self.replace_strs:
-            res = res.replace(s, '<XX_REPLACED>')
+        if self.replace_strs:
+            if self.replace_regex_size != len(self.replace_strs):
+                self.compile_replace_regex()
+            if self.replace_regex:
+                res = self.replace_regex.sub('<XX_REPLACED>', res)
         return res
 
+    def compile_replace_regex(self):
+        replace_strs = [s for s in self.replace_strs if s]
+        self.replace_regex = re.compile(strings_to_regex(replace_strs)) if replace_strs else None
+        self.replace_regex_size = len(self.replace_strs)
+
     def __call__(self, message):
         text = self.encode(message)
         if self.buffering:
@@ -989,7 +1043,7 @@ def appendContext(key, data, dedup=False):
         demisto.setContext(key, data)
 
 
-def tableToMarkdown(name, t, headers=None, headerTransform=None, removeNull=False, metadata=None):
+def tableToMarkdown(name, t, headers=None, headerTransform=None, removeNull=False, metadata=None, max_rows=None):
     """
        Converts a demisto table in JSON form to a Markdown table
 
@@ -1012,20 +1066,23 @@ def tableToMarkdown(name, t, headers=None, headerTransform=None, removeNull=Fals
        :type metadata: ``str``
        :param metadata: Metadata about the table contents
 
+       :type max_rows: ``int``
+       :keyword max_rows: The maximal number of rows to present, the rest are truncated. Default is all the rows
+
        :return: A string representation of the markdown table
        :rtype: ``str``
     """
 
-    mdResult = ''
+    mdResult = []
     if name:
-        mdResult = '### ' + name + '\n'
+        mdResult.append('### ' + name + '\n')
 
     if metadata:
-        mdResult += metadata + '\n'
+        mdResult.append(metadata + '\n')
 
     if not t or len(t) == 0:
-        mdResult += '**No entries.**\n'
-        return mdResult
+        mdResult.append('**No entries.**\n')
+        return ''.join(mdResult)
 
     if not isinstance(t, list):
         t = [t]
@@ -1038,7 +1095,7 @@ def tableToMarkdown(name, t, headers=None, headerTransform=None, removeNull=Fals
         # should be only one header
         if headers and len(headers) > 0:
             header = headers[0]
-            t = map(lambda item: dict((h, item) for h in [header]), t)
+            t = [{header: item} for item in t]
         else:
             raise Exception("Missing headers param for tableToMarkdown. Example: headers=['Some Header']")
 
@@ -1048,41 +1105,46 @@ def tableToMarkdown(name, t, headers=None, headerTransform=None, removeNull=Fals
         headers.sort()
 
     if removeNull:
-        headers_aux = headers[:]
-        for header in headers_aux:
-            if all(obj.get(header) in ('', None, [], {}) for obj in t):
-                headers.remove(header)
+        # a single pass over the table, until a value is found for all the headers
+        non_empty_headers = set()  # type: set
+        for obj in t:
+            for header in headers:
+                if header not in non_empty_headers and obj.get(header) not in ('', None, [], {}):
+                    non_empty_headers.add(header)
+            if len(non_empty_headers) == len(headers):
+                break
+        headers = [header for header in headers if header in non_empty_headers]
 
     if t and len(headers) > 0:
-        newHeaders = []
         if headerTransform is None:  # noqa
             headerTransform = lambda s: s  # noqa
-        for header in headers:
-            newHeaders.append(headerTransform(header))
-        mdResult += '|'
-        if len(newHeaders) == 1:
-            mdResult += newHeaders[0]
-        else:
-            mdResult += '|'.join(newHeaders)
-        mdResult += '|\n'
-        sep = '---'
-        mdResult += '|' + '|'.join([sep] * len(headers)) + '|\n'
-        for entry in t:
-            vals = [stringEscapeMD((formatCell(entry.get(h, ''), False) if entry.get(h) is not None else ''),
-                                   True, True) for h in headers]
+        mdResult.append('|' + '|'.join([headerTransform(header) for header in headers]) + '|\n')
+        mdResult.append('|' + '|'.join(['---'] * len(headers)) + '|\n')
+        rows = t[:max_rows] if max_rows is not None else t
+        for entry in rows:
+            vals = []
+            for h in headers:
+                value = entry.get(h)
+                if value is None:
+                    vals.append('')
+                    continue
+                if not isinstance(value, STRING_TYPES):
+                    # same as formatCell, which json dumps the numbers
+                    value = str(value) if type(value) is int else formatCell(value, False)
+                vals.append(escapeMarkdownTableCell(value))
             # this pipe is optional
-            mdResult += '| '
             try:
-                mdResult += ' | '.join(vals)
+                mdResult.append('| ' + ' | '.join(vals) + ' |\n')
             except UnicodeDecodeError:
-                vals = [str(v) for v in vals]
-                mdResult += ' | '.join(vals)
-            mdResult += ' |\n'
+                mdResult.append('| ' + ' | '.join([str(v) for v in vals]) + ' |\n')
+        if len(rows) < len(t):
+            mdResult.append('\n**Showing {} of {} rows, {} rows were truncated.**\n'.format(
+                len(rows), len(t), len(t) - len(rows)))
 
     else:
-        mdResult += '**No entries.**\n'
+        mdResult.append('**No entries.**\n')
 
-    return mdResult
+    return ''.join(mdResult)
 
 
 tblToMd = tableToMarkdown
@@ -1268,6 +1330,26 @@ def flattenTable(tableDict):
 MARKDOWN_CHARS = r"\`*_{}[]()#+-!"
 
 
+MARKDOWN_TABLE_CELL_ESCAPES = {'\r\n': '<br>', '\r': '<br>', '\n': '<br>', '|': '\\|'}
+MARKDOWN_TABLE_CELL_REGEX = re.compile(r'\r\n|\r|\n|\|')
+
+
+def escapeMarkdownTableCell(st):
+    """
+       Escape the line endings and pipes of a markdown table cell in a single pass.
+       Same as stringEscapeMD(st, minimal_escaping=True, escape_multiline=True)
+
+       :type st: ``str``
+       :param st: The string to be modified (required)
+
+       :return: A modified string
+       :rtype: ``str``
+    """
+    if '|' not in st and '\n' not in st and '\r' not in st:
+        return st
+    return MARKDOWN_TABLE_CELL_REGEX.sub(lambda match: MARKDOWN_TABLE_CELL_ESCAPES[match.group()], st)
+
+
 def stringEscapeMD(st, minimal_escaping=False, escape_multiline=False):
     """
        Escape any chars that might break a markdown string
@@ -1284,6 +1366,9 @@ def stringEscapeMD(st, minimal_escaping=False, escape_multiline=False):
        :return: A modified string
        :rtype: ``str``
     """
+    if minimal_escaping and escape_multiline:
+        return escapeMarkdownTableCell(st)
+
     if escape_multiline:
         st = st.replace('\r\n', '<br>')  # Windows
         st = st.replace('\r', '<br>')  # old Mac
@@ -1483,6 +1568,142 @@ def xml2json(xmlstring, options={}, strip_ns=1, strip=1):
     return elem2json(elem, options, strip_ns=strip_ns, strip=strip)
 
 
+def iterparse_xml(xml_data, item_tag=None, strip_ns=1, strip=1, chunk_size=1048576):
+    """
+       Converts an XML document into dictionaries (same as elem_to_internal) while it is parsed,
+       without recursion, dropping every element from the tree once it is converted.
+
+       :type xml_data: ``str`` or ``bytes`` or ``file``
+       :param xml_data: The XML string or a file object to read it from (required)
+
+       :type item_tag: ``str``
+       :param item_tag: The tag of repeated elements to yield one at a time, they are not part of the root.
+
+       :type chunk_size: ``int``
+       :param chunk_size: The number of characters parsed at a time.
+
+       :return: Tuples of (is_root, converted element) - one for each item_tag element, and the root last.
+       :rtype: ``iterator``
+    """
+    if hasattr(xml_data, 'read'):
+        events = ET.iterparse(xml_data)
+    elif hasattr(ET, 'XMLPullParser'):
+        def pull_events(parser):
+            for i in range(0, len(xml_data), chunk_size):
+                parser.feed(xml_data[i:i + chunk_size])
+                for event in parser.read_events():
+                    yield event
+            parser.close()
+            for event in parser.read_events():
+                yield event
+        events = pull_events(ET.XMLPullParser())
+    else:
+        # Python 2
+        from io import BytesIO
+        if not isinstance(xml_data, bytes):
+            xml_data = xml_data.encode('utf-8')
+        events = ET.iterparse(BytesIO(xml_data))
+
+    def finalize(d, text, tail):
+        # same as the end of elem_to_internal, once the tail of the element is known
+        if strip and tail:
+            tail = tail.strip()
+        if tail:
+            d['#tail'] = tail
+        if d:
+            if text:
+                d['#text'] = text
+            return d
+        return text or None
+
+    tags = {}  # type: dict
+    # elements which ended, waiting for their parent to end: element -> (tag, attributes and sub elements, text)
+    converted = {}  # type: dict
+    elem = None
+    for _, elem in events:
+        tag = tags.get(elem.tag)
+        if tag is None:
+            tag = tags[elem.tag] = strip_tag(elem.tag) if strip_ns else elem.tag
+        d = {'@' + key: value for key, value in elem.attrib.items()} if elem.attrib else {}
+        for subelem in elem:
+            sub_converted = converted.pop(subelem, None)
+            if sub_converted is None:
+                # an item which was already yielded
+                continue
+            sub_tag, sub_d, sub_text = sub_converted
+            value = finalize(sub_d, sub_text, subelem.tail)
+            try:
+                # add to existing list for this tag
+                d[sub_tag].append(value)
+            except AttributeError:
+                # turn existing entry into a list
+                d[sub_tag] = [d[sub_tag], value]
+            except KeyError:
+                # add a new non-list entry
+                d[sub_tag] = value
+        text = elem.text
+        if strip and text:
+            text = text.strip()
+
+        if item_tag and tag == item_tag:
+            yield False, {tag: finalize(d, text, None)}
+            # keep only an empty element in its parent
+            elem.clear()
+        else:
+            # the sub elements are converted, no need to keep them
+            del elem[:]
+            converted[elem] = (tag, d, text)
+
+    if elem is not None and elem in converted:
+        tag, d, text = converted.pop(elem)
+        yield True, {tag: finalize(d, text, elem.tail)}
+
+
+def xml2dict(xml_data, strip_ns=1, strip=1, item_tag=None, callback=None):
+    """
+       Convert an XML string into a dictionary, same as json.loads(xml2json(xml_data)) without the JSON round trip.
+
+       :type xml_data: ``str`` or ``bytes`` or ``file``
+       :param xml_data: The XML string or a file object to read it from (required)
+
+       :type item_tag: ``str``
+       :param item_tag:
+            The tag of repeated elements, for example 'entry', to pass to the callback one at a time
+            as they are parsed. These elements are not included in the returned dictionary.
+
+       :type callback: ``function``
+       :param callback: A function that gets each item_tag element as a dictionary, for example {'entry': {...}}.
+
+       :return: The converted XML
+       :rtype: ``dict``
+    """
+    for is_root, converted_elem in iterparse_xml(xml_data, item_tag=item_tag if callback else None,
+                                                 strip_ns=strip_ns, strip=strip):
+        if is_root:
+            return converted_elem
+        callback(converted_elem)  # type: ignore
+    return {}
+
+
+def iter_xml_items(xml_data, item_tag, strip_ns=1, strip=1):
+    """
+       Yields the repeated elements of an XML document one at a time as they are parsed,
+       so the whole document is never held in memory.
+
+       :type xml_data: ``str`` or ``bytes`` or ``file``
+       :param xml_data: The XML string or a file object to read it from (required)
+
+       :type item_tag: ``str``
+       :param item_tag: The tag of the repeated elements, for example 'entry' (required)
+
+       :return: Each item_tag element as a dictionary, for example {'entry': {...}}
+       :rtype: ``iterator``
+    """
+    for is_root, converted_elem in iterparse_xml(xml_data, item_tag=item_tag, strip_ns=strip_ns, strip=strip):
+        if not is_root:
+            yield converted_elem
+
+
 def json2xml(json_data, factory=ET.Element):
     """Convert a JSON string into an XML string.
     Whatever Element implementation we could import will be used by
@@ -1581,6 +1802,170 @@ def is_ip_valid(s, accept_v6_ips=False):
         return True
 
 
+class CidrRanges(object):
+    """
+      A list of IPv4 and IPv6 CIDR ranges, compiled to test many addresses against it. The ranges are merged to sorted
+      disjoint intervals per IP version, so each address is tested by a binary search instead of against every range.
+
+      :type ranges: ``list``
+      :param ranges: The CIDR ranges, e.g. 10.0.0.0/8, 10.0.0.0/255.0.0.0 or 2001:db8::/32. An IPv4 range may also have
+        a netmask or a hostmask instead of a prefix length. An address without a prefix is a single address range.
+
+      :return: No data returned
+      :rtype: ``None``
+    """
+    CACHE_DIR = '/tmp/cidr_ranges_cache'
+    CACHE_SIZE = 100
+
+    def __init__(self, ranges):
+        intervals = {socket.AF_INET: [], socket.AF_INET6: []}  # type: dict
+        for cidr in ranges:
+            address, _, prefix = cidr.strip().partition('/')
+            family, ip = CidrRanges.parse_address(address)
+            bits = 32 if family == socket.AF_INET else 128
+            host_bits = CidrRanges.parse_host_bits(prefix, family, bits) if prefix else 0
+            if host_bits is None or not 0 <= host_bits <= bits:
+                raise ValueError('Invalid CIDR range: {}'.format(cidr))
+            start = ip >> host_bits << host_bits
+            intervals[family].append((start, start | ((1 << host_bits) - 1)))
+
+        self.starts = {}  # type: dict
+        self.ends = {}  # type: dict
+        for family, family_intervals in intervals.items():
+            starts, ends = [], []  # type: ignore
+            for start, end in sorted(family_intervals):
+                if ends and start <= ends[-1] + 1:
+                    # overlapping or adjacent ranges are merged
+                    ends[-1] = max(ends[-1], end)
+                else:
+                    starts.append(start)
+                    ends.append(end)
+            self.starts[family] = starts
+            self.ends[family] = ends
+
+    @staticmethod
+    def parse_address(address):
+        """
+          Parses an IPv4 or IPv6 address.
+
+          :type address: ``str``
+          :param address: The address.
+
+          :return: The socket address family, and the address as an integer.
+          :rtype: ``tuple``
+        """
+        for family in (socket.AF_INET, socket.AF_INET6):
+            try:
+                return family, int(binascii.hexlify(socket.inet_pton(family, address.strip())), 16)
+            except (socket.error, ValueError):
+                continue
+        raise ValueError('Invalid IP address: {}'.format(address))
+
+    @staticmethod
+    def parse_host_bits(prefix, family, bits):
+        """
+          Parses the prefix of a range to the number of its host bits.
+
+          :type prefix: ``str``
+          :param prefix: The prefix length, or for IPv4 a netmask (255.0.0.0) or a hostmask (0.255.255.255).
+
+          :type family: ``int``
+          :param family: The socket address family of the range.
+
+          :type bits: ``int``
+          :param bits: The number of bits of the range addresses.
+
+          :return: The number of host bits, None if the prefix is not a valid mask.
+          :rtype: ``int``
+        """
+        if prefix.strip().isdigit():
+            return bits - int(prefix)
+        mask_family, mask = CidrRanges.parse_address(prefix)
+        if family != socket.AF_INET or mask_family != socket.AF_INET:
+            return None
+        # as in netaddr, a mask which is both a netmask and a hostmask (0.0.0.0, 255.255.255.255) is a netmask
+        for host_mask in (mask ^ 0xffffffff, mask):
+            if host_mask & (host_mask + 1) == 0:
+                return host_mask.bit_length()
+        return None
+
+    @classmethod
+    def load(cls, ranges, cache_dir=None, cache_size=CACHE_SIZE):
+        """
+          Compiles the ranges. When a cache directory is given, loads them if they were already compiled by a previous
+          run in the same container, or caches them for the next runs.
+
+          :type ranges: ``list``
+          :param ranges: The CIDR ranges.
+
+          :type cache_dir: ``str``
+          :param cache_dir: The directory of the compiled ranges cache, e.g. CidrRanges.CACHE_DIR. By default the
+            ranges are not cached.
+
+          :type cache_size: ``int``
+          :param cache_size: The number of range lists kept in the cache, the least recently used are removed.
+
+          :return: The compiled ranges.
+          :rtype: ``CidrRanges``
+        """
+        if not cache_dir:
+            return cls(ranges)
+        key = hashlib.sha256('\n'.join(ranges).encode('utf-8')).hexdigest()
+        cache_path = os.path.join(cache_dir, key + '.json')
+        families = (socket.AF_INET, socket.AF_INET6)
+        try:
+            with open(cache_path, 'r') as cache_file:
+                intervals = json.load(cache_file)
+            if not isinstance(intervals, list) or len(intervals) != 2 * len(families) \
+                    or not all(isinstance(values, list) for values in intervals):
+                raise ValueError('unexpected content')
+            os.utime(cache_path, None)
+            cached_ranges = cls.__new__(cls)
+            cached_ranges.starts = dict(zip(families, intervals[::2]))
+            cached_ranges.ends = dict(zip(families, intervals[1::2]))
+            return cached_ranges
+        except (IOError, OSError):
+            # not cached yet
+            pass
+        except ValueError as e:
+            demisto.debug('Ignoring the invalid CIDR ranges cache {}: {}'.format(cache_path, e))
+
+        cidr_ranges = cls(ranges)
+        try:
+            if not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir, 0o700)
+            # written under a temporary name, so a concurrent run never loads a partially written file
+            tmp_path = '{}.{}.tmp'.format(cache_path, os.getpid())
+            with open(tmp_path, 'w') as cache_file:
+                json.dump([values for family in families
+                           for values in (cidr_ranges.starts[family], cidr_ranges.ends[family])], cache_file)
+            os.rename(tmp_path, cache_path)
+            cache_paths = sorted((os.path.join(cache_dir, name) for name in os.listdir(cache_dir)
+                                  if name.endswith('.json')), key=os.path.getmtime, reverse=True)
+            for old_path in cache_paths[cache_size:]:
+                os.remove(old_path)
+        except (IOError, OSError) as e:
+            demisto.debug('Failed caching the CIDR ranges: {}'.format(e))
+        return cidr_ranges
+
+    def __contains__(self, address):
+        family, ip = CidrRanges.parse_address(address)
+        i = bisect.bisect_right(self.starts[family], ip) - 1
+        return i >= 0 and ip <= self.ends[family][i]
+
+    def filter(self, addresses):
+        """
+          Returns the addresses which are in the ranges.
+
+          :type addresses: ``list``
+          :param addresses: The IPv4 or IPv6 addresses.
+
+          :return: The addresses in the ranges, in their original order.
+          :rtype: ``list``
+        """
+        return [address for address in addresses if address in self]
+
+
 def return_outputs(readable_output, outputs=None, raw_response=None):
     """
     This function wraps the demisto.results(), makes the usage of returning results to the user more intuitively.
@@ -2316,6 +2701,123 @@ H || val.SSDeep && val.SSDeep == obj.SSDeep)': {'Malicious': {'Vendor': 'Vendor'
                                .format(indicator_type, INDICATOR_TYPE_TO_CONTEXT_KEY.keys()))
 
 
+class RateLimiter(object):
+    """
+      A thread safe token bucket rate limiter: allows bursts of up to ``burst`` calls, refilled at ``rate`` calls
+      per second. use acquire() before each call to wait until the call is allowed.
+
+      :type rate: ``float``
+      :param rate: The number of calls allowed per second.
+
+      :type burst: ``int``
+      :param burst: The maximal number of calls allowed at once. If None, will use the rate (minimum 1).
+
+      :return: No data returned
+      :rtype: ``None``
+    """
+
+    def __init__(self, rate, burst=None):
+        if rate <= 0:
+            raise ValueError('Rate limit must be a positive number, got: {}'.format(rate))
+        self.rate = float(rate)
+        self.capacity = float(burst if burst else max(rate, 1))
+        self.tokens = self.capacity
+        self.last_refill = time.time()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """
+          Takes a token from the bucket, waiting for it to be refilled if it is empty.
+
+          :return: The time waited in seconds.
+          :rtype: ``float``
+        """
+        with self.lock:
+            now = time.time()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            self.tokens -= 1
+            # a negative balance is the debt this call waits for, it is refilled before any later call is allowed
+            wait_time = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait_time:
+            time.sleep(wait_time)
+        return wait_time
+
+
+class TTLCache(object):
+    """
+      A thread safe in memory LRU cache whose entries expire after a time to live.
+
+      :type max_size: ``int``
+      :param max_size: The maximal number of entries, the least recently used entry is removed when it is exceeded.
+
+      :type ttl: ``float``
+      :param ttl: The number of seconds an entry is kept.
+
+      :return: No data returned
+      :rtype: ``None``
+    """
+
+    def __init__(self, max_size=128, ttl=60):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries = OrderedDict()  # type: OrderedDict
+        self.lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+          Gets a value from the cache.
+
+          :type key: ``object``
+          :param key: The hashable key of the entry.
+
+          :type default: ``object``
+          :param default: The value to return if the key is missing or expired.
+
+          :return: The cached value
+          :rtype: ``object``
+        """
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry is None or entry[0] < time.time():
+                return default
+            # re-insert to mark as the most recently used
+            self.entries[key] = entry
+            return entry[1]
+
+    def set(self, key, value):
+        """
+          Sets a value in the cache.
+
+          :type key: ``object``
+          :param key: The hashable key of the entry.
+
+          :type value: ``object``
+          :param value: The value to cache.
+
+          :return: No data returned
+          :rtype: ``None``
+        """
+        with self.lock:
+            self.entries.pop(key, None)
+            self.entries[key] = (time.time() + self.ttl, value)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        """
+          Removes all the entries from the cache.
+
+          :return: No data returned
+          :rtype: ``None``
+        """
+        with self.lock:
+            self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+
 # Will add only if 'requests' module imported
 if 'requests' in sys.modules:
     class BaseClient(object):
@@ -2344,11 +2846,49 @@ if 'requests' in sys.modules:
             The request authorization, for example: (username, password).
             Can be None.
 
+        :type retries: ``int``
+        :param retries:
+            The number of times to retry a request that failed on a connection error or returned one of the
+            status_list_to_retry codes. Default is 0 (no retries).
+
+        :type status_list_to_retry: ``tuple``
+        :param status_list_to_retry: The response status codes to retry on, for example: (429, 500, 502, 503, 504).
+
+        :type backoff_factor: ``float``
+        :param backoff_factor:
+            The exponential backoff base in seconds - retry N waits a random time of up to
+            backoff_factor * 2 ** N seconds, or the time in the Retry-After header of the response if it has one.
+
+        :type max_backoff: ``float``
+        :param max_backoff: The maximal time in seconds to wait before a retry.
+
+        :type rate_limit: ``float``
+        :param rate_limit: The maximal number of requests per second the client sends. If None, no limit is applied.
+
+        :type rate_limit_burst: ``int``
+        :param rate_limit_burst: The number of requests allowed at once within the rate limit.
+
+        :type cache_ttl: ``float``
+        :param cache_ttl:
+            The number of seconds to cache the responses of GET requests for, so an identical request made within
+            that time is not sent again. Only requests with the json, text or content resp_type are cached.
+            Default is 0 (no caching).
+
+        :type cache_size: ``int``
+        :param cache_size: The maximal number of cached responses.
+
         :return: No data returned
         :rtype: ``None``
         """
 
-        def __init__(self, base_url, verify=True, proxy=False, ok_codes=tuple(), headers=None, auth=None):
+        RETRY_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+        CACHE_METHODS = frozenset(['GET', 'HEAD'])
+        # the cached response is parsed again on each hit, the response object itself is never returned from the cache
+        CACHE_RESP_TYPES = frozenset(['json', 'text', 'content'])
+
+        def __init__(self, base_url, verify=True, proxy=False, ok_codes=tuple(), headers=None, auth=None,
+                     retries=0, status_list_to_retry=(429, 500, 502, 503, 504), backoff_factor=1, max_backoff=60,
+                     rate_limit=None, rate_limit_burst=None, cache_ttl=0, cache_size=128):
             self._base_url = base_url
             self._verify = verify
             self._ok_codes = ok_codes
@@ -2357,6 +2897,12 @@ if 'requests' in sys.modules:
             self._session = requests.Session()
             if not proxy:
                 self._session.trust_env = False
+            self._retries = retries
+            self._status_list_to_retry = status_list_to_retry
+            self._backoff_factor = backoff_factor
+            self._max_backoff = max_backoff
+            self._rate_limiter = RateLimiter(rate_limit, rate_limit_burst) if rate_limit else None
+            self._cache = TTLCache(cache_size, cache_ttl) if cache_ttl else None
 
         def _http_request(self, method, url_suffix, full_url=None, headers=None,
                           auth=None, json_data=None, params=None, data=None, files=None,
@@ -2420,20 +2966,46 @@ if 'requests' in sys.modules:
                 address = full_url if full_url else urljoin(self._base_url, url_suffix)
                 headers = headers if headers else self._headers
                 auth = auth if auth else self._auth
-                # Execute
-                res = self._session.request(
-                    method,
-                    address,
-                    verify=self._verify,
-                    params=params,
-                    data=data,
-                    json=json_data,
-                    files=files,
-                    headers=headers,
-                    auth=auth,
-                    timeout=timeout,
-                    **kwargs
-                )
+                cache_key = None
+                res = None
+                resp_type = resp_type.lower()
+                if self._cache is not None and method.upper() in self.CACHE_METHODS and not files \
+                        and resp_type in self.CACHE_RESP_TYPES:
+                    cache_key = self._get_cache_key(method, address, headers, auth, params, data, json_data, kwargs)
+                    res = self._cache.get(cache_key) if cache_key is not None else None
+                retry = 0
+                while res is None:
+                    if self._rate_limiter:
+                        self._rate_limiter.acquire()
+                    # Execute
+                    try:
+                        res = self._session.request(
+                            method,
+                            address,
+                            verify=self._verify,
+                            params=params,
+                            data=data,
+                            json=json_data,
+                            files=files,
+                            headers=headers,
+                            auth=auth,
+                            timeout=timeout,
+                            **kwargs
+                        )
+                    except (requests.exceptions.SSLError, requests.exceptions.ProxyError):
+                        raise
+                    except requests.exceptions.ConnectionError:
+                        if retry >= self._retries or method.upper() not in self.RETRY_METHODS:
+                            raise
+                    else:
+                        if not self._should_retry(res, method, retry):
+                            break
+                    time.sleep(self._get_retry_delay(retry, res))
+                    if res is not None:
+                        # release the connection back to the pool
+                        res.close()
+                    res = None
+                    retry += 1
                 # Handle error responses gracefully
                 if not self._is_status_code_valid(res, ok_codes):
                     err_msg = 'Error in API call [{}] - {}' \
@@ -2446,7 +3018,8 @@ if 'requests' in sys.modules:
                     except ValueError as exception:
                         raise DemistoException(err_msg, exception)
 
-                resp_type = resp_type.lower()
+                if cache_key is not None:
+                    self._cache.set(cache_key, res)  # type: ignore
                 try:
                     if resp_type == 'json':
                         return res.json()
@@ -2482,6 +3055,63 @@ if 'requests' in sys.modules:
                     .format(err_type, exception.errno, exception.strerror)
                 raise DemistoException(err_msg, exception)
 
+        def _should_retry(self, response, method, retry):
+            """If the request should be sent again, return 'True'.
+            Requests which are not idempotent are retried only if they were rejected by a 429 response.
+
+            :type response: ``requests.Response``
+            :param response: Response from API after the request.
+
+            :type method: ``str``
+            :param method: The HTTP method of the request.
+
+            :type retry: ``int``
+            :param retry: The number of times the request was already retried.
+
+            :return: Whether to retry the request.
+            :rtype: ``bool``
+            """
+            if retry >= self._retries or response.status_code not in self._status_list_to_retry:
+                return False
+            return response.status_code == 429 or method.upper() in self.RETRY_METHODS
+
+        def _get_retry_delay(self, retry, response=None):
+            """Gets the time to wait before a retry - the Retry-After time of the response if it has one,
+            otherwise an exponential backoff with full jitter, capped by max_backoff.
+
+            :type retry: ``int``
+            :param retry: The number of times the request was already retried.
+
+            :type response: ``requests.Response``
+            :param response: Response from API after the request, None if the request failed on a connection error.
+
+            :return: The time to wait in seconds.
+            :rtype: ``float``
+            """
+            retry_after = response.headers.get('Retry-After') if response is not None else None
+            if retry_after:
+                try:
+                    delay = float(retry_after)
+                except ValueError:
+                    # HTTP date format, e.g. Wed, 21 Oct 2015 07:28:00 GMT
+                    retry_date = parsedate_tz(retry_after)
+                    delay = mktime_tz(retry_date) - time.time() if retry_date else 0
+                return min(max(delay, 0), self._max_backoff)
+            return random.uniform(0, min(self._max_backoff, self._backoff_factor * 2 ** retry))
+
+        @staticmethod
+        def _get_cache_key(method, address, headers, auth, params, data, json_data, kwargs):
+            """Gets the key of a request in the response cache - identical requests have the same key.
+
+            :return: The cache key, None if the request can not be cached.
+            :rtype: ``str``
+            """
+            try:
+                return json.dumps([method.upper(), address, headers, auth, params, data, json_data, kwargs],
+                                  sort_keys=True, default=str)
+            except (TypeError, ValueError):
+                return None
+
         def _is_status_code_valid(self, response, ok_codes=None):
             """If the status code is OK, return 'True'.
 
@@ -2525,3 +3155,37 @@ def batch(iterable, batch_size=1):
         yield current_batch
         current_batch = not_batched[:batch_size]
         not_batched = not_batched[batch_size:]
+
+
+def get_incidents_contexts(incident_ids, concurrency=1):
+    """
+    Gets the context of every incident, with at most concurrency getContext commands running at a time.
+    There is no batch getContext command, so a concurrency above 1 calls demisto.executeCommand from several
+    threads at once. This assumes executeCommand is thread-safe in the running server, keep the default of 1
+    when it is not.
+
+    :type incident_ids: ``list``
+    :param incident_ids: The ids of the incidents
+
+    :type concurrency: ``int``
+    :param concurrency: The maximal number of concurrent getContext commands
+
+    :return: The contexts, in the order of incident_ids. An incident whose context could not be read gets ``{}``
+    :rtype: ``list``
+    """
+    def get_incident_context(incident_id):
+        res = demisto.executeCommand('getContext', {'id': incident_id})
+        try:
+            return res[0]['Contents'].get('context') or {}
+        except Exception:
+            return {}
+
+    if concurrency <= 1 or len(incident_ids) <= 1:
+        return [get_incident_context(incident_id) for incident_id in incident_ids]
+    from multiprocessing.pool import ThreadPool
+    pool = ThreadPool(min(concurrency, len(incident_ids)))
+    try:
+        return pool.map(get_incident_context, incident_ids)
+    finally:
+        pool.close()
+        pool.join()
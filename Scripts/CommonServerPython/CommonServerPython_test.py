@@ -5,15 +5,22 @@ import json
 import re
 import os
 import sys
+import threading
 import requests
 from pytest import raises, mark
 import pytest
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer  # type: ignore
+    from SocketServer import ThreadingMixIn  # type: ignore
 from CommonServerPython import xml2json, json2xml, entryTypes, formats, tableToMarkdown, underscoreToCamelCase, \
     flattenCell, date_to_timestamp, datetime, camelize, pascalToSpace, argToList, \
     remove_nulls_from_dictionary, is_error, get_error, hash_djb2, fileResult, is_ip_valid, get_demisto_version, \
     IntegrationLogger, parse_date_string, IS_PY3, DebugLogger, b64_encode, parse_date_range, return_outputs, \
     argToBoolean, ipv4Regex, ipv4cidrRegex, ipv6cidrRegex, ipv6Regex, batch, FeedIndicatorType, \
-    encode_string_results
+    encode_string_results, get_incidents_contexts
 
 try:
     from StringIO import StringIO
@@ -54,6 +61,51 @@ def test_xml():
     assert xmlActual == xml, "expected:\n{}\nto equal:\n{}".format(xml, xmlActual)
 
 
+XML_DOCUMENTS = [
+    b"<work><employee><id>100</id><name>foo</name></employee><employee><id>200</id><name>goo</name></employee></work>",
+    b'<?xml version="1.0" encoding="UTF-8"?><response status="success"><result total-count="2" count="2">'
+    b'<entry name="a1" loc="vsys1"><ip-netmask>1.1.1.1</ip-netmask><tag><member>t1</member><member>t2</member></tag>'
+    b'</entry>\n  <entry name="a2"><fqdn>example.com</fqdn></entry></result></response>',
+    b'<root xmlns="http://example.com/ns" xmlns:x="http://example.com/x"><x:item x:id="1">text<b>bold</b>tail text'
+    b'</x:item><empty/><empty attr="v"/><mixed a="1">  padded  </mixed></root>',
+    u'<root><name>\u05e9\u05dc\u05d5\u05dd</name></root>'.encode('utf-8'),
+]
+
+
+@pytest.mark.parametrize('xml', XML_DOCUMENTS, ids=['list', 'attributes', 'namespaces', 'unicode'])
+@pytest.mark.parametrize('strip_ns, strip', [(1, 1), (0, 0)])
+def test_xml2dict(xml, strip_ns, strip):
+    from CommonServerPython import xml2dict
+    expected = json.loads(xml2json(xml, strip_ns=strip_ns, strip=strip))
+    assert xml2dict(xml, strip_ns=strip_ns, strip=strip) == expected
+    assert xml2dict(xml.decode('utf-8'), strip_ns=strip_ns, strip=strip) == expected
+
+
+def test_xml2dict_deep_document():
+    from CommonServerPython import xml2dict
+    depth = 5000
+    level = xml2dict('<root>' + '<level>' * depth + 'deep' + '</level>' * depth + '</root>')['root']
+    for _ in range(depth - 1):
+        level = level['level']
+        assert list(level.keys()) == ['level']
+    assert level['level'] == 'deep'
+
+
+def test_xml2dict_items():
+    from CommonServerPython import xml2dict, iter_xml_items
+    from io import BytesIO
+    xml = XML_DOCUMENTS[1]
+    entries = []
+    response = xml2dict(xml, item_tag='entry', callback=entries.append)
+    assert response == {'response': {'@status': 'success', 'result': {'@total-count': '2', '@count': '2'}}}
+    assert entries == [
+        {'entry': {'@name': 'a1', '@loc': 'vsys1', 'ip-netmask': '1.1.1.1', 'tag': {'member': ['t1', 't2']}}},
+        {'entry': {'@name': 'a2', 'fqdn': 'example.com'}}
+    ]
+    assert list(iter_xml_items(BytesIO(xml), 'entry')) == entries
+    assert list(iter_xml_items(xml, 'member')) == [{'member': 't1'}, {'member': 't2'}]
+
+
 def toEntry(table):
     return {
 
@@ -331,6 +383,42 @@ def test_tbl_to_md_header_with_special_character():
     assert table_with_character == expected_string_with_special_character
 
 
+def test_tbl_to_md_max_rows():
+    table_truncated = tableToMarkdown('tableToMarkdown test with max rows', DATA, max_rows=2)
+    expected_table_truncated = '''### tableToMarkdown test with max rows
+|header_1|header_2|header_3|
+|---|---|---|
+| a1 | b1 | c1 |
+| a2 | b2 | c2 |
+
+**Showing 2 of 3 rows, 1 rows were truncated.**
+'''
+    assert table_truncated == expected_table_truncated
+    assert tableToMarkdown('tableToMarkdown test', DATA, max_rows=3) == tableToMarkdown('tableToMarkdown test', DATA)
+
+
+def test_tbl_to_md_remove_null_column_found_late():
+    data = [{'a': 'x', 'b': None, 'c': ''} for _ in range(3)] + [{'a': 'y', 'b': 'late', 'c': []}]
+    table = tableToMarkdown('tableToMarkdown test remove null', data, headers=['c', 'b', 'a'], removeNull=True)
+    expected_table = '''### tableToMarkdown test remove null
+|b|a|
+|---|---|
+|  | x |
+|  | x |
+|  | x |
+| late | y |
+'''
+    assert table == expected_table
+
+
+@pytest.mark.parametrize('text', ['no escapes', 'a|b', 'line1\r\nline2\rline3\nline4', '\n\r|\r\n\n', u'\xe2|\n'])
+def test_escape_markdown_table_cell(text):
+    from CommonServerPython import escapeMarkdownTableCell, stringEscapeMD
+    expected = text.replace('\r\n', '<br>').replace('\r', '<br>').replace('\n', '<br>').replace('|', '\\|')
+    assert escapeMarkdownTableCell(text) == expected
+    assert stringEscapeMD(text, True, True) == expected
+
+
 def test_flatten_cell():
     # sanity
     utf8_to_flatten = b'abcdefghijklmnopqrstuvwxyz1234567890!'.decode('utf8')
@@ -581,6 +669,25 @@ def test_logger_replace_strs(mocker):
     assert ilog.messages[0] == '<XX_REPLACED> is <XX_REPLACED> and b64: <XX_REPLACED>'
 
 
+def test_logger_replace_strs_longest_first(mocker):
+    mocker.patch.object(demisto, 'params', return_value={})
+    ilog = IntegrationLogger()
+    ilog.add_replace_strs('abc', 'abcdef', 'a.c')
+    ilog('abcdefg abcd abc aXc a.c')
+    # strings added after the first log line are replaced as well
+    ilog.add_replace_strs('g')
+    ilog('abcdefg')
+    assert ilog.messages == ['<XX_REPLACED>g <XX_REPLACED>d <XX_REPLACED> aXc <XX_REPLACED>',
+                             '<XX_REPLACED><XX_REPLACED>']
+
+
+def test_logger_replace_long_str(mocker):
+    mocker.patch.object(demisto, 'params', return_value={'private_key': 'key' * 5000})
+    ilog = IntegrationLogger()
+    ilog('private key: ' + 'key' * 5000)
+    assert ilog.messages == ['private key: <XX_REPLACED>']
+
+
 def test_is_mac_address():
     from CommonServerPython import is_mac_address
 
@@ -909,6 +1016,267 @@ class TestBaseClient:
         assert not self.client._is_status_code_valid(response)
 
 
+class FakeServerHandler(BaseHTTPRequestHandler):
+    """Replies to each request with the next queued (status code, headers, body) response"""
+    protocol_version = 'HTTP/1.1'
+    responses = []  # type: list
+    requests = []  # type: list
+
+    def do_GET(self):
+        FakeServerHandler.requests.append((self.command, self.path))
+        status_code, headers, body = FakeServerHandler.responses.pop(0) if FakeServerHandler.responses \
+            else (200, {}, '{"status": "ok"}')
+        self.send_response(status_code)
+        for header, value in headers.items():
+            self.send_header(header, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body.encode('utf-8'))
+
+    do_POST = do_GET
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def fake_server():
+    server = FakeServer(('127.0.0.1', 0), FakeServerHandler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05})
+    thread.daemon = True
+    thread.start()
+    FakeServerHandler.responses = []
+    FakeServerHandler.requests = []
+    yield 'http://127.0.0.1:{}/api/'.format(server.server_port)
+    server.shutdown()
+    server.server_close()
+
+
+class TestBaseClientRetries:
+    def test_retry_on_status(self, fake_server, mocker):
+        from CommonServerPython import BaseClient
+        mocker.patch('CommonServerPython.time.sleep')
+        FakeServerHandler.responses = [(503, {}, ''), (502, {}, '')]
+        client = BaseClient(fake_server, retries=2)
+        assert client._http_request('GET', 'event') == {'status': 'ok'}
+        assert len(FakeServerHandler.requests) == 3
+
+    def test_retries_exhausted(self, fake_server, mocker):
+        from CommonServerPython import BaseClient, DemistoException
+        mocker.patch('CommonServerPython.time.sleep')
+        FakeServerHandler.responses = [(500, {}, '')] * 3
+        client = BaseClient(fake_server, retries=1)
+        with raises(DemistoException, match=r'\[500\]'):
+            client._http_request('GET', 'event')
+        assert len(FakeServerHandler.requests) == 2
+
+    def test_no_retry_by_default(self, fake_server):
+        from CommonServerPython import BaseClient, DemistoException
+        FakeServerHandler.responses = [(503, {}, '')]
+        with raises(DemistoException, match=r'\[503\]'):
+            BaseClient(fake_server)._http_request('GET', 'event')
+        assert len(FakeServerHandler.requests) == 1
+
+    def test_post_retried_only_on_429(self, fake_server, mocker):
+        from CommonServerPython import BaseClient, DemistoException
+        mocker.patch('CommonServerPython.time.sleep')
+        client = BaseClient(fake_server, retries=3)
+        FakeServerHandler.responses = [(429, {}, '')]
+        assert client._http_request('POST', 'event') == {'status': 'ok'}
+        FakeServerHandler.responses = [(503, {}, '')]
+        with raises(DemistoException, match=r'\[503\]'):
+            client._http_request('POST', 'event')
+        assert len(FakeServerHandler.requests) == 3
+
+    def test_retry_after(self, fake_server, mocker):
+        from CommonServerPython import BaseClient
+        sleep = mocker.patch('CommonServerPython.time.sleep')
+        FakeServerHandler.responses = [(429, {'Retry-After': '7'}, ''), (429, {'Retry-After': '120'}, '')]
+        client = BaseClient(fake_server, retries=2, max_backoff=30)
+        client._http_request('GET', 'event')
+        assert [call[0][0] for call in sleep.call_args_list] == [7, 30]
+
+    def test_retry_after_date(self, mocker):
+        from CommonServerPython import BaseClient
+        from email.utils import formatdate
+        mocker.patch('CommonServerPython.time.time', return_value=1000000000)
+        response = requests.Response()
+        response.headers['Retry-After'] = formatdate(1000000010, usegmt=True)
+        assert BaseClient('http://example.com/')._get_retry_delay(0, response) == 10
+
+    def test_exponential_backoff(self, mocker):
+        from CommonServerPython import BaseClient
+        uniform = mocker.patch('CommonServerPython.random.uniform', side_effect=lambda low, high: high)
+        client = BaseClient('http://example.com/', backoff_factor=0.5, max_backoff=3)
+        assert [client._get_retry_delay(retry) for retry in range(4)] == [0.5, 1, 2, 3]
+        assert uniform.call_count == 4
+
+    def test_retry_on_connection_error(self, fake_server, mocker):
+        from CommonServerPython import BaseClient
+        mocker.patch('CommonServerPython.time.sleep')
+        client = BaseClient(fake_server, retries=1)
+        send = client._session.send
+        calls = []
+
+        def reset_once(*args, **kwargs):
+            calls.append(args)
+            if len(calls) == 1:
+                raise requests.exceptions.ConnectionError('Connection reset by peer')
+            return send(*args, **kwargs)
+
+        mocker.patch.object(client._session, 'send', side_effect=reset_once)
+        assert client._http_request('GET', 'event') == {'status': 'ok'}
+        assert len(calls) == 2
+
+    def test_response_cache(self, fake_server):
+        from CommonServerPython import BaseClient
+        FakeServerHandler.responses = [(200, {}, '{"id": 1}'), (200, {}, '{"id": 2}'), (200, {}, '{"id": 3}')]
+        client = BaseClient(fake_server, cache_ttl=60)
+        first = client._http_request('GET', 'event', params={'q': 'a'})
+        first['changed'] = True
+        assert client._http_request('GET', 'event', params={'q': 'a'}) == {'id': 1}
+        assert client._http_request('GET', 'event', params={'q': 'b'}) == {'id': 2}
+        assert client._http_request('POST', 'event', params={'q': 'a'}) == {'id': 3}
+        assert len(FakeServerHandler.requests) == 3
+
+    def test_response_cache_resp_type(self, fake_server):
+        from CommonServerPython import BaseClient
+        FakeServerHandler.responses = [(200, {}, '{"id": 1}'), (200, {}, '{"id": 2}'), (200, {}, '{"id": 3}')]
+        client = BaseClient(fake_server, cache_ttl=60)
+        assert client._http_request('GET', 'event', resp_type='text') == '{"id": 1}'
+        assert client._http_request('GET', 'event', resp_type='content') == b'{"id": 1}'
+        # response objects are not shared between callers, so they are neither cached nor returned from the cache
+        first = client._http_request('GET', 'event', resp_type='response')
+        second = client._http_request('GET', 'event', resp_type='response')
+        assert first is not second
+        assert (first.json(), second.json()) == ({'id': 2}, {'id': 3})
+        assert len(FakeServerHandler.requests) == 3
+
+    def test_rate_limit(self, fake_server, mocker):
+        from CommonServerPython import BaseClient
+        sleep = mocker.patch('CommonServerPython.time.sleep')
+        mocker.patch('CommonServerPython.time.time', return_value=1000.0)
+        client = BaseClient(fake_server, rate_limit=2, rate_limit_burst=2)
+        for _ in range(4):
+            client._http_request('GET', 'event')
+        assert [call[0][0] for call in sleep.call_args_list] == [0.5, 1]
+
+
+def test_ttl_cache(mocker):
+    from CommonServerPython import TTLCache
+    now = mocker.patch('CommonServerPython.time.time', return_value=100)
+    cache = TTLCache(max_size=2, ttl=10)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+    # 'b' is the least recently used entry
+    assert cache.get('b') is None
+    assert len(cache) == 2
+    now.return_value = 111
+    assert cache.get('a', 'expired') == 'expired'
+
+
+CIDR_RANGES = ['10.0.0.0/8', '10.1.2.3/16', '192.168.1.1', '192.168.1.0/31', '2001:db8::/32']
+
+
+@pytest.mark.parametrize('address, expected', [
+    ('10.255.255.255', True),
+    ('11.0.0.0', False),
+    ('192.168.1.1', True),
+    ('192.168.1.0', True),
+    ('192.168.1.2', False),
+    ('2001:db8:ffff::1', True),
+    ('2001:db9::', False),
+    # an IPv4 mapped IPv6 address is not in the IPv4 ranges
+    ('::ffff:10.0.0.1', False),
+    ('0.0.0.0', False),
+])
+def test_cidr_ranges(address, expected):
+    from CommonServerPython import CidrRanges
+    assert (address in CidrRanges(CIDR_RANGES)) is expected
+
+
+def test_cidr_ranges_merge_and_filter():
+    from CommonServerPython import CidrRanges
+    import socket
+    cidr_ranges = CidrRanges(CIDR_RANGES)
+    # 10.1.0.0/16 is in 10.0.0.0/8, and 192.168.1.1 is adjacent to 192.168.1.0/31
+    assert len(cidr_ranges.starts[socket.AF_INET]) == 2
+    assert cidr_ranges.filter(['10.0.0.1', '1.1.1.1', '2001:db8::', '10.0.0.1']) == ['10.0.0.1', '2001:db8::', '10.0.0.1']
+    with raises(ValueError):
+        CidrRanges(['10.0.0.0/33'])
+    with raises(ValueError):
+        cidr_ranges.filter(['10.0.0'])
+
+
+@pytest.mark.parametrize('cidr, expected', [
+    ('10.0.0.0/255.0.0.0', '10.0.0.0/8'),
+    ('10.1.2.3/255.255.255.0', '10.1.2.0/24'),
+    ('10.0.0.0/0.0.255.255', '10.0.0.0/16'),
+    ('10.0.0.0/0.0.0.0', '0.0.0.0/0'),
+    ('10.0.0.1/255.255.255.255', '10.0.0.1/32'),
+])
+def test_cidr_ranges_netmask(cidr, expected):
+    from CommonServerPython import CidrRanges
+    cidr_ranges = CidrRanges([cidr])
+    expected_ranges = CidrRanges([expected])
+    assert (cidr_ranges.starts, cidr_ranges.ends) == (expected_ranges.starts, expected_ranges.ends)
+
+
+@pytest.mark.parametrize('cidr', ['10.0.0.0/255.0.255.0', '10.0.0.0/-1', '2001:db8::/ffff::', '10.0.0.0/ffff::'])
+def test_cidr_ranges_invalid_mask(cidr):
+    from CommonServerPython import CidrRanges
+    with raises(ValueError):
+        CidrRanges([cidr])
+
+
+def test_cidr_ranges_cache(mocker, tmpdir):
+    from CommonServerPython import CidrRanges
+    import socket
+    # the ranges are cached only when a cache directory is given
+    mocker.patch.object(CidrRanges, 'CACHE_DIR', str(tmpdir.join('default')))
+    CidrRanges.load(CIDR_RANGES)
+    assert not tmpdir.listdir()
+
+    cidr_ranges = CidrRanges.load(CIDR_RANGES, cache_dir=str(tmpdir))
+    cache_files = tmpdir.listdir()
+    assert len(cache_files) == 1
+    # the intervals are cached as JSON lists of integers
+    assert json.loads(cache_files[0].read())[:2] == [cidr_ranges.starts[socket.AF_INET], cidr_ranges.ends[socket.AF_INET]]
+    # the second load does not parse the ranges again
+    mocker.patch.object(CidrRanges, 'parse_address', side_effect=AssertionError('parsed again'))
+    cached_ranges = CidrRanges.load(CIDR_RANGES, cache_dir=str(tmpdir))
+    assert (cached_ranges.starts, cached_ranges.ends) == (cidr_ranges.starts, cidr_ranges.ends)
+
+
+def test_cidr_ranges_cache_invalid(tmpdir):
+    from CommonServerPython import CidrRanges
+    cidr_ranges = CidrRanges.load(CIDR_RANGES, cache_dir=str(tmpdir))
+    cache_file = tmpdir.listdir()[0]
+    cache_file.write('[1, 2')
+    # an invalid cache file is compiled again and replaced
+    cached_ranges = CidrRanges.load(CIDR_RANGES, cache_dir=str(tmpdir))
+    assert (cached_ranges.starts, cached_ranges.ends) == (cidr_ranges.starts, cidr_ranges.ends)
+    assert json.loads(cache_file.read())
+
+
+def test_cidr_ranges_cache_size(tmpdir):
+    from CommonServerPython import CidrRanges
+    import hashlib
+    for i in range(4):
+        for cache_file in tmpdir.listdir():
+            os.utime(cache_file.strpath, (cache_file.mtime() - 10, cache_file.mtime() - 10))
+        CidrRanges.load(['10.0.0.{}'.format(i)], cache_dir=str(tmpdir), cache_size=2)
+    # the least recently used range lists are removed
+    assert len(tmpdir.listdir()) == 2
+    assert tmpdir.join(hashlib.sha256(b'10.0.0.3').hexdigest() + '.json').check()
+
+
 def test_parse_date_string():
     # test unconverted data remains: Z
     assert parse_date_string('2019-09-17T06:16:39Z') == datetime(2019, 9, 17, 6, 16, 39)
@@ -1058,6 +1426,25 @@ def test_batch(iterable, sz, expected):
         assert expected[i] == item
 
 
+@pytest.mark.parametrize('concurrency', [1, 3])
+def test_get_incidents_contexts(mocker, concurrency):
+    """
+    Given: incidents, one of them without a context and one whose getContext command fails
+    When: getting their contexts, serially and concurrently
+    Then: the contexts are returned in the order of the ids, with {} for the missing ones
+    """
+    contexts = {'1': {'a': 1}, '2': None, '4': {'b': 2}}
+
+    def execute_command(command, args):
+        if args['id'] == '3':
+            return [{'Type': entryTypes['error'], 'Contents': 'failed'}]
+        return [{'Type': entryTypes['note'], 'Contents': {'context': contexts[args['id']]}}]
+
+    mocker.patch.object(demisto, 'executeCommand', side_effect=execute_command)
+    assert get_incidents_contexts(['1', '2', '3', '4'], concurrency) == [{'a': 1}, {}, {}, {'b': 2}]
+    assert demisto.executeCommand.call_count == 4
+
+
 regexes_test = [
     (ipv4Regex, '192.168.1.1', True),
     (ipv4Regex, '192.168.a.1', False),
@@ -0,0 +1,90 @@
+"""
+Benchmark of CidrRanges - compares testing every address against every netaddr IPNetwork (as IsInCidrRanges and
+IPv4Whitelist did) against the compiled ranges, over 50k generated IPv4 and IPv6 ranges and 100k addresses, and
+verifies they find the same addresses.
+The netaddr loop is measured on a sample of the addresses, as it takes hours over all of them.
+
+Run from the CommonServerPython directory (next to demistomock.py), with Python 3 and netaddr:
+    python test_data/cidr_ranges_benchmark.py
+"""
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from netaddr import IPAddress, IPNetwork
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from CommonServerPython import CidrRanges  # noqa: E402
+
+RANGES = 50000
+ADDRESSES = 100000
+NETADDR_SAMPLE = 20
+
+
+def random_ipv4():
+    return '.'.join(str(random.randint(0, 255)) for _ in range(4))
+
+
+def random_ipv6():
+    return '2001:db8:' + ':'.join('{:x}'.format(random.randint(0, 0xffff)) for _ in range(6))
+
+
+def build_ranges():
+    ranges = ['{}/{}'.format(random_ipv4(), random.randint(16, 32)) for _ in range(RANGES * 9 // 10)]
+    ranges += ['{}/{}'.format(random_ipv6(), random.randint(48, 128)) for _ in range(RANGES // 10)]
+    return ranges
+
+
+def build_addresses():
+    return [random_ipv4() if i % 10 else random_ipv6() for i in range(ADDRESSES)]
+
+
+def netaddr_filter(ranges, addresses):
+    included_addresses = []
+    for address in addresses:
+        ip = IPAddress(address)
+        for cidr_range in ranges:
+            if ip in IPNetwork(cidr_range):
+                included_addresses.append(address)
+                break
+    return included_addresses
+
+
+def main():
+    random.seed(0)
+    ranges = build_ranges()
+    addresses = build_addresses()
+    cache_dir = tempfile.mkdtemp()
+    try:
+        start = time.time()
+        cidr_ranges = CidrRanges.load(ranges, cache_dir=cache_dir)
+        compile_time = time.time() - start
+
+        start = time.time()
+        CidrRanges.load(ranges, cache_dir=cache_dir)
+        cached_load_time = time.time() - start
+    finally:
+        shutil.rmtree(cache_dir)
+
+    start = time.time()
+    included_addresses = cidr_ranges.filter(addresses)
+    filter_time = time.time() - start
+
+    sample = addresses[:NETADDR_SAMPLE]
+    start = time.time()
+    assert netaddr_filter(ranges, sample) == cidr_ranges.filter(sample)
+    netaddr_time = (time.time() - start) / NETADDR_SAMPLE * ADDRESSES
+
+    print('{} ranges, {} addresses, {} in the ranges'.format(RANGES, ADDRESSES, len(included_addresses)))
+    print('    netaddr loop:        {:.0f} s (extrapolated from {} addresses)'.format(netaddr_time, NETADDR_SAMPLE))
+    print('    compile ranges:      {:.3f} s'.format(compile_time))
+    print('    load cached ranges:  {:.3f} s'.format(cached_load_time))
+    print('    filter addresses:    {:.3f} s'.format(filter_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark of IntegrationLogger masking - compares replacing each secret in turn against the compiled single pass
+regex, with 50 secrets (each in plain and base64 form) over 100,000 log lines, and verifies both mask identically.
+
+Run from the CommonServerPython directory (next to demistomock.py):
+    python test_data/integration_logger_benchmark.py
+"""
+from __future__ import print_function
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import demistomock as demisto  # noqa: E402
+
+demisto.params = lambda: {}  # noqa: E731
+
+from CommonServerPython import IntegrationLogger, b64_encode  # noqa: E402
+
+SECRETS = 50
+LINES = 100000
+
+
+def legacy_encode(logger, message):
+    res = str(message)
+    for s in logger.replace_strs:
+        res = res.replace(s, '<XX_REPLACED>')
+    return res
+
+
+def build_lines(secrets):
+    random.seed(0)
+    lines = []
+    for i in range(LINES):
+        line = 'GET https://api.example.com/v1/indicators?page={}&limit=50 headers={{"Accept": "application/json"'.format(i)
+        if i % 10 == 0:
+            line += ', "Authorization": "Bearer {}"'.format(random.choice(secrets))
+        lines.append(line + '}} status=200 elapsed=0.{}s'.format(i % 1000))
+    return lines
+
+
+def main():
+    logger = IntegrationLogger()
+    secrets = ['secret-token-{:04d}-{}'.format(i, 'x' * (i % 7)) for i in range(SECRETS)]
+    for secret in secrets:
+        # plain and base64 forms, as added for the sensitive integration parameters
+        logger.add_replace_strs(secret, b64_encode(secret))
+    assert len(logger.replace_strs) == 2 * SECRETS
+    lines = build_lines(secrets + [b64_encode(s) for s in secrets])
+
+    start = time.time()
+    before = [legacy_encode(logger, line) for line in lines]
+    before_time = time.time() - start
+
+    start = time.time()
+    after = [logger.encode(line) for line in lines]
+    after_time = time.time() - start
+
+    assert before == after, 'Masked log lines differ'
+    print('{} secrets, {} log lines (identical masking)'.format(len(logger.replace_strs), LINES))
+    print('    before: {:.2f} s'.format(before_time))
+    print('    after:  {:.2f} s'.format(after_time))
+
+
+if __name__ == '__main__':
+    main()
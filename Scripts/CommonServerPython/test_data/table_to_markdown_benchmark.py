@@ -0,0 +1,119 @@
+"""
+Benchmark of tableToMarkdown - compares the previous string concatenation implementation against the current one
+over a 50,000 rows x 20 columns table, and verifies both render identical output.
+
+Run from the CommonServerPython directory (next to demistomock.py):
+    python test_data/table_to_markdown_benchmark.py
+"""
+from __future__ import print_function
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from CommonServerPython import tableToMarkdown, formatCell, stringEscapeMD, STRING_TYPES  # noqa: E402
+
+ROWS = 50000
+COLUMNS = 20
+
+
+def legacy_table_to_markdown(name, t, headers=None, headerTransform=None, removeNull=False, metadata=None):
+    mdResult = ''
+    if name:
+        mdResult = '### ' + name + '\n'
+
+    if metadata:
+        mdResult += metadata + '\n'
+
+    if not t or len(t) == 0:
+        mdResult += '**No entries.**\n'
+        return mdResult
+
+    if not isinstance(t, list):
+        t = [t]
+
+    if headers and isinstance(headers, STRING_TYPES):
+        headers = [headers]
+
+    if not headers:
+        headers = list(t[0].keys())
+        headers.sort()
+
+    if removeNull:
+        headers_aux = headers[:]
+        for header in headers_aux:
+            if all(obj.get(header) in ('', None, [], {}) for obj in t):
+                headers.remove(header)
+
+    if t and len(headers) > 0:
+        newHeaders = []
+        if headerTransform is None:
+            headerTransform = lambda s: s  # noqa
+        for header in headers:
+            newHeaders.append(headerTransform(header))
+        mdResult += '|'
+        if len(newHeaders) == 1:
+            mdResult += newHeaders[0]
+        else:
+            mdResult += '|'.join(newHeaders)
+        mdResult += '|\n'
+        sep = '---'
+        mdResult += '|' + '|'.join([sep] * len(headers)) + '|\n'
+        for entry in t:
+            vals = [stringEscapeMD((formatCell(entry.get(h, ''), False) if entry.get(h) is not None else ''),
+                                   True, True) for h in headers]
+            mdResult += '| '
+            try:
+                mdResult += ' | '.join(vals)
+            except UnicodeDecodeError:
+                vals = [str(v) for v in vals]
+                mdResult += ' | '.join(vals)
+            mdResult += ' |\n'
+
+    else:
+        mdResult += '**No entries.**\n'
+
+    return mdResult
+
+
+def build_table():
+    table = []
+    for row in range(ROWS):
+        entry = {}
+        for column in range(COLUMNS):
+            if column == COLUMNS - 1:
+                # an all empty column, removed with removeNull
+                entry['column_{:02d}'.format(column)] = None
+            elif column % 5 == 0:
+                entry['column_{:02d}'.format(column)] = 'line {}\r\nwith | pipe\n{}'.format(row, column)
+            elif column % 5 == 1:
+                entry['column_{:02d}'.format(column)] = ['item{}'.format(row), 'item{}'.format(column)]
+            elif column % 5 == 2:
+                entry['column_{:02d}'.format(column)] = row * column
+            else:
+                entry['column_{:02d}'.format(column)] = 'value {} {}'.format(row, column)
+        table.append(entry)
+    return table
+
+
+def measure(func, table, **kwargs):
+    start = time.time()
+    result = func('Benchmark', table, **kwargs)
+    return result, time.time() - start
+
+
+def main():
+    table = build_table()
+    for kwargs in ({}, {'removeNull': True}):
+        before, before_time = measure(legacy_table_to_markdown, table, **kwargs)
+        after, after_time = measure(tableToMarkdown, table, **kwargs)
+        assert before == after, 'Rendered tables differ'
+        print('{} rows x {} columns {} ({} characters, identical output)'.format(ROWS, COLUMNS, kwargs, len(after)))
+        print('    before: {:.2f} s'.format(before_time))
+        print('    after:  {:.2f} s'.format(after_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark of xml2dict - compares json.loads(xml2json(...)) against xml2dict and the item callback mode,
+over a generated multi MB XML API response, and verifies they return the same entries.
+
+Run from the CommonServerPython directory (next to demistomock.py), with Python 3:
+    python test_data/xml2dict_benchmark.py
+"""
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from CommonServerPython import xml2json, xml2dict  # noqa: E402
+
+ENTRIES = 50000
+RUNS = 3
+
+
+def build_response():
+    entries = []
+    for i in range(ENTRIES):
+        entries.append(
+            '<entry name="address-{0}" loc="vsys1"><ip-netmask>10.{1}.{2}.0/24</ip-netmask>'
+            '<description>Address object {0} &amp; friends</description>'
+            '<tag><member>tag-{3}</member><member>shared</member></tag></entry>'.format(i, i // 256 % 256, i % 256, i % 10)
+        )
+    return ('<response status="success"><result total-count="{0}" count="{0}">{1}</result></response>'
+            .format(ENTRIES, '\n'.join(entries))).encode('utf-8')
+
+
+def measure(func, xml):
+    elapsed = float('inf')
+    for _ in range(RUNS):
+        gc.collect()
+        start = time.time()
+        result = func(xml)
+        elapsed = min(elapsed, time.time() - start)
+        # keep a string to compare instead of the objects, so they do not slow down the garbage collection
+        result = json.dumps(result, sort_keys=True)
+    # measured separately, tracing the allocations slows down the run
+    tracemalloc.start()
+    func(xml)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak / 1024.0 / 1024
+
+
+def xml2json_loads(xml):
+    return json.loads(xml2json(xml))['response']['result']['entry']
+
+
+def xml2dict_entries(xml):
+    return xml2dict(xml)['response']['result']['entry']
+
+
+def xml2dict_callback(xml):
+    entries = []
+    xml2dict(xml, item_tag='entry', callback=lambda item: entries.append(item['entry']))
+    return entries
+
+
+def main():
+    xml = build_response()
+    print('{} entries, {:.1f} MB of XML'.format(ENTRIES, len(xml) / 1024.0 / 1024))
+    expected = None
+    for func in (xml2json_loads, xml2dict_entries, xml2dict_callback):
+        result, elapsed, peak = measure(func, xml)
+        expected = expected or result
+        assert result == expected, '{} returned different entries'.format(func.__name__)
+        print('    {:<20} {:.2f} s (best of {}), peak memory {:.1f} MB'.format(func.__name__, elapsed, RUNS, peak))
+
+
+if __name__ == '__main__':
+    main()
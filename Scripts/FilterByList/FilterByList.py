@@ -10,37 +10,70 @@ def empty_list_context(items, list_name):
     return human_readable, ec
 
 
+# group references that would point to other groups once the items are combined into a single pattern
+GROUP_REFERENCE_REGEX = re.compile(r'\\[1-9]|\(\?P=|\(\?\(')
+# inline flags, which apply to the whole pattern wherever they are, so they would apply to the other items too
+INLINE_FLAGS_REGEX = re.compile(r'\(\?[aiLmsux]+\)')
+
+
+def compile_items(items, regex_ignore_case_flag):
+    """Compiles every item once, and all the items together as one alternation.
+
+    The alternation matches a list entry only if at least one of the items does, so it is used to skip the entries
+    none of the items match. It is None when the items can not be combined (e.g. they reference their own groups or
+    set inline flags).
+    """
+    patterns = {}
+    for item in items:
+        if item not in patterns:
+            patterns[item] = re.compile(item, regex_ignore_case_flag)
+
+    combined_pattern = None
+    if not any(GROUP_REFERENCE_REGEX.search(item) or INLINE_FLAGS_REGEX.search(item) for item in patterns):
+        try:
+            combined_pattern = re.compile('|'.join('(?:{})'.format(item) for item in patterns), regex_ignore_case_flag)
+        except (re.error, AssertionError):
+            # python 2 fails compiling patterns with more than 100 groups with an AssertionError
+            pass
+
+    return patterns, combined_pattern
+
+
 def build_filtered_data(lst, items, ignore_case, match_exact, regex_ignore_case_flag):
     not_white_listed = []  # type: list
     white_listed = []  # type: list
-    human_readable = ''
+    human_readable = []  # type: list
 
     # fill whitelisted array with all the the values that match the regex items in listname argument
-    list_to_lowercase = [list_item.lower().strip() for list_item in lst]
-    for item in items:
-        if match_exact:
-            if ignore_case:
-                if item.lower() not in list_to_lowercase:
-                    continue
-            else:
-                if item not in lst:
-                    continue
-
-            human_readable += item + ' is in the list\n'
-            white_listed.append(item)
+    if match_exact:
+        if ignore_case:
+            list_items = {list_item.lower().strip() for list_item in lst}
         else:
+            list_items = set(lst)
+        for item in items:
+            if (item.lower() if ignore_case else item) in list_items:
+                human_readable.append(item + ' is in the list\n')
+                white_listed.append(item)
+    else:
+        patterns, combined_pattern = compile_items(items, regex_ignore_case_flag)
+        lst = [list_item for list_item in lst if list_item]
+        if combined_pattern:
+            lst = [list_item for list_item in lst if combined_pattern.search(list_item)]
+        for item in items:
+            pattern = patterns[item]
             for list_item in lst:
-                if list_item and re.search(item, list_item, regex_ignore_case_flag):
-                    human_readable += item + ' is in the list\n'
+                if pattern.search(list_item):
+                    human_readable.append(item + ' is in the list\n')
                     white_listed.append(item)
 
     # fill not_white_listed array with all the the values that not in whitelisted
+    white_listed_items = set(white_listed)
     for item in items:
-        if item not in white_listed:
-            human_readable += item + ' is not part of the list\n'
+        if item not in white_listed_items:
+            human_readable.append(item + ' is not part of the list\n')
             not_white_listed.append(item)
 
-    return white_listed, not_white_listed, human_readable
+    return white_listed, not_white_listed, ''.join(human_readable)
 
 
 def filter_list(lst, items, ignore_case, match_exact, list_name):
@@ -1,6 +1,6 @@
 from __future__ import print_function
 import pytest
-from FilterByList import filter_list
+from FilterByList import build_filtered_data, filter_list
 
 '''Test arguments'''
 
@@ -126,3 +126,41 @@ def test_no_ignore_yes_match(lst, items, ignore_case, match_exact, expected_resu
 def test_yes_ignore_yes_match(lst, items, ignore_case, match_exact, expected_result, list_name):
     result, _ = filter_list(lst, items, ignore_case, match_exact, list_name)
     assert result == expected_result
+
+
+def test_regex_match_every_list_entry():
+    """
+    Given: regex values, one matching several list entries and one referencing its own group
+    When: filtering the values against the list
+    Then: a value is listed once per list entry it matches, in the values order
+    """
+    lst = ['demisto', 'paloalto', 'foo', 'boo', '', 'bar']
+    items = [r'(o)\1', 'not_in_list', 'alto', 'o{2}']
+    white_listed, not_white_listed, human_readable = build_filtered_data(lst, items, False, False, 0)
+    assert white_listed == [r'(o)\1', r'(o)\1', 'alto', 'o{2}', 'o{2}']
+    assert not_white_listed == ['not_in_list']
+    assert human_readable == '(o)\\1 is in the list\n(o)\\1 is in the list\nalto is in the list\n' \
+                             'o{2} is in the list\no{2} is in the list\nnot_in_list is not part of the list\n'
+
+
+def test_regex_more_than_100_groups():
+    """
+    Given: more than 100 regex values with a capturing group each
+    When: filtering the values against the list
+    Then: the values are matched one by one, as they can not be combined into a single pattern
+    """
+    items = ['(a{})'.format(i) for i in range(101)]
+    white_listed, not_white_listed, _ = build_filtered_data(['a5', 'b', 'a100'], items, False, False, 0)
+    assert white_listed == ['(a1)', '(a5)', '(a10)', '(a100)']
+    assert len(not_white_listed) == 97
+
+
+def test_regex_inline_flags():
+    """
+    Given: regex values, one of them with inline flags, which apply to the whole pattern
+    When: filtering the values against the list
+    Then: the flags apply only to their own value
+    """
+    white_listed, not_white_listed, _ = build_filtered_data(['a b'], ['a b', '(?x)zz'], False, False, 0)
+    assert white_listed == ['a b']
+    assert not_white_listed == ['(?x)zz']
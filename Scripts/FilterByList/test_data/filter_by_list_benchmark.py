@@ -0,0 +1,85 @@
+"""
+Benchmark of FilterByList.build_filtered_data - compares searching every value in a python list and matching every
+value as a regex against every list entry, against the set lookups and the precompiled patterns, over generated
+lists of growing sizes, and verifies both return the same results.
+
+Run from the script directory (next to CommonServerPython.py and demistomock.py):
+    python test_data/filter_by_list_benchmark.py
+"""
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from FilterByList import build_filtered_data  # noqa: E402
+
+SIZES = ((1000, 10000), (2000, 20000), (4000, 40000))
+REGEX_SIZES = ((100, 10000), (200, 20000), (400, 40000))
+
+
+def legacy_build_filtered_data(lst, items, ignore_case, match_exact, regex_ignore_case_flag):
+    not_white_listed = []
+    white_listed = []
+    human_readable = ''
+    list_to_lowercase = [list_item.lower().strip() for list_item in lst]
+    for item in items:
+        if match_exact:
+            if ignore_case:
+                if item.lower() not in list_to_lowercase:
+                    continue
+            else:
+                if item not in lst:
+                    continue
+            human_readable += item + ' is in the list\n'
+            white_listed.append(item)
+        else:
+            for list_item in lst:
+                if list_item and re.search(item, list_item, regex_ignore_case_flag):
+                    human_readable += item + ' is in the list\n'
+                    white_listed.append(item)
+    for item in items:
+        if item not in white_listed:
+            human_readable += item + ' is not part of the list\n'
+            not_white_listed.append(item)
+    return white_listed, not_white_listed, human_readable
+
+
+def random_domain():
+    return 'host{}.Example{}.com'.format(random.randint(0, 10 ** 6), random.randint(0, 100))
+
+
+def measure(func, *args):
+    start = time.time()
+    result = func(*args)
+    return result, time.time() - start
+
+
+def compare(title, lst, items, ignore_case, match_exact):
+    args = (lst, items, ignore_case, match_exact, re.IGNORECASE if ignore_case else 0)
+    before, before_time = measure(legacy_build_filtered_data, *args)
+    after, after_time = measure(build_filtered_data, *args)
+    assert before == after
+    print('    {}: {} values, {} list entries, {} in the list - before {:.2f} s, after {:.3f} s'.format(
+        title, len(items), len(lst), len(after[0]), before_time, after_time))
+
+
+def main():
+    random.seed(0)
+    for values, entries in SIZES:
+        lst = [random_domain() for _ in range(entries)]
+        items = random.sample(lst, values // 2) + [random_domain() for _ in range(values // 2)]
+        compare('exact', lst, items, False, True)
+        compare('exact, ignore case', lst, [item.upper() for item in items], True, True)
+
+    for values, entries in REGEX_SIZES:
+        lst = [random_domain() for _ in range(entries)]
+        items = [re.escape(item.split('.')[0]) + r'\.' for item in random.sample(lst, values // 2)]
+        items += [r'^host{}\.'.format(random.randint(0, 10 ** 6)) for _ in range(values // 2)]
+        compare('regex, ignore case', lst, items, True, False)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,7 @@
 # type: ignore
 from CommonServerPython import *
 import collections
+import time
 from dateutil import parser
 
 EXACT_MATCH = 0
@@ -24,6 +25,11 @@ STATUS_MAP = {
 
 CREATED_TIME_FIELD = "created"
 
+# words sets of the compared texts, the current incident's texts are compared with every candidate.
+# The cache is cleared at the start of every run and whenever it reaches WORDS_SETS_CACHE_SIZE texts.
+WORDS_SETS_CACHE_SIZE = 1000
+words_sets_cache = {}  # type: ignore
+
 
 def parse_input(csv):
     if not csv:
@@ -147,12 +153,30 @@ def get_incidents_by_keys(similar_incident_keys, time_field, incident_time, inci
     return incident_list
 
 
-def get_context(incident_id):
-    res = demisto.executeCommand("getContext", {'id': incident_id})
-    try:
-        return res[0]['Contents']['context']
-    except Exception:
-        return {}
+def filter_by_context(candidates, incident_similar_context, similar_context_map, concurrency=1, deadline=None):
+    """
+    Filters the candidates with a context similar to the incident's. The contexts are loaded in chunks of concurrency
+    candidates, and no more chunks are loaded once the deadline has passed.
+
+    :return: The similar candidates, and the number of candidates which were compared
+    :rtype: ``tuple``
+    """
+    similar_candidates = []
+    compared = 0
+    chunk_size = max(concurrency, 1)
+    while compared < len(candidates):
+        if deadline and time.time() > deadline:
+            break
+        chunk = candidates[compared:compared + chunk_size]
+        for c, context in zip(chunk, get_incidents_contexts([c['id'] for c in chunk], concurrency)):
+            other_context = get_map_from_nested_dict(context, similar_context_map.keys())
+            if other_context:
+                if verify_map_equals(other_context,
+                                     incident_similar_context,
+                                     similar_context_map):
+                    similar_candidates.append(c)
+        compared += len(chunk)
+    return similar_candidates, compared
 
 
 def camel_case_to_space(s):
@@ -191,12 +215,25 @@ def is_text_equal_by_x_different_words(text1, text2, number_of_different_words,
     elif number_of_different_words == CONTAINS:
         return text1.find(text2) >= 0 or text2.find(text1) >= 0
     else:
-        words_set1 = set([x for x in map(lambda x: x.strip(), text1.replace("\\n", separator).split(separator)) if x])
-        words_set2 = set([x for x in map(lambda x: x.strip(), text2.replace("\\n", separator).split(separator)) if x])
+        words_set1 = get_words_set(text1, separator)
+        words_set2 = get_words_set(text2, separator)
+        # a set which is larger by more than the allowed number of words has too many extra words
+        if abs(len(words_set1) - len(words_set2)) > number_of_different_words:
+            return False
         return len(words_set1.difference(words_set2)) <= number_of_different_words and len(
             words_set2.difference(words_set1)) <= number_of_different_words
 
 
+def get_words_set(text, separator=' '):
+    key = (text, separator)
+    if key not in words_sets_cache:
+        if len(words_sets_cache) >= WORDS_SETS_CACHE_SIZE:
+            words_sets_cache.clear()
+        words_sets_cache[key] = set(
+            [x for x in map(lambda x: x.strip(), text.replace("\\n", separator).split(separator)) if x])
+    return words_sets_cache[key]
+
+
 def verify_map_equals(values_map1, values_map2, equality_map):
     if not equality_map or len(equality_map) == 0:
         return True
@@ -221,13 +258,16 @@ def verify_map_equals(values_map1, values_map2, equality_map):
     return True
 
 
-def did_not_found_duplicates():
+def did_not_found_duplicates(budget_message=None):
     context = {
         'isSimilarIncidentFound': False
     }
+    contents = 'No duplicate incidents has been found.'
+    if budget_message:
+        contents += '\n%s\n' % budget_message
     demisto.results({'ContentsFormat': formats['markdown'],
                      'Type': entryTypes['note'],
-                     'Contents': 'No duplicate incidents has been found.',
+                     'Contents': contents,
                      'EntryContext': context})
     sys.exit(0)
 
@@ -242,6 +282,7 @@ def merge_incident_fields(incident):
 
 
 def main():
+    words_sets_cache.clear()
     SIMILAR_INCIDENT_KEYS = [x for x in demisto.args().get('similarIncidentKeys', '').split(",") if x]
     SIMILAR_CUSTOMS_FIELDS_MAP = parse_input(demisto.args().get('similarCustomFields', ''))
     SIMILAR_INCIDENTS_FIELDS_MAP = parse_input(demisto.args().get('similarIncidentFields', ''))
@@ -264,6 +305,9 @@ def main():
     EXTRA_QUERY = demisto.args().get('filterQuery')
     INCIDENT_FIELDS_APPLIED_CONDITION = demisto.args()['incidentFieldsAppliedCondition']
     RAISE_ERROR_MISSING_VALUES = not (demisto.args()['skipMissingValues'] == 'yes')
+    CONTEXT_CONCURRENCY = int(demisto.args().get('contextConcurrency') or 1)
+    TIME_BUDGET = float(demisto.args().get('timeBudgetSeconds') or 0)
+    deadline = time.time() + TIME_BUDGET if TIME_BUDGET > 0 else None
 
     # set the incident
     incident = merge_incident_fields(demisto.incidents()[0])  # type: ignore  # pylint: disable=no-value-for-parameter
@@ -322,16 +366,15 @@ def main():
                                                     SIMILAR_INCIDENTS_FIELDS_MAP)
                                ]
     # filter by context
+    budget_message = None
     if incident_similar_context:
-        filter_by_context = []
-        for c in duplicate_incidents:
-            other_context = get_map_from_nested_dict(get_context(c['id']), SIMILAR_CONTEXT_MAP.keys())
-            if other_context:
-                if verify_map_equals(other_context,
-                                     incident_similar_context,
-                                     SIMILAR_CONTEXT_MAP):
-                    filter_by_context.append(c)
-        duplicate_incidents = filter_by_context
+        candidates_count = len(duplicate_incidents)
+        duplicate_incidents, compared = filter_by_context(duplicate_incidents, incident_similar_context,
+                                                          SIMILAR_CONTEXT_MAP, CONTEXT_CONCURRENCY, deadline)
+        if compared < candidates_count:
+            budget_message = 'The time budget of %s seconds was exceeded, compared the context of %d out of %d ' \
+                             'candidates.' % (TIME_BUDGET, compared, candidates_count)
+            demisto.log(budget_message)
 
     # update context
     if len(duplicate_incidents or []) > 0:
@@ -347,12 +390,14 @@ def main():
         markdown_result = tableToMarkdown("Duplicate incidents",
                                           hr_result,
                                           headers=['Id', 'Name', 'Closed time', 'Time'])
+        if budget_message:
+            markdown_result += '\n%s\n' % budget_message
         return {'ContentsFormat': formats['markdown'],
                 'Type': entryTypes['note'],
                 'Contents': markdown_result,
                 'EntryContext': context}
     else:
-        did_not_found_duplicates()
+        did_not_found_duplicates(budget_message)
 
 
 if __name__ in ['__main__', '__builtin__', 'builtins']:
@@ -1,7 +1,7 @@
 import pytest
 
 from CommonServerPython import *
-from FindSimilarIncidentsV2 import main
+from FindSimilarIncidentsV2 import main, is_text_equal_by_x_different_words, get_words_set, words_sets_cache
 
 default_args = {
     'hoursBack': 5,
@@ -173,3 +173,74 @@ def test_similar_context(mocker):
     assert len(result['EntryContext']['similarIncidentList']) == 2
     assert result['EntryContext']['similarIncidentList'][0]['rawId'] == 3
     assert result['EntryContext']['similarIncidentList'][1]['rawId'] == 2
+
+
+def test_similar_context_concurrency(mocker):
+    args = dict(default_args)
+    args.update({'similarIncidentFields': 'name', 'similarContextKeys': 'listValue.name', 'contextConcurrency': '2'})
+
+    mocker.patch.object(demisto, 'args', return_value=args)
+    mocker.patch.object(demisto, 'incidents', return_value=[incident1])
+    mocker.patch.object(demisto, 'executeCommand', side_effect=execute_command)
+    mocker.patch.object(demisto, 'context', return_value=context1)
+
+    result = main()
+    assert [r['rawId'] for r in result['EntryContext']['similarIncidentList']] == [3, 2]
+
+
+def test_similar_context_time_budget(mocker):
+    args = dict(default_args)
+    args.update({'similarIncidentFields': 'name', 'similarContextKeys': 'listValue.name', 'timeBudgetSeconds': '10'})
+
+    mocker.patch.object(demisto, 'args', return_value=args)
+    mocker.patch.object(demisto, 'incidents', return_value=[incident1])
+    mocker.patch.object(demisto, 'executeCommand', side_effect=execute_command)
+    mocker.patch.object(demisto, 'context', return_value=context1)
+    mocker.patch('FindSimilarIncidentsV2.time.time', side_effect=[0, 5, 15])
+
+    result = main()
+    assert [r['rawId'] for r in result['EntryContext']['similarIncidentList']] == [3]
+    assert 'compared the context of 1 out of 2 candidates' in result['Contents']
+
+
+def test_similar_context_time_budget_no_results(mocker):
+    """
+    Given: a time budget which is exceeded after comparing the context of a candidate which is not similar
+    When: looking for similar incidents
+    Then: the no duplicates entry reports that the time budget was exceeded
+    """
+    args = dict(default_args)
+    args.update({'similarIncidentFields': 'name', 'similarContextKeys': 'simpleValue', 'timeBudgetSeconds': '10'})
+
+    mocker.patch.object(demisto, 'args', return_value=args)
+    mocker.patch.object(demisto, 'incidents', return_value=[incident1])
+    mocker.patch.object(demisto, 'executeCommand', side_effect=execute_command)
+    mocker.patch.object(demisto, 'context', return_value=context1)
+    mocker.patch.object(demisto, 'results')
+    mocker.patch('FindSimilarIncidentsV2.time.time', side_effect=[0, 5, 15])
+
+    with pytest.raises(SystemExit):
+        main()
+    entry = demisto.results.call_args[0][0]
+    assert not entry['EntryContext']['isSimilarIncidentFound']
+    assert 'compared the context of 1 out of 2 candidates' in entry['Contents']
+
+
+@pytest.mark.parametrize('text1, text2, number_of_different_words, expected', [
+    ('a b c', 'a b c d', 1, True),
+    ('a b c', 'a b c d e', 1, False),
+    ('a b c', 'a b d', 1, True),
+    ('a b c', 'a d e', 1, False),
+])
+def test_is_text_equal_by_x_different_words(text1, text2, number_of_different_words, expected):
+    assert is_text_equal_by_x_different_words(text1, text2, number_of_different_words) == expected
+    assert is_text_equal_by_x_different_words(text2, text1, number_of_different_words) == expected
+
+
+def test_get_words_set_cache_size(mocker):
+    mocker.patch('FindSimilarIncidentsV2.WORDS_SETS_CACHE_SIZE', 2)
+    words_sets_cache.clear()
+    for text in ('a b', 'c d', 'e f'):
+        assert get_words_set(text) == set(text.split())
+        assert len(words_sets_cache) <= 2
+    assert get_words_set('e f') is words_sets_cache[('e f', ' ')]
@@ -1,4 +1,9 @@
+import copy
+
 import demistomock as demisto
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+import GetDuplicatesMlv2
 from GetDuplicatesMlv2 import main, Utils
 from CommonServerPython import entryTypes
 
@@ -42,3 +47,100 @@ def test_extract_domain_from_url():
     assert res == 'google.com'
     res = Utils.extract_domain_from_url("https://www.google.co.il")  # disable-secrets-detection
     assert res == 'google.co.il'
+
+
+def test_extract_domain_from_url_reuses_extractor(mocker):
+    mocker.patch.object(Utils, 'tld_extractor', None)
+    mocker.patch.object(Utils, 'domains_cache', {})
+    tld_extract = mocker.patch.object(GetDuplicatesMlv2.tldextract, 'TLDExtract',
+                                      side_effect=GetDuplicatesMlv2.tldextract.TLDExtract)
+    assert Utils.extract_domain_from_url("https://www.google.com") == 'google.com'  # disable-secrets-detection
+    assert Utils.extract_domain_from_url("https://www.google.co.il") == 'google.co.il'  # disable-secrets-detection
+    assert Utils.extract_domain_from_url("https://www.google.com") == 'google.com'  # disable-secrets-detection
+    assert tld_extract.call_count == 1
+    assert len(Utils.domains_cache) == 2
+
+
+def test_get_candidates_features():
+    incident = {'id': '1', 'created': '2019-09-01T10:00:00Z', 'type': 'Phishing', 'severity': 1,
+                'labels': [{'type': 'Instance', 'value': 'a'}, {'type': 'x', 'value': 'y'}],
+                'indicators': {'IP': ['1.1.1.1', '2.2.2.2']}}
+    candidates = [
+        {'id': '2', 'created': '2019-09-01T11:00:00Z', 'type': 'Phishing', 'severity': 2,
+         'labels': [{'type': 'Instance', 'value': 'a'}], 'indicators': {'IP': ['1.1.1.1']}},
+        {'id': '3', 'created': 'not a date', 'type': 'Other', 'severity': 1,
+         'labels': [{'type': 'x', 'value': 'y'}], 'indicators': {}},
+    ]
+    features = GetDuplicatesMlv2.get_candidates_features(incident, candidates, ['incident_time_diff', 'missing'])
+    features = features.set_index('id')
+    assert features.loc['2', 'incident_time_diff'] == 3600
+    assert pd.isnull(features.loc['3', 'incident_time_diff'])
+    assert features.loc['2', 'same_type'] and not features.loc['3', 'same_type']
+    assert not features.loc['2', 'same_severity'] and features.loc['3', 'same_severity']
+    assert features.loc['2', 'indicator_IP_jaccard'] == 0.5
+    assert features.loc['3', 'labels_jaccard'] == 1
+    assert pd.isnull(features.loc['2', 'missing'])
+
+
+def test_main_fits_model(mocker, tmpdir):
+    incident = demisto.exampleIncidents[0]['Contents']['data'][0]
+    candidates = [dict(copy.deepcopy(incident), id=incident_id, name=incident_id) for incident_id in ('2', '3')]
+
+    def executeCommand(name, args=None):
+        if name == 'findIndicators':
+            return [{'Type': entryTypes['note'], 'Contents': [{
+                "investigationIDs": ["1", "2"],
+                "value": "test@test.com",
+                "indicator_type": "Email",
+            }]}]
+        elif name == 'getIncidents':
+            return [{'Type': entryTypes['note'], 'Contents': {'data': copy.deepcopy(candidates)}}]
+        else:
+            raise ValueError('Unimplemented command called: {}'.format(name))
+
+    mocker.patch.object(demisto, 'args', return_value={
+        "compareIndicators": "Email, IP, Domain, File SHA256, File MD5, URL",
+        "compareEmailLabels": "Email/headers/From, Email/headers/Subject, Email/text, Email/html, Email/attachments",
+        "threshold": "0"
+    })
+    mocker.patch.object(demisto, 'results')
+    mocker.patch.object(demisto, 'executeCommand', side_effect=executeCommand)
+    trained_model = GetDuplicatesMlv2.get_trained_model
+    get_trained_model = mocker.patch.object(GetDuplicatesMlv2, 'get_trained_model',
+                                            side_effect=lambda X, Y, key: trained_model(X, Y, key, cache_dir=str(tmpdir)))
+    fit = mocker.spy(RandomForestClassifier, 'fit')
+    main()
+    assert get_trained_model.call_count == 1
+    assert fit.call_count == 1
+    assert len(tmpdir.listdir()) == 1
+    results = demisto.results.call_args[0][0]
+    assert results['EntryContext']['isSimilarIncidentFound']
+    assert sorted(r['rawId'] for r in results['EntryContext']['similarIncidentList']) == ['2', '3']
+
+
+def test_get_trained_model_is_cached(mocker, tmpdir):
+    X = pd.DataFrame({'a': [0, 1, 0, 1], 'b': [1, 1, 0, 0]})
+    Y = pd.Series([0, 1, 0, 1])
+    fit = mocker.spy(RandomForestClassifier, 'fit')
+    model = GetDuplicatesMlv2.get_trained_model(X, Y, 'key1', cache_dir=str(tmpdir))
+    cached_model = GetDuplicatesMlv2.get_trained_model(X, Y, 'key1', cache_dir=str(tmpdir))
+    assert fit.call_count == 1
+    assert (cached_model.predict(X) == model.predict(X)).all()
+    GetDuplicatesMlv2.get_trained_model(X, pd.Series([1, 0, 1, 0]), 'key2', cache_dir=str(tmpdir))
+    assert fit.call_count == 2
+
+
+def test_get_trained_model_prunes_cache(tmpdir):
+    X = pd.DataFrame({'a': [0, 1, 0, 1]})
+    Y = pd.Series([0, 1, 0, 1])
+    for key in ('key1', 'key2', 'key3'):
+        GetDuplicatesMlv2.get_trained_model(X, Y, key, cache_dir=str(tmpdir), cache_size=2)
+    assert sorted(tmpdir.listdir()) == [tmpdir.join('key2.pkl'), tmpdir.join('key3.pkl')]
+
+
+def test_get_training_data_key():
+    key = GetDuplicatesMlv2.get_training_data_key('features', {'a', 'b'})
+    assert key == GetDuplicatesMlv2.get_training_data_key('features', {'b', 'a'})
+    assert key != GetDuplicatesMlv2.get_training_data_key('other features', {'a', 'b'})
+    assert key != GetDuplicatesMlv2.get_training_data_key('features', {'a'})
+    assert key != GetDuplicatesMlv2.get_training_data_key('features', {'a', 'b'}, pd.DataFrame({'a': [1]}))
@@ -2,8 +2,11 @@ from CommonServerPython import *
 
 import uuid
 import pickle
+from datetime import datetime, timedelta
 from dateutil import parser
 
+DEFAULT_PAGE_SIZE = 500
+
 
 def parse_datetime(datetime_str):
     try:
@@ -12,14 +15,6 @@ def parse_datetime(datetime_str):
         return datetime_str
 
 
-def get_context(incident_id):
-    res = demisto.executeCommand("getContext", {'id': incident_id})
-    try:
-        return res[0]['Contents'].get('context') or {}
-    except Exception:
-        return {}
-
-
 def build_incidents_query(extra_query, incident_types, time_field, from_date, to_date, non_empty_fields):
     query_parts = []
     if extra_query:
@@ -43,8 +38,32 @@ def build_incidents_query(extra_query, incident_types, time_field, from_date, to
     return query
 
 
-def get_incidents(query, time_field, size):
-    res = demisto.executeCommand("getIncidents", {"query": query, "size": size, "sort": time_field})
+def get_time_slices(from_date, to_date, slice_hours):
+    """
+    Splits the [from_date, to_date) range into slices of slice_hours hours. When the range can not be sliced (no
+    slice size, or dates which are not absolute) the range itself is returned as a single slice.
+
+    :return: (from_date, to_date) pairs, oldest first
+    :rtype: ``list``
+    """
+    if not slice_hours or not from_date:
+        return [(from_date, to_date)]
+    try:
+        start = parser.parse(from_date)
+        end = parser.parse(to_date) if to_date else datetime.now(start.tzinfo)
+    except Exception:
+        return [(from_date, to_date)]
+
+    time_slices = []
+    while start < end:
+        slice_end = min(start + timedelta(hours=slice_hours), end)
+        time_slices.append((start.isoformat(), slice_end.isoformat()))
+        start = slice_end
+    return time_slices
+
+
+def get_incidents(query, time_field, size, page=0):
+    res = demisto.executeCommand("getIncidents", {"query": query, "size": size, "sort": time_field, "page": page})
     if res[0]['Type'] == entryTypes['error']:
         error_message = str(res[0]['Contents'])
         return_error("Failed to get incidents by query: %s error: %s" % (query, error_message))
@@ -52,37 +71,113 @@ def get_incidents(query, time_field, size):
     return incident_list
 
 
+def iter_incidents(queries, time_field, limit, page_size=DEFAULT_PAGE_SIZE):
+    """
+    Yields the pages of incidents matching the queries, querying page by page until limit incidents were fetched.
+
+    :type queries: ``list``
+    :param queries: The queries to fetch the incidents of, in order
+
+    :return: Generator of incident lists
+    :rtype: ``generator``
+    """
+    remaining = limit
+    for query in queries:
+        page = 0
+        while remaining > 0:
+            incident_list = get_incidents(query, time_field, page_size, page)[:remaining]
+            if incident_list:
+                remaining -= len(incident_list)
+                yield incident_list
+            if len(incident_list) < page_size:
+                break
+            page += 1
+
+
+def project_incident(incident, fields):
+    if not fields:
+        return incident
+    return {field: incident[field] for field in fields if field in incident}
+
+
+def write_incidents(output_file, output_format, pages):
+    """
+    Writes the pages of incidents to output_file as they are fetched. ndjson is written one incident per line, json
+    as a single list.
+
+    :return: The number of incidents, and the list of all the incidents - None for ndjson, which is never held in
+        memory as a whole
+    :rtype: ``tuple``
+    """
+    incidents_count = 0
+    incident_list = [] if output_format != 'ndjson' else None
+    if output_format == 'json':
+        output_file.write(b'[')
+    for incident_page in pages:
+        for incident in incident_page:
+            if output_format == 'ndjson':
+                output_file.write(json.dumps(incident).encode('utf-8') + b'\n')
+            else:
+                if output_format == 'json':
+                    output_file.write((b', ' if incidents_count else b'') + json.dumps(incident).encode('utf-8'))
+                incident_list.append(incident)
+            incidents_count += 1
+    if output_format == 'json':
+        output_file.write(b']')
+    elif output_format == 'pickle':
+        output_file.write(pickle.dumps(incident_list))
+    return incidents_count, incident_list
+
+
 def main():
-    # fetch query
-    query = build_incidents_query(demisto.args().get('query'),
-                                  demisto.args().get('incidentTypes'),
-                                  demisto.args()['timeField'],
-                                  demisto.args().get('fromDate'),
-                                  demisto.args().get('toDate'),
-                                  demisto.args().get('NonEmptyFields'))
-    incident_list = get_incidents(query, demisto.args()['timeField'], int(demisto.args()['limit']))
-    include_context = demisto.args()['includeContext'] == 'true'
-    # extend incidents fields \ context
-    for i in incident_list:
-        # we flat the custom field to the incident structure, like in the context
-        custom_fields = i.get('CustomFields', {}) or {}
-        i.update(custom_fields)
-        if include_context:
-            i['context'] = get_context(i['id'])
+    args = demisto.args()
+    output_format = args['outputFormat']
+    if output_format not in ('json', 'pickle', 'ndjson'):
+        return_error("Invalid output format: %s" % output_format)
+    time_field = args['timeField']
+    query = build_incidents_query(args.get('query'),
+                                  args.get('incidentTypes'),
+                                  time_field,
+                                  args.get('fromDate'),
+                                  args.get('toDate'),
+                                  args.get('NonEmptyFields'))
+    time_slices = get_time_slices(args.get('fromDate'), args.get('toDate'), int(args.get('timeSliceHours') or 0))
+    queries = [query]
+    if len(time_slices) > 1:
+        queries = [build_incidents_query(args.get('query'), args.get('incidentTypes'), time_field, from_date, to_date,
+                                         args.get('NonEmptyFields')) for from_date, to_date in time_slices]
+    include_context = args['includeContext'] == 'true'
+    context_concurrency = int(args.get('contextConcurrency') or 1)
+    fields = argToList(args.get('populateFields'))
+    if fields and include_context:
+        fields.append('context')
+
+    def extend_incidents(pages):
+        # extend incidents fields \ context
+        for incident_list in pages:
+            for i in incident_list:
+                # we flat the custom field to the incident structure, like in the context
+                custom_fields = i.get('CustomFields', {}) or {}
+                i.update(custom_fields)
+            if include_context:
+                contexts = get_incidents_contexts([i['id'] for i in incident_list], context_concurrency)
+                for i, context in zip(incident_list, contexts):
+                    i['context'] = context
+            yield [project_incident(i, fields) for i in incident_list]
 
     # output
     file_name = str(uuid.uuid4())
-
-    output_format = demisto.args()['outputFormat']
-    if output_format == 'pickle':
-        data_encoded = pickle.dumps(incident_list)
-    elif output_format == 'json':
-        data_encoded = json.dumps(incident_list)
-    else:
-        return_error("Invalid output format: %s" % output_format)
-    entry = fileResult(file_name, data_encoded)
-    entry['Contents'] = incident_list
-    entry['HumanReadable'] = "Fetched %d incidents successfully by the query: %s" % (len(incident_list), query)
+    file_id = demisto.uniqueFile()
+    page_size = int(args.get('pageSize') or DEFAULT_PAGE_SIZE)
+    pages = extend_incidents(iter_incidents(queries, time_field, int(args['limit']), page_size))
+    with open(demisto.investigation()['id'] + '_' + file_id, 'wb') as output_file:
+        incidents_count, incident_list = write_incidents(output_file, output_format, pages)
+
+    entry = {'Contents': '', 'ContentsFormat': formats['text'], 'Type': entryTypes['file'], 'File': file_name,
+             'FileID': file_id}
+    if incident_list is not None:
+        entry['Contents'] = incident_list
+    entry['HumanReadable'] = "Fetched %d incidents successfully by the query: %s" % (incidents_count, query)
     entry['EntryContext'] = {
         'GetIncidentsByQuery': {
             'Filename': file_name,
@@ -1,5 +1,5 @@
 from CommonServerPython import *
-from GetIncidentsByQuery import build_incidents_query, main
+from GetIncidentsByQuery import build_incidents_query, get_time_slices, main
 
 incident1 = {
     'id': 1,
@@ -58,3 +58,53 @@ def test_main(mocker):
     args['includeContext'] = 'true'
     entry = main()
     assert {} == entry['Contents'][0]['context']
+
+
+def test_get_time_slices():
+    assert get_time_slices('2019-01-01', '2019-01-02', 0) == [('2019-01-01', '2019-01-02')]
+    assert get_time_slices('2019-01-01', '3 days ago', 12) == [('2019-01-01', '3 days ago')]
+    assert get_time_slices('2019-01-01', '2019-01-02', 10) == [('2019-01-01T00:00:00', '2019-01-01T10:00:00'),
+                                                               ('2019-01-01T10:00:00', '2019-01-01T20:00:00'),
+                                                               ('2019-01-01T20:00:00', '2019-01-02T00:00:00')]
+
+
+def test_main_pages(mocker):
+    incidents = [dict(incident1, id=i) for i in range(7)]
+
+    def execute_command(name, args):
+        if name == 'getContext':
+            return [{'Type': entryTypes['note'], 'Contents': {'context': {'id': args['id']}}}]
+        start = args['page'] * args['size']
+        return [{'Type': entryTypes['note'], 'Contents': {'data': incidents[start:start + args['size']]}}]
+
+    args = get_args()
+    args.update({'pageSize': '3', 'limit': '5', 'includeContext': 'true', 'contextConcurrency': '2',
+                 'populateFields': 'id,testField', 'outputFormat': 'json'})
+    mocker.patch.object(demisto, 'args', return_value=args)
+    execute_command = mocker.patch.object(demisto, 'executeCommand', side_effect=execute_command)
+    entry = main()
+    assert "Fetched 5 incidents successfully" in entry['HumanReadable']
+    assert entry['Contents'] == [{'id': i, 'testField': 'testValue', 'context': {'id': i}} for i in range(5)]
+    assert [c[0][1]['page'] for c in execute_command.call_args_list if c[0][0] == 'getIncidents'] == [0, 1]
+    file_path = demisto.investigation()['id'] + '_' + entry['FileID']
+    with open(file_path, 'rb') as f:
+        assert json.loads(f.read()) == entry['Contents']
+    os.remove(file_path)
+
+
+def test_main_ndjson(mocker):
+    args = get_args()
+    args.update({'outputFormat': 'ndjson', 'timeSliceHours': '24', 'fromDate': '2019-01-01', 'toDate': '2019-01-03'})
+    mocker.patch.object(demisto, 'args', return_value=args)
+    execute_command = mocker.patch.object(demisto, 'executeCommand', return_value=[
+        {'Type': entryTypes['note'], 'Contents': {'data': [incident1]}}])
+    entry = main()
+    assert "Fetched 2 incidents successfully" in entry['HumanReadable']
+    assert entry['Contents'] == ''
+    queries = [c[0][1]['query'] for c in execute_command.call_args_list]
+    assert len(queries) == 2
+    assert 'created:>="2019-01-02T00:00:00"' in queries[1]
+    file_path = demisto.investigation()['id'] + '_' + entry['FileID']
+    with open(file_path, 'rb') as f:
+        assert [json.loads(line)['id'] for line in f.read().splitlines()] == [1, 1]
+    os.remove(file_path)
@@ -1,21 +1,13 @@
 import demistomock as demisto
 from CommonServerPython import *
 
-from netaddr import IPAddress, IPNetwork
-
 
 def main():
     ip_addresses = argToList(demisto.args()['value'])
     cidr_range_list = argToList(demisto.args()['cidr_ranges'])
 
-    included_addresses = []
-
-    for ip_address in ip_addresses:
-        ip = IPAddress(ip_address)
-
-        for cidr_range in cidr_range_list:
-            if ip in IPNetwork(cidr_range):
-                included_addresses.append(ip_address)
+    # the ranges are compiled once per container, and each address is found by a binary search
+    included_addresses = CidrRanges.load(cidr_range_list, cache_dir=CidrRanges.CACHE_DIR).filter(ip_addresses)
 
     if not included_addresses:
         demisto.results(None)
@@ -1,19 +1,13 @@
 import demistomock as demisto
 from CommonServerPython import *
 
-from netaddr import IPAddress, IPNetwork
-
 
 def main():
     ip_address = demisto.args()['left']
     cidr_range_list = argToList(demisto.args()['right'])
 
-    for cidr in cidr_range_list:
-        if IPAddress(ip_address) in IPNetwork(cidr):
-            demisto.results(True)
-            return
-
-    demisto.results(False)
+    # the ranges are compiled once per container, and the address is found by a binary search
+    demisto.results(ip_address in CidrRanges.load(cidr_range_list, cache_dir=CidrRanges.CACHE_DIR))
 
 
 if __name__ == "__builtin__" or __name__ == "builtins":
@@ -5,6 +5,8 @@ from CommonServerPython import *
 reload(sys)  # type: ignore
 sys.setdefaultencoding('utf8')  # pylint: disable=E1101
 codec_type = demisto.args().get('codec', 'utf-8')
+IP_REGEX = re.compile(r'([0-9]{1,3}\.){3}[0-9]{1,3}')
+HASH_REGEX = re.compile(r'[0-9A-Fa-f]{32,128}')
 
 
 def remove_non_printable_chars(s):
@@ -115,10 +117,70 @@ def is_one_dimension_list(all_csv):
     return all(isinstance(entry, STRING_TYPES) for entry in all_csv) or not all_csv
 
 
+def has_more_than_one_line(f):
+    """ Checks if the file has more than one line, reading only up to its second line
+
+    Args:
+        f (file): the csv file, read from its current position
+
+    Returns:
+        bool: True if there is a second line
+    """
+    for i, _ in enumerate(f):
+        if i == 1:
+            return True
+    return False
+
+
+def parse_indicators(csv_data, parse_ip, parse_domain, parse_hash, preview_rows=None):
+    """ Extracts the IPs, domains and hashes of the csv rows in a single pass
+
+    Args:
+        csv_data (iterable): the csv rows
+        parse_ip (int): the column of the IPs, -1 to not extract IPs
+        parse_domain (int): the column of the domains, -1 to not extract domains
+        parse_hash (int): the column of the hashes, -1 to not extract hashes
+        preview_rows (int): the number of rows to render in the markdown table, None for all the rows
+
+    Returns:
+        tuple: the csv content, the markdown table rows (and a note if some rows are not rendered), and the sets of
+            the IPs, domains and hashes
+    """
+    content = []
+    md_rows = []
+    ip_set = set()
+    domain_set = set()
+    hash_set = set()
+    for row in csv_data:
+        content.append(','.join(row) + '\n')
+        md_row = ''
+        if parse_ip != -1:
+            md_row += (row[parse_ip] + '|' if row[parse_ip] else ' |')
+            if IP_REGEX.search(row[parse_ip]) and is_ip_valid(row[parse_ip]):
+                ip_set.add(row[parse_ip])
+
+        if parse_domain != -1:
+            md_row += (row[parse_domain] + '|' if row[parse_domain] else ' |')
+            has_dot = '.' in row[parse_domain]
+            no_spaces = ' ' not in row[parse_domain]
+            if has_dot and no_spaces:
+                domain_set.add(row[parse_domain])
+
+        if parse_hash != -1:
+            md_row += (row[parse_hash] + '|' if row[parse_hash] else ' |')
+            if HASH_REGEX.search(row[parse_hash]):
+                hash_set.add(row[parse_hash])
+        if preview_rows is None or len(md_rows) < preview_rows:
+            md_rows.append(md_row + '\n')
+
+    if len(md_rows) < len(content):
+        # the same note tableToMarkdown adds, separated from the table by a blank line
+        md_rows.append('\n**Showing {} of {} rows, {} rows were truncated.**\n'.format(
+            len(md_rows), len(content), len(content) - len(md_rows)))
+    return ''.join(content), md_rows, ip_set, domain_set, hash_set
+
+
 def main():
-    ip_list = []
-    domain_list = []
-    hash_list = []
     d_args = demisto.args()
 
     entry_id = d_args['entryID'] if 'entryID' in d_args else None
@@ -127,6 +189,7 @@ def main():
     parse_domain = int(d_args['domains']) if 'domains' in d_args else -1
     parse_hash = int(d_args['hashes']) if 'hashes' in d_args else -1
     parse_all = True if d_args['parseAll'] == 'yes' else False
+    preview_rows = int(d_args['previewRows']) if d_args.get('previewRows') else None
 
     if parse_ip == -1 and parse_domain == -1 and parse_hash == -1 and not parse_all:
         return_error('Select a field to extract or set parseAll=yes to parse the whole CSV file')
@@ -154,15 +217,11 @@ def main():
                 file_name))
 
     if parse_all:
-        all_csv = []
         with open(file_path) as f:
-            records = unicode_dict_reader(f)
-            # `records` is a list contains CSV rows (without headers)
+            all_csv = unicode_dict_reader(f)
+            # `all_csv` is a list contains CSV rows (without headers)
             # so if it doesn't exists - it can be empty or one-lined CSV
-            if records:
-                for row in records:
-                    all_csv.append(row)
-            else:  # Can be one-line csv
+            if not all_csv:  # Can be one-line csv
                 f.seek(0)
                 line = f.read()
                 all_csv = line.split(',')
@@ -170,10 +229,11 @@ def main():
         output = {
             'ParseCSV.ParsedCSV': all_csv
         }
+        # only the first rows are rendered, the context has all of them
         if is_one_dimension_list(all_csv):
-            human_readable = tableToMarkdown(file_name, all_csv, headers=["CSV list"])
+            human_readable = tableToMarkdown(file_name, all_csv, headers=["CSV list"], max_rows=preview_rows)
         else:
-            human_readable = tableToMarkdown(file_name, all_csv)
+            human_readable = tableToMarkdown(file_name, all_csv, max_rows=preview_rows)
         demisto.results({
             "Type": entryTypes["note"],
             "ContentsFormat": formats["json"],
@@ -185,10 +245,12 @@ def main():
 
     elif not (parse_ip == -1 and parse_domain == -1 and parse_hash == -1):
         # if need to parse ips/domains/hashes, keep the script running
-        if sum(1 for line in open(file_path)) <= 1:  # checks if there are less than one line
-            return_error('No data to parse. CSV file might be empty or one-lined. try the `ParseAll=yes` argument.')
-
         with open(file_path, 'rU') as f:
+            if not has_more_than_one_line(f):  # checks if there are less than one line
+                return_error('No data to parse. CSV file might be empty or one-lined. try the `ParseAll=yes` argument.')
+
+            # the header is sniffed from the first block, then the file is parsed in a single pass
+            f.seek(0)
             has_header = csv.Sniffer().has_header(f.read(1024))
             f.seek(0)
             csv_data = csv.reader(f)
@@ -196,60 +258,35 @@ def main():
             if has_header:
                 next(csv_data)
 
-            md = '### Parsed Data Table\n' + ('IPs |' if 'ips' in d_args else '') + (
-                'Domains |' if 'domains' in d_args else '') + ('Hashes |' if 'hashes' in d_args else '') + '\n'
-            md += ('- |' if 'ips' in d_args else '') + ('- |' if 'domains' in d_args else '') + (
-                '- |' if 'hashes' in d_args else '') + '\n'
-            content = ''
-
-            for row in csv_data:
-                content += ','.join(row) + '\n'
-                if parse_ip != -1:
-                    md += (row[parse_ip] + '|' if row[parse_ip] else ' |')
-                    is_ip = re.search(r'([0-9]{1,3}\.){3}[0-9]{1,3}', row[parse_ip])
-                    is_valid = is_ip_valid(row[parse_ip])
-                    if is_ip and is_valid:
-                        ip_list.append(row[parse_ip])
-
-                if parse_domain != -1:
-                    md += (row[parse_domain] + '|' if row[parse_domain] else ' |')
-                    has_dot = '.' in row[parse_domain]
-                    no_spaces = ' ' not in row[parse_domain]
-                    if has_dot and no_spaces:
-                        domain_list.append(row[parse_domain])
-
-                if parse_hash != -1:
-                    md += (row[parse_hash] + '|' if row[parse_hash] else ' |')
-                    is_hash = re.search(r'[0-9A-Fa-f]{32,128}', row[parse_hash])
-                    if is_hash:
-                        hash_list.append(row[parse_hash])
-                md += '\n'
+            content, md_rows, ip_set, domain_set, hash_set = parse_indicators(csv_data, parse_ip, parse_domain,
+                                                                              parse_hash, preview_rows)
+
+        md = '### Parsed Data Table\n' + ('IPs |' if 'ips' in d_args else '') + (
+            'Domains |' if 'domains' in d_args else '') + ('Hashes |' if 'hashes' in d_args else '') + '\n'
+        md += ('- |' if 'ips' in d_args else '') + ('- |' if 'domains' in d_args else '') + (
+            '- |' if 'hashes' in d_args else '') + '\n'
+        md += ''.join(md_rows)
 
         context = {}  # type: dict
-        if ip_list:
-            old_ip_list = list(demisto.get(demisto.context(), 'ips')) if demisto.get(demisto.context(), 'ips') else []
-            ip_list = list(set(ip_list) - set(old_ip_list))
-            if len(ip_list) > 0:
+        if ip_set:
+            ip_set -= set(demisto.get(demisto.context(), 'ips') or [])
+            if len(ip_set) > 0:
                 context["IP"] = []
-                for ip in ip_list:
+                for ip in ip_set:
                     context["IP"].append({"Address": ip})
 
-        if domain_list:
-            old_domain_list = list(demisto.get(demisto.context(), 'domains')) if demisto.get(demisto.context(),
-                                                                                             'domains') else []
-            domain_list = list(set(domain_list) - set(old_domain_list))
-            if len(domain_list) > 0:
+        if domain_set:
+            domain_set -= set(demisto.get(demisto.context(), 'domains') or [])
+            if len(domain_set) > 0:
                 context["Domain"] = []
-                for domain in domain_list:
+                for domain in domain_set:
                     context["Domain"].append({"Name": domain})
 
-        if hash_list:
-            old_hash_list = list(demisto.get(demisto.context(), 'hashes')) if demisto.get(demisto.context(),
-                                                                                          'hashes') else []
-            hash_list = list(set(hash_list) - set(old_hash_list))
-            if len(hash_list) > 0:
+        if hash_set:
+            hash_set -= set(demisto.get(demisto.context(), 'hashes') or [])
+            if len(hash_set) > 0:
                 context["File"] = []
-                for hash_string in hash_list:
+                for hash_string in hash_set:
                     if len(hash_string) == 32:
                         context["File"].append({"MD5": hash_string})
                     if len(hash_string) == 64:
@@ -120,3 +120,38 @@ class TestParseCSV:
         main()
         result = self.get_demisto_results()
         assert result == expeced
+
+    def test_main_preview_rows(self, mocker):
+        from ParseCSV import main
+        with open("./TestData/simple_results.json") as f:
+            expected = json.load(f)
+        args = {
+            "entryID": "entry_id",
+            "parseAll": "yes",
+            "codec": "utf-8",
+            "previewRows": "2"
+        }
+        self.mock_demisto(mocker, args_value=args, file_obj=self.create_file_object("./TestData/simple.csv"))
+        main()
+        result = self.get_demisto_results()
+        assert result["EntryContext"] == expected["EntryContext"]
+        assert result["HumanReadable"] == "### simple.csv\n|count|sourceIP|\n|---|---|\n| 0 | 1.1.1.1 |\n" \
+                                          "| 1 | 2.2.2.2 |\n\n**Showing 2 of 3 rows, 1 rows were truncated.**\n"
+
+    def test_main_with_ips_preview_rows(self, mocker):
+        from ParseCSV import main
+        args = {
+            "entryID": "entry_id",
+            "parseAll": "no",
+            "codec": "utf-8",
+            "ips": "0",
+            "previewRows": "1"
+        }
+        self.mock_demisto(mocker, args_value=args, file_obj=self.create_file_object("./TestData/simple.csv"))
+        mocker.patch.object(demisto, "context", return_value={"ips": ["2.2.2.2"]})
+        main()
+        result = self.get_demisto_results()
+        assert result["Contents"] == "1.1.1.1,0\n2.2.2.2,1\n3.3.3.3,2\n"
+        assert result["HumanReadable"] == "### Parsed Data Table\nIPs |\n- |\n1.1.1.1|\n\n" \
+                                          "**Showing 1 of 3 rows, 2 rows were truncated.**\n"
+        assert sorted(ip["Address"] for ip in result["EntryContext"]["IP"]) == ["1.1.1.1", "3.3.3.3"]
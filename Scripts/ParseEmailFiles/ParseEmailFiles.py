@@ -1,13 +1,14 @@
 import demistomock as demisto
 from CommonServerPython import *
 
-from email import message_from_string
 from email.header import decode_header
 import base64
 from base64 import b64decode
 
 import email.utils
 from email.parser import HeaderParser
+import binascii
+from StringIO import StringIO
 import traceback
 import tempfile
 import sys
@@ -43,6 +44,9 @@ reload(sys)
 sys.setdefaultencoding('utf8')  # pylint: disable=no-member
 
 MAX_DEPTH_CONST = 3
+# characters of base64 attachment payloads decoded at a time
+BASE64_CHUNK_SIZE = 1024 * 1024
+BASE64_IGNORED_CHARS = re.compile(r'[^A-Za-z0-9+/=]')
 IS_NESTED_EML = False
 
 """
@@ -3416,6 +3420,89 @@ def unfold(s):
     return re.sub(r'[ \t]*[\r\n][ \t\r\n]*', ' ', s).strip(' ')
 
 
+def read_header_section(eml_file):
+    """
+    Reads the lines of the email header section, up to the empty line which separates it from the body.
+    """
+    lines = []
+    for line in eml_file:
+        if not line.strip('\r\n'):
+            break
+        lines.append(line)
+    return ''.join(lines)
+
+
+def get_eml_headers(headers):
+    header_list = []
+    headers_map = {}  # type: dict
+    for item in headers.items():
+        value = unfold(convert_to_unicode(item[1]))
+        item_dict = {
+            "name": item[0],
+            "value": value
+        }
+
+        # old way to map headers
+        header_list.append(item_dict)
+
+        # new way to map headers - dictionary
+        if item[0] in headers_map:
+            # in case there is already such header
+            # then add that header value to value array
+            if not isinstance(headers_map[item[0]], list):
+                # convert the existing value to array
+                headers_map[item[0]] = [headers_map[item[0]]]
+
+            # add the new value to the value array
+            headers_map[item[0]].append(value)
+        else:
+            headers_map[item[0]] = value
+    return header_list, headers_map
+
+
+def write_base64_payload(payload, output_file):
+    """
+    Decodes a base64 payload into output_file, BASE64_CHUNK_SIZE characters at a time.
+    Decodes exactly like Message.get_payload(decode=True), and returns False when the payload can not be decoded
+    that way in chunks (padding inside the payload or invalid base64), so that it is decoded as a whole instead.
+    """
+    pending = ''
+    for start in range(0, len(payload), BASE64_CHUNK_SIZE):
+        pending += BASE64_IGNORED_CHARS.sub('', payload[start:start + BASE64_CHUNK_SIZE])
+        is_last_chunk = start + BASE64_CHUNK_SIZE >= len(payload)
+        usable = len(pending) if is_last_chunk else len(pending) - len(pending) % 4
+        if '=' in pending[:usable].rstrip('='):
+            return False
+        try:
+            output_file.write(binascii.a2b_base64(pending[:usable]))
+        except binascii.Error:
+            return False
+        pending = pending[usable:]
+    return True
+
+
+def save_part_payload(part, file_name):
+    """
+    Saves the decoded payload of an email part as a file entry. Base64 payloads, which most attachments are, are
+    decoded to the file in chunks instead of as a whole in memory.
+
+    :return: The file entry, and the path of the saved file
+    :rtype: ``tuple``
+    """
+    file_id = demisto.uniqueFile()
+    file_path = demisto.investigation()['id'] + '_' + file_id
+    with open(file_path, 'wb') as f:
+        payload = part.get_payload()
+        if part.is_multipart() or part.get('content-transfer-encoding', '').lower() != 'base64' or not payload \
+                or not write_base64_payload(payload, f):
+            f.seek(0)
+            f.truncate()
+            f.write(part.get_payload(decode=True) or '')
+    entry = {'Contents': '', 'ContentsFormat': formats['text'], 'Type': entryTypes['file'], 'File': file_name,
+             'FileID': file_id}
+    return entry, file_path
+
+
 def handle_eml(file_path, b64=False, file_name=None, parse_only_headers=False, max_depth=3):
     global ENCODINGS_TYPES
     global IS_NESTED_EML
@@ -3424,45 +3511,23 @@ def handle_eml(file_path, b64=False, file_name=None, parse_only_headers=False, m
         return None, []
 
     with open(file_path, 'rb') as emlFile:
-
-        file_data = emlFile.read()
+        eml_file = emlFile
         if b64:
-            file_data = b64decode(file_data)
-
-        parser = HeaderParser()
-        headers = parser.parsestr(file_data)
-
-        header_list = []
-        headers_map = {}  # type: dict
-        for item in headers.items():
-            value = unfold(convert_to_unicode(item[1]))
-            item_dict = {
-                "name": item[0],
-                "value": value
-            }
+            eml_file = StringIO(b64decode(emlFile.read()))
 
-            # old way to map headers
-            header_list.append(item_dict)
-
-            # new way to map headers - dictionary
-            if item[0] in headers_map:
-                # in case there is already such header
-                # then add that header value to value array
-                if not isinstance(headers_map[item[0]], list):
-                    # convert the existing value to array
-                    headers_map[item[0]] = [headers_map[item[0]]]
-
-                # add the new value to the value array
-                headers_map[item[0]].append(value)
-            else:
-                headers_map[item[0]] = value
+        if parse_only_headers:
+            # only the header section is read
+            headers = HeaderParser().parsestr(read_header_section(eml_file))
+            if not headers:
+                raise Exception("Could not parse eml file!")
+            _, headers_map = get_eml_headers(headers)
+            return {"HeadersMap": headers_map}, []
 
-        eml = message_from_string(file_data)
+        eml = email.message_from_file(eml_file)
         if not eml:
             raise Exception("Could not parse eml file!")
 
-        if parse_only_headers:
-            return {"HeadersMap": headers_map}, []
+        header_list, headers_map = get_eml_headers(eml)
 
         html = ''
         text = ''
@@ -3513,26 +3578,23 @@ def handle_eml(file_path, b64=False, file_name=None, parse_only_headers=False, m
 
                     if file_content:
                         # save the eml to war room as file entry
-                        demisto.results(fileResult(attachment_file_name, file_content))
+                        file_entry = fileResult(attachment_file_name, file_content)
+                        demisto.results(file_entry)
 
                     if file_content and max_depth - 1 > 0:
-                        f = tempfile.NamedTemporaryFile(delete=False)
-                        try:
-                            f.write(file_content)
-                            f.close()
-                            IS_NESTED_EML = True
-                            inner_eml, inner_attached_emails = handle_eml(file_path=f.name,
-                                                                          file_name=attachment_file_name,
-                                                                          max_depth=max_depth - 1)
-                            attached_emails.append(inner_eml)
-                            attached_emails.extend(inner_attached_emails)
-                            # if we are outter email is a singed attachment it is a wrapper and we don't return the output of
-                            # this inner email as it will be returned as part of the main result
-                            if 'multipart/signed' not in eml.get_content_type():
-                                return_outputs(readable_output=data_to_md(inner_eml, attachment_file_name, file_name),
-                                               outputs=None)
-                        finally:
-                            os.remove(f.name)
+                        # the inner eml is parsed from the saved file entry
+                        IS_NESTED_EML = True
+                        inner_eml, inner_attached_emails = handle_eml(
+                            file_path=demisto.investigation()['id'] + '_' + file_entry['FileID'],
+                            file_name=attachment_file_name,
+                            max_depth=max_depth - 1)
+                        attached_emails.append(inner_eml)
+                        attached_emails.extend(inner_attached_emails)
+                        # if we are outter email is a singed attachment it is a wrapper and we don't return the output of
+                        # this inner email as it will be returned as part of the main result
+                        if 'multipart/signed' not in eml.get_content_type():
+                            return_outputs(readable_output=data_to_md(inner_eml, attachment_file_name, file_name),
+                                           outputs=None)
 
                 else:
                     # .msg and other files (png, jpeg)
@@ -3545,25 +3607,20 @@ def handle_eml(file_path, b64=False, file_name=None, parse_only_headers=False, m
                         attached_emails.append(msg_info)
                         demisto.results(fileResult(attachment_file_name, msg_info))
                     else:
-                        file_content = part.get_payload(decode=True)
-                        demisto.results(fileResult(attachment_file_name, file_content))
+                        file_entry, saved_file_path = save_part_payload(part, attachment_file_name)
+                        demisto.results(file_entry)
 
                         if attachment_file_name.endswith(".msg") and max_depth - 1 > 0:
-                            f = tempfile.NamedTemporaryFile(delete=False)
-                            try:
-                                f.write(file_content)
-                                f.close()
-                                inner_msg, inner_attached_emails = handle_msg(f.name, attachment_file_name, False,
-                                                                              max_depth - 1)
-                                attached_emails.append(inner_msg)
-                                attached_emails.extend(inner_attached_emails)
-
-                                # will output the inner email to the UI
-                                return_outputs(
-                                    readable_output=data_to_md(inner_msg, attachment_file_name, file_name),
-                                    outputs=None)
-                            finally:
-                                os.remove(f.name)
+                            # the inner msg is parsed from the saved file entry
+                            inner_msg, inner_attached_emails = handle_msg(saved_file_path, attachment_file_name, False,
+                                                                          max_depth - 1)
+                            attached_emails.append(inner_msg)
+                            attached_emails.extend(inner_attached_emails)
+
+                            # will output the inner email to the UI
+                            return_outputs(
+                                readable_output=data_to_md(inner_msg, attachment_file_name, file_name),
+                                outputs=None)
 
                 attachment_names.append(attachment_file_name)
                 demisto.setContext('AttachmentName', attachment_file_name)
@@ -1,5 +1,6 @@
 from __future__ import print_function
-from ParseEmailFiles import MsOxMessage, main, convert_to_unicode, unfold, handle_msg
+from ParseEmailFiles import MsOxMessage, main, convert_to_unicode, unfold, handle_msg, handle_eml, write_base64_payload
+import ParseEmailFiles
 from CommonServerPython import entryTypes
 import demistomock as demisto
 import pytest
@@ -523,3 +524,34 @@ def test_no_content_file(mocker):
     results = demisto.results.call_args[0]
     assert len(results) == 1
     assert 'Could not extract email from file' in results[0]['Contents']
+
+
+def test_eml_parse_only_headers():
+    headers, attached_emails = handle_eml('test_data/multiple_to_cc.eml', parse_only_headers=True)
+    full_headers, _ = handle_eml('test_data/multiple_to_cc.eml', max_depth=1)
+    assert attached_emails == []
+    assert list(headers.keys()) == ['HeadersMap']
+    assert headers['HeadersMap'] == full_headers['HeadersMap']
+
+
+@pytest.mark.parametrize('payload', [
+    'SGVsbG8gV29y\nbGQhCg==\n',  # 'Hello World!\n'
+    'SGVsbG8gV29y\r\nbGQhCg==',
+    'SGVsbG8gV29ybGQh',
+])
+def test_write_base64_payload(mocker, payload):
+    """
+    Given: base64 payloads, decoded in chunks smaller than a base64 quantum
+    Then: the payload is decoded as it is by Message.get_payload(decode=True)
+    """
+    from StringIO import StringIO
+    import base64
+    mocker.patch.object(ParseEmailFiles, 'BASE64_CHUNK_SIZE', 3)
+    output = StringIO()
+    assert write_base64_payload(payload, output)
+    assert output.getvalue() == base64.decodestring(payload)
+
+
+def test_write_base64_payload_padding_inside():
+    from StringIO import StringIO
+    assert not write_base64_payload('SGk=SGk=', StringIO())
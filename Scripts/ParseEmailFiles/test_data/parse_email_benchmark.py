@@ -0,0 +1,88 @@
+"""
+Benchmark of ParseEmailFiles.handle_eml - compares parsing an eml file twice and decoding every attachment as a
+whole in memory against the single parse with chunked attachment decoding, over a generated email with large
+base64 attachments. Each variant runs in its own process, so its peak memory is measured separately.
+
+Run from the script directory (next to CommonServerPython.py and demistomock.py) with python 2:
+    python test_data/parse_email_benchmark.py
+"""
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from email import message_from_string
+from email.mime.application import MIMEApplication
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from email.parser import HeaderParser
+
+import demistomock as demisto
+
+demisto.results = lambda results: None  # noqa: E731
+
+from CommonServerPython import fileResult  # noqa: E402
+from ParseEmailFiles import handle_eml  # noqa: E402
+
+ATTACHMENTS = 4
+ATTACHMENT_SIZE = 16 * 1024 * 1024
+
+
+def create_eml(file_path):
+    eml = MIMEMultipart()
+    eml['Subject'] = 'benchmark'
+    eml['From'] = 'sender@example.com'
+    eml['To'] = 'recipient@example.com'
+    eml.attach(MIMEText('body'))
+    for i in range(ATTACHMENTS):
+        attachment = MIMEApplication(os.urandom(ATTACHMENT_SIZE))
+        attachment.add_header('Content-Disposition', 'attachment', filename='attachment{}.bin'.format(i))
+        eml.attach(attachment)
+    with open(file_path, 'wb') as eml_file:
+        eml_file.write(eml.as_string())
+
+
+def legacy_handle_eml(file_path):
+    with open(file_path, 'rb') as eml_file:
+        file_data = eml_file.read()
+    HeaderParser().parsestr(file_data)
+    eml = message_from_string(file_data)
+    for part in eml.walk():
+        if part.get_filename():
+            fileResult(part.get_filename(), part.get_payload(decode=True))
+
+
+def run(variant, file_path):
+    start = time.time()
+    if variant == 'before':
+        legacy_handle_eml(file_path)
+    else:
+        handle_eml(file_path, file_name='benchmark.eml')
+    elapsed = time.time() - start
+    for saved_file in os.listdir('.'):
+        if saved_file.startswith(demisto.investigation()['id'] + '_'):
+            os.remove(saved_file)
+    print '{:.2f} s, peak RSS {:.0f} MB'.format(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0)
+
+
+def main():
+    if len(sys.argv) == 3:
+        run(sys.argv[1], sys.argv[2])
+        return
+
+    eml_file = tempfile.NamedTemporaryFile(suffix='.eml', delete=False)
+    eml_file.close()
+    try:
+        create_eml(eml_file.name)
+        print '{} attachments of {} MB ({:.0f} MB eml)'.format(ATTACHMENTS, ATTACHMENT_SIZE / 1024 / 1024,
+                                                             os.path.getsize(eml_file.name) / 1024.0 / 1024)
+        for variant in ('before', 'after'):
+            output = subprocess.check_output([sys.executable, __file__, variant, eml_file.name])
+            print '    {}: {}'.format(variant, output.strip())
+    finally:
+        os.remove(eml_file.name)
+
+
+if __name__ == '__main__':
+    main()
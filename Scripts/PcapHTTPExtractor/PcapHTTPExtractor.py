@@ -3,6 +3,7 @@ from CommonServerPython import *
 from CommonServerUserPython import *
 import zlib
 import pyshark
+from collections import deque
 from datetime import datetime
 import re
 
@@ -115,25 +116,6 @@ def get_entry_from_args():
     return res, entry_id
 
 
-def _chunker(seq, size):
-    """
-    Function that groups items in a sequence for easier iteration of multiple items at once.
-
-    :param seq: the sequence (list/generator)
-    :param size: the size of the group (chunk)
-    :return: an iterator that outputs groups of items (chunks) from the sequence
-    """
-    ret = []
-    for i in range(0, len(seq), size):
-        chunk = seq[i: i + size]
-
-        # Make sure the chunks are with a specified size
-        padding = ["" for j in range(size - len(chunk))]
-        ret.append(chunk + padding)
-
-    return iter(ret)
-
-
 def decode_gzip(str_compressed):
     """
     Decode a hex string with gz decompression
@@ -155,80 +137,69 @@ def _date_to_ISO(strdate):
     return datetime.strptime(strdate, '%a, %d %b %Y %H:%M:%S %Z').isoformat()
 
 
-def get_next_matching_index(http_packets, tcp_src, tcp_dst, ip_src, ip_dst):
-    for i, p in enumerate(http_packets):
-        if p["TCP"].srcport == tcp_dst and \
-                p["TCP"].dstport == tcp_src and \
-                p["IP"].src == ip_dst and \
-                p["IP"].dst == ip_src:
-            return i
-    return None
+def get_flow_key(packet):
+    """
+    Returns the ip, tcp tuple of the packet - (ip src, tcp src, ip dst, tcp dst).
+    """
+    return packet["IP"].src, packet["TCP"].srcport, packet["IP"].dst, packet["TCP"].dstport
 
 
-def fix_order(http_packets):
+def pair_http_packets(http_packets, max_flows=None):
     """
-    Re-organizes the http packets to be request-response pairs.
+    Organizes the http packets to be request-response pairs.
     Sometimes pyshark doesn't put the packets in the order they are HTTP-wise.
-    So we are re-organizing them according to the tcp and ip information of the packets.
-    :param http_packets:
-    :return: http_packets
+    So each packet is paired with the first following packet that matches its reversed tcp,ip tuple. The unpaired
+    packets waiting for a match are kept in a FIFO queue per tuple.
+
+    :param http_packets: iterable of the http packets, in capture order
+    :param max_flows: stop reading packets once the first max_flows pairs are complete
+    :return: list of requests/response pairs, ordered by the request. The response is None if no match was found.
     """
-    new_order = []
-
-    # For each packet find the next one that matches the tcp,ip tuple.
-    while len(http_packets) > 0:
-        packet = http_packets[0]
-        tcp_src = packet["TCP"].srcport
-        tcp_dst = packet["TCP"].dstport
-        ip_src = packet["IP"].src
-        ip_dst = packet["IP"].dst
-        new_order.append(packet)
-        del http_packets[0]
-
-        next_matching_index = get_next_matching_index(http_packets, tcp_src, tcp_dst, ip_src, ip_dst)
-        if next_matching_index is None:
-            new_order.append(None)
+    http_flows = []
+    waiting_flows = {}  # type: dict
+    incomplete_first_flows = 0
+
+    for packet in http_packets:
+        key = get_flow_key(packet)
+        waiting = waiting_flows.get(key)
+        if waiting:
+            flow = waiting.popleft()
+            flow["Response"] = packet
+            if max_flows is not None and flow["Index"] < max_flows:
+                incomplete_first_flows -= 1
         else:
-            new_order.append(http_packets[next_matching_index])
-            del http_packets[next_matching_index]
+            flow = {"Index": len(http_flows), "Request": packet, "Response": None}
+            http_flows.append(flow)
+            reversed_key = (key[2], key[3], key[0], key[1])
+            waiting_flows.setdefault(reversed_key, deque()).append(flow)
+            if max_flows is not None and flow["Index"] < max_flows:
+                incomplete_first_flows += 1
+
+        if max_flows is not None and len(http_flows) >= max_flows and incomplete_first_flows == 0:
+            break
 
-    return new_order
+    return [{"Request": flow["Request"], "Response": flow["Response"]} for flow in http_flows]
 
 
-def get_http_flows(pcap_file_path):
+def get_http_flows(pcap_file_path, max_flows=None, display_filter='http'):
     """
     Return a list of HTTP requests/responses from pcap file
 
     :param pcap_file_path:
+    :param max_flows: the number of flows needed, the capture is read only until they are complete
+    :param display_filter: tshark display filter of the packets to read, tcp reads all the tcp packets
     :return: list of requests/response pairs.
     """
-    capture_object = pyshark.FileCapture(pcap_file_path, display_filter='tcp')
-
-    # Filter all non HTTP packets
-    http_packets = [p for p in capture_object if "HTTP" in p]
-
-    http_packets = fix_order(http_packets)
-
-    # Construct request <> response dicts
-    http_flows = []
-    for req, res in _chunker(http_packets, 2):
-        # GZ decompress if needed
-        # if res["HTTP"].get_field_value("Content-Encoding") == "gzip":
-        #
-        #     # Fix data not existing
-        #     if not hasattr(res["HTTP"], "data"):
-        #         res["HTTP"].data = res["HTTP"].get("file_data")
-        #     # else:
-        #         # try:
-        #         #     res["HTTP"].data = decode_gzip(res["HTTP"].data)
-        #         # except zlib.error:
-        #         #     res["HTTP"].data = "Couldn't decompress gzip data (incomplete or truncated stream)."
-
-        http_flows.append({
-            "Request": req,
-            "Response": res
-        })
-    return http_flows
+    # capture filters can't be applied when reading a file, so tshark dissects every packet and the display filter
+    # only saves parsing the non matching packets here.
+    # packets are not kept by the capture, they are read one at a time
+    capture_object = pyshark.FileCapture(pcap_file_path, display_filter=display_filter, keep_packets=False)
+    try:
+        # Filter all non HTTP packets
+        http_packets = (p for p in capture_object if "HTTP" in p)
+        return pair_http_packets(http_packets, max_flows)
+    finally:
+        capture_object.close()
 
 
 def get_flow_info(http_flow):
@@ -385,8 +356,11 @@ if __name__ == "builtins":
     else:
         ALLOWED_CONTENT_TYPES = tuple(demisto.args()["allowedContentTypes"].split(","))  # type: ignore
 
-    # Work on the pcap file and return a result
-    http_flows = get_http_flows(pcap_file_path_in_container)
+    DISPLAY_FILTER = demisto.args().get("displayFilter") or "http"
+
+    # Work on the pcap file and return a result, the capture is read until the last needed flow
+    max_flows = int(START or 0) + int(LIMIT) if LIMIT else None
+    http_flows = get_http_flows(pcap_file_path_in_container, max_flows, DISPLAY_FILTER)
 
     # Cut results according to the user args (times 2, because we are working on pairs of requests and responses).
     if START:
@@ -0,0 +1,74 @@
+from collections import namedtuple
+
+from PcapHTTPExtractor import pair_http_packets
+
+IP = namedtuple('IP', 'src dst')
+TCP = namedtuple('TCP', 'srcport dstport')
+
+CLIENT_1 = ('10.0.0.1', '50001')
+CLIENT_2 = ('10.0.0.2', '50002')
+SERVER = ('10.0.0.100', '80')
+
+
+class FakePacket(dict):
+    def __init__(self, name, src, dst):
+        super(FakePacket, self).__init__(IP=IP(src[0], dst[0]), TCP=TCP(src[1], dst[1]))
+        self.name = name
+
+
+def flow_names(http_flows):
+    return [(flow['Request'].name, flow['Response'].name if flow['Response'] else None) for flow in http_flows]
+
+
+def test_pair_http_packets_interleaved_flows():
+    """
+    Given: the requests and responses of two clients, interleaved, and a response without a request
+    When: pairing the packets
+    Then: each request is paired with the first following response of its flow, and the unmatched response is kept
+    """
+    packets = [
+        FakePacket('req1', CLIENT_1, SERVER),
+        FakePacket('req2', CLIENT_2, SERVER),
+        FakePacket('req3', CLIENT_1, SERVER),
+        FakePacket('res2', SERVER, CLIENT_2),
+        FakePacket('res1', SERVER, CLIENT_1),
+        FakePacket('res3', SERVER, CLIENT_1),
+        FakePacket('req4', CLIENT_2, SERVER),
+    ]
+    assert flow_names(pair_http_packets(packets)) == [('req1', 'res1'), ('req2', 'res2'), ('req3', 'res3'),
+                                                      ('req4', None)]
+
+
+def test_pair_http_packets_response_without_request():
+    """
+    Given: a capture starting with a response, whose request was not captured
+    When: pairing the packets
+    Then: the response starts a flow of its own, and is paired with the next packet of the reversed tuple
+    """
+    packets = [
+        FakePacket('res0', SERVER, CLIENT_1),
+        FakePacket('req1', CLIENT_1, SERVER),
+        FakePacket('res1', SERVER, CLIENT_1),
+    ]
+    assert flow_names(pair_http_packets(packets)) == [('res0', 'req1'), ('res1', None)]
+
+
+def test_pair_http_packets_max_flows():
+    """
+    Given: more flows than needed
+    When: pairing the packets with max_flows
+    Then: the packets are read only until the first max_flows flows have their responses
+    """
+    packets = iter([
+        FakePacket('req1', CLIENT_1, SERVER),
+        FakePacket('req2', CLIENT_2, SERVER),
+        FakePacket('res2', SERVER, CLIENT_2),
+        FakePacket('req3', CLIENT_2, SERVER),
+        FakePacket('res1', SERVER, CLIENT_1),
+        FakePacket('res3', SERVER, CLIENT_2),
+        FakePacket('req4', CLIENT_1, SERVER),
+    ])
+    http_flows = pair_http_packets(packets, max_flows=2)
+    # req3 was read before req1 got its response
+    assert flow_names(http_flows) == [('req1', 'res1'), ('req2', 'res2'), ('req3', None)]
+    assert [packet.name for packet in packets] == ['res3', 'req4']
@@ -8,6 +8,8 @@ import re
 import errno
 import shutil
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import List
 
 
@@ -19,15 +21,21 @@ class ShellException(Exception):
 try:
     ROOT_PATH = os.getcwd()
     MAX_IMAGES = int(demisto.args().get('maxImages', 20))
+    MAX_PAGES = int(demisto.args().get('maxPages') or 0)
 except OSError:
     return_error("The script failed to access the current working directory. This might happen if your docker isn't "
                  "set up correctly. Please contact customer support")
 except ValueError:
-    return_error("Value provided for maxImages is of the wrong type. Please provide an integer for maxImages")
+    return_error("Value provided for maxImages or maxPages is of the wrong type. Please provide an integer for "
+                 "maxImages and maxPages")
 
 EMAIL_REGXEX = "[a-zA-Z0-9-_.]+@[a-zA-Z0-9-_.]+"
 # Documentation claims png is enough for pdftohtml, but through testing we found jpg can be generated as well
 IMG_FORMATS = ['jpg', 'jpeg', 'png', 'gif']
+# the urls usually appear in the form: '/URI (url)'
+BINARY_URI_REGEX = re.compile(rb'/URI \((.*?)\)', re.DOTALL)
+BINARY_URI_PREFIX = b'/URI ('
+URI_SCAN_CHUNK_SIZE = 1024 * 1024
 
 
 def mark_suspicious(suspicious_reason, entry_id):
@@ -122,34 +130,39 @@ def get_pdf_metadata(file_path):
     return metadata
 
 
-def get_pdf_text(file_path, pdf_text_output_path):
+def get_pages_args(max_pages=None):
+    """Returns the poppler first/last page arguments for converting only the first max_pages pages"""
+    return ['-f', '1', '-l', str(max_pages)] if max_pages else []
+
+
+def get_pdf_text(file_path, pdf_text_output_path, max_pages=None):
     """Creates a txt file from the pdf in the pdf_text_output_path and returns the content of the txt file"""
     user_password = demisto.args().get('userPassword')
+    pages_args = get_pages_args(max_pages)
     if user_password:
-        run_shell_command('pdftotext', '-upw', user_password, file_path, pdf_text_output_path)
+        run_shell_command('pdftotext', '-upw', user_password, *pages_args, file_path, pdf_text_output_path)
     else:
-        run_shell_command('pdftotext', file_path, pdf_text_output_path)
-    text = ''
+        run_shell_command('pdftotext', *pages_args, file_path, pdf_text_output_path)
     with open(pdf_text_output_path, 'rb') as f:
-        for line in f:
-            text += line.decode('utf-8')
-    return text
+        return f.read().decode('utf-8')
 
 
-def get_pdf_htmls_content(pdf_path, output_folder):
+def get_pdf_htmls_content(pdf_path, output_folder, max_pages=None, extract_images=True):
     """Creates an html file and images from the pdf in output_folder and returns the text content of the html files"""
     pdf_html_output_path = f'{output_folder}/PDF.html'
     user_password = demisto.args().get('userPassword')
+    args = get_pages_args(max_pages)
+    if not extract_images:
+        args.append('-i')
     if user_password:
-        run_shell_command('pdftohtml', '-upw', user_password, pdf_path, pdf_html_output_path)
+        run_shell_command('pdftohtml', '-upw', user_password, *args, pdf_path, pdf_html_output_path)
     else:
-        run_shell_command('pdftohtml', pdf_path, pdf_html_output_path)
-    html_file_names = get_files_names_in_path(output_folder, '*.html')
+        run_shell_command('pdftohtml', *args, pdf_path, pdf_html_output_path)
+    # the folder is globbed without changing the working directory, as the other extractions run concurrently
     html_content = ''
-    for file_name in html_file_names:
+    for file_name in glob.glob(os.path.join(glob.escape(str(output_folder)), '*.html')):
         with open(file_name, 'rb') as f:
-            for line in f:
-                html_content += line.decode('utf-8')
+            html_content += f.read().decode('utf-8')
     return html_content
 
 
@@ -232,15 +245,28 @@ def build_readpdf_entry_context(indicators_map):
     return ec
 
 
-def get_urls_from_binary_file(file_path):
-    """Reading from the binary pdf in the pdf_text_output_path and returns a list of the urls in the file"""
+def iter_binary_uris(file_path):
+    """Reads the binary pdf in chunks and yields the '/URI (url)' values in it, as in the str of the bytes"""
+    pending = b''
     with open(file_path, 'rb') as file:
-        # the urls usually appear in the form: '/URI (url)'
-        urls = re.findall(r'/URI \((.*?)\)', str(file.read()))
+        for chunk in iter(partial(file.read, URI_SCAN_CHUNK_SIZE), b''):
+            data = pending + chunk
+            end = 0
+            for match in BINARY_URI_REGEX.finditer(data):
+                yield str(match.group(1))[2:-1]
+                end = match.end()
+            # keep the unclosed uri, or the end of the chunk which may hold the beginning of a split one
+            uri_start = data.find(BINARY_URI_PREFIX, end)
+            if uri_start == -1:
+                uri_start = max(end, len(data) - len(BINARY_URI_PREFIX) + 1)
+            pending = data[uri_start:]
+
 
+def get_urls_from_binary_file(file_path):
+    """Reading from the binary pdf in the pdf_text_output_path and returns a list of the urls in the file"""
     binary_file_urls = set()
     # make sure the urls match the url regex
-    for url in urls:
+    for url in iter_binary_uris(file_path):
         mached_url = re.findall(urlRegex, url)
         if len(mached_url) != 0:
             binary_file_urls.add(mached_url[0])
@@ -273,18 +299,28 @@ def main():
                 folders_to_remove.append(output_folder)
                 cpy_file_path = f'{output_folder}/ReadPDF.pdf'
                 shutil.copy(path, cpy_file_path)
-                # Get metadata:
-                metadata = get_pdf_metadata(cpy_file_path)
+                pdf_text_output_path = f'{output_folder}/PDFText.txt'
+                # The extractions are independent, so they run concurrently
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    # Get metadata:
+                    metadata_future = executor.submit(get_pdf_metadata, cpy_file_path)
 
-                # Get urls from the binary file
-                binary_file_urls = get_urls_from_binary_file(cpy_file_path)
+                    # Get urls from the binary file
+                    binary_file_urls_future = executor.submit(get_urls_from_binary_file, cpy_file_path)
 
-                # Get text:
-                pdf_text_output_path = f'{output_folder}/PDFText.txt'
-                text = get_pdf_text(cpy_file_path, pdf_text_output_path)
+                    # Get text:
+                    text_future = executor.submit(get_pdf_text, cpy_file_path, pdf_text_output_path, MAX_PAGES)
+
+                    # Get html for URLS + emails:
+                    pdf_html_content_future = executor.submit(get_pdf_htmls_content, cpy_file_path, output_folder,
+                                                              MAX_PAGES, MAX_IMAGES > 0)
+
+                metadata = metadata_future.result()
+                binary_file_urls = binary_file_urls_future.result()
+                text = text_future.result()
+                pdf_html_content = pdf_html_content_future.result()
 
                 # Get URLS + emails:
-                pdf_html_content = get_pdf_htmls_content(cpy_file_path, output_folder)
                 urls = re.findall(urlRegex, pdf_html_content)
                 urls_set = set(urls)
                 emails_set = set(re.findall(EMAIL_REGXEX, pdf_html_content))
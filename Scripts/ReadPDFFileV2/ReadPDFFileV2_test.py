@@ -153,3 +153,21 @@ def test_build_readpdf_entry_object_empty_extract(mocker):
     pdf_file = {'Text': 'test'}
     res = build_readpdf_entry_object(pdf_file, {}, '', '', '', '')
     assert res[0]['HumanReadable'] == '### Metadata\n\n### URLs\n\n### Text\n'
+
+
+def test_get_urls_from_binary_file(mocker):
+    """
+    Given: a pdf with a link, read in chunks smaller than the link
+    Then: the link is found as when reading the file at once
+    """
+    import ReadPDFFileV2
+    mocker.patch.object(ReadPDFFileV2, 'URI_SCAN_CHUNK_SIZE', 7)
+    assert ReadPDFFileV2.get_urls_from_binary_file(f'{CWD}/hyperlinks.pdf') == {'http://www.antennahouse.com/purchase.htm'}
+
+
+def test_get_pdf_text_max_pages(mocker, tmp_path):
+    mocker.patch.object(demisto, 'args', return_value={'userPassword': '1234'})
+    from ReadPDFFileV2 import get_pdf_text
+    text = get_pdf_text(f'{CWD}/encrypted.pdf', f'{tmp_path}/encrypted.txt', max_pages=1)
+    # pdftotext ends every page with a form feed, the file has 2 pages
+    assert text.count('\x0c') == 1
@@ -0,0 +1,100 @@
+"""
+Benchmark of the ReadPDFFileV2 extraction - compares the sequential extraction of all the pages and images against
+the concurrent extraction, with and without maxPages and images, over a generated 500 pages pdf with a link and an
+image in every page.
+
+Requires poppler-utils. Run from the script directory (next to CommonServerPython.py and demistomock.py):
+    python test_data/read_pdf_benchmark.py
+"""
+import os
+import shutil
+import tempfile
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+import ReadPDFFileV2
+
+PAGES = 500
+IMAGE_SIZE = 256
+
+
+def create_pdf(file_path):
+    """Writes a pdf of PAGES pages, each with text, a link and an image"""
+    objects = [b'<< /Type /Catalog /Pages 2 0 R >>', b'']
+    image = zlib.compress(os.urandom(IMAGE_SIZE * IMAGE_SIZE * 3 // 4) * 4)
+    page_ids = []
+    for page in range(PAGES):
+        text = f'BT /F1 12 Tf 72 720 Td (Page {page} of the report, contact user{page}@example.com) Tj ET ' \
+               f'q 200 0 0 200 72 400 cm /Im0 Do Q'.encode()
+        objects.append(b'<< /Length %d >>\nstream\n%s\nendstream' % (len(text), text))
+        content_id = len(objects)
+        objects.append(b'<< /Type /XObject /Subtype /Image /Width %d /Height %d /ColorSpace /DeviceRGB '
+                       b'/BitsPerComponent 8 /Filter /FlateDecode /Length %d >>\nstream\n%s\nendstream'
+                       % (IMAGE_SIZE, IMAGE_SIZE, len(image), image))
+        image_id = len(objects)
+        objects.append(b'<< /Type /Annot /Subtype /Link /Rect [72 700 300 730] '
+                       b'/A << /S /URI /URI (https://example.com/page/%d) >> >>' % page)
+        link_id = len(objects)
+        objects.append(b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents %d 0 R /Annots [%d 0 R] '
+                       b'/Resources << /Font << /F1 << /Type /Font /Subtype /Type1 /BaseFont /Helvetica >> >> '
+                       b'/XObject << /Im0 %d 0 R >> >> >>' % (content_id, link_id, image_id))
+        page_ids.append(len(objects))
+    objects[1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (b' '.join(b'%d 0 R' % i for i in page_ids), PAGES)
+
+    with open(file_path, 'wb') as pdf_file:
+        pdf_file.write(b'%PDF-1.4\n')
+        offsets = []
+        for object_id, pdf_object in enumerate(objects, 1):
+            offsets.append(pdf_file.tell())
+            pdf_file.write(b'%d 0 obj\n%s\nendobj\n' % (object_id, pdf_object))
+        xref_offset = pdf_file.tell()
+        pdf_file.write(b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1))
+        pdf_file.write(b''.join(b'%010d 00000 n \n' % offset for offset in offsets))
+        pdf_file.write(b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n'
+                       % (len(objects) + 1, xref_offset))
+
+
+def sequential(pdf_path, output_folder):
+    return (ReadPDFFileV2.get_pdf_metadata(pdf_path),
+            ReadPDFFileV2.get_urls_from_binary_file(pdf_path),
+            ReadPDFFileV2.get_pdf_text(pdf_path, f'{output_folder}/PDFText.txt'),
+            ReadPDFFileV2.get_pdf_htmls_content(pdf_path, output_folder))
+
+
+def concurrent(pdf_path, output_folder, max_pages=None, extract_images=True):
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(ReadPDFFileV2.get_pdf_metadata, pdf_path),
+                   executor.submit(ReadPDFFileV2.get_urls_from_binary_file, pdf_path),
+                   executor.submit(ReadPDFFileV2.get_pdf_text, pdf_path, f'{output_folder}/PDFText.txt', max_pages),
+                   executor.submit(ReadPDFFileV2.get_pdf_htmls_content, pdf_path, output_folder, max_pages,
+                                   extract_images)]
+    return tuple(future.result() for future in futures)
+
+
+def measure(name, func, pdf_path, *args):
+    output_folder = tempfile.mkdtemp()
+    try:
+        start = time.perf_counter()
+        result = func(pdf_path, output_folder, *args)
+        elapsed = time.perf_counter() - start
+        images = len(ReadPDFFileV2.get_images_paths_in_path(output_folder))
+    finally:
+        os.chdir(ReadPDFFileV2.ROOT_PATH)
+        shutil.rmtree(output_folder)
+    print(f'    {name}: {elapsed:.2f} s, {images} images')
+    return result
+
+
+if __name__ == '__main__':
+    pdf_path = os.path.join(tempfile.mkdtemp(), 'benchmark.pdf')
+    try:
+        create_pdf(pdf_path)
+        print(f'{PAGES} pages ({os.path.getsize(pdf_path) / 1024 / 1024:.1f} MB pdf)')
+        before = measure('sequential', sequential, pdf_path)
+        after = measure('concurrent', concurrent, pdf_path)
+        assert before[:3] == after[:3]
+        measure('concurrent, maxPages=20', concurrent, pdf_path, 20)
+        measure('concurrent, maxPages=20, no images', concurrent, pdf_path, 20, False)
+    finally:
+        shutil.rmtree(os.path.dirname(pdf_path))
@@ -24,6 +24,23 @@ PATTERNS_DICT = {
     "registry-key:key": "Registry Path Reputation",
     "user-account": "Username"
 }
+# A comparison term of a STIX2 pattern, e.g. `file:hashes.'SHA-256' = '<value>'`. Quoted property names may contain spaces
+PATTERN_TERM_REGEX = re.compile(
+    r"(?P<type>{})(?:[^\s=']|'[^']*')*? = '(?P<value>.*?)'".format("|".join(re.escape(key) for key in PATTERNS_DICT))
+)
+MUST_HAVE_IN_STIX = (
+    "created",
+    "id",
+    "labels",
+    "modified",
+    "pattern",
+    "score",
+    "source",
+    "type",
+    "valid_from"
+)
+WHITESPACE_REGEX = re.compile(r"[ \t\n\r]*")
+BATCH_SIZE = 1000
 
 """ HELPER FUNCTIONS"""
 
@@ -152,47 +169,58 @@ def dbot_score(score):
     return 0
 
 
-def build_entry(indicators_dict, stix_indicators_dict, pkg_id):
-    """Extracting all pattern from stix object
-    function will take care of one bundle only.
+def create_entry(stix_object, indicator_type, value, pkg_id):
+    """Creates the indicator entry of a value parsed from a STIX2 object
+
     Args:
-        pkg_id (str):
-        stix_indicators_dict (dict):
-        indicators_dict (dict):
+        stix_object (dict): STIX2 object defining the indicator
+        indicator_type (str): indicator type
+        value (str): indicator value
+        pkg_id (str): package id
 
     Returns:
-        list: Results output
+        dict: indicator entry (see create_indicator_entry)
+    """
+    score = (
+        dbot_score(stix_object.get("score"))
+        if "score" in stix_object
+        else get_score(stix_object.get("description"))
+    )
+    return create_indicator_entry(
+        indicator_type=indicator_type,
+        value=value,
+        pkg_id=pkg_id,
+        ind_id=stix_object.get("id"),
+        timestamp=stix_object.get("created"),
+        source=stix_object.get("source"),
+        score=score
+    )
+
+
+def parse_indicators(stix_indicator):
+    """Parses the indicators of a STIX2 object, in the order they appear in its pattern
+
+    Args:
+        stix_indicator (dict): STIX2 object
 
+    Yields:
+        (str, str): indicator type and value
     """
-    results_list = list()
-    for key, indicators_list in indicators_dict.items():
-        for indicator in indicators_list:
-            obj = stix_indicators_dict.get(indicator)
-            if isinstance(obj, dict):
-                # Creating parameters
-                ind_id = obj.get("id")
-                source = obj.get("source")
-                # times
-                timestamp = obj.get("created")
-
-                score = (
-                    dbot_score(obj.get("score"))
-                    if "score" in obj
-                    else get_score(obj.get("description"))
-                )
-
-                result = create_indicator_entry(
-                    indicator_type=key,
-                    value=indicator,
-                    pkg_id=pkg_id,
-                    ind_id=ind_id,
-                    timestamp=timestamp,
-                    source=source,
-                    score=score
-                )
-                if result:
-                    results_list.append(result)
-    return results_list
+    if not isinstance(stix_indicator, dict):
+        return
+    pattern = stix_indicator.get("pattern")
+    if pattern:
+        for term in PATTERN_TERM_REGEX.finditer(pattern):
+            indicator_type = PATTERNS_DICT[term.group("type")]
+            value = term.group("value")
+            if indicator_type in ("IP", "URL", "Domain"):
+                value = ip_parser(value)
+            yield indicator_type, value
+    # Handle CVE
+    elif stix_indicator.get("description") == "cve cvss score":
+        value = stix_indicator.get("name")
+        if value:
+            yield "CVE CVSS Score", value
 
 
 def get_indicators(indicators):
@@ -215,37 +243,6 @@ def get_indicators(indicators):
             }
         )
     """
-
-    def indicators_parser(stix_indicator):
-        # type: (dict) -> None
-        """
-        Args:
-            stix_indicator (dict):
-        """
-        pattern = stix_indicator.get("pattern")
-        if pattern:
-            groups = regex.findall(pattern)
-            if groups:
-                for key, value in PATTERNS_DICT.items():
-                    for term in groups:
-                        '''
-                        term should be list with 2 argument parsed with regex
-                        [`pattern`, `indicator`]
-                        '''
-                        if len(term) == 2 and key in term[0]:
-                            new_indicator = term[1]
-                            if value in ("IP", "URL", "Domain"):
-                                new_indicator = ip_parser(new_indicator)
-                            patterns_lists[value].append(new_indicator)
-                            entries_dict[new_indicator] = stix_indicator
-        # Handle CVE
-        elif stix_indicator.get("description") == "cve cvss score":
-            new_indicator = stix_indicator.get("name")
-            if new_indicator:
-                patterns_lists["CVE CVSS Score"].append(new_indicator)
-                entries_dict[new_indicator] = stix_indicator
-
-    regex = re.compile("(\\w.*?) = '(.*?)'")
     patterns_lists = {
         "File": list(),
         "IP": list(),
@@ -260,83 +257,194 @@ def get_indicators(indicators):
     # Will hold values for package {"KEY": <STIX OBJECT>}
     entries_dict = dict()  # type: dict
 
-    if isinstance(indicators, list):
-        for indicator in indicators:
-            indicators_parser(indicator)
-    else:
-        indicators_parser(indicators)
+    if not isinstance(indicators, list):
+        indicators = [indicators]
+    for stix_indicator in indicators:
+        for indicator_type, value in parse_indicators(stix_indicator):
+            patterns_lists[indicator_type].append(value)
+            entries_dict[value] = stix_indicator
     return patterns_lists, entries_dict
 
 
-def extract_indicators(data):
-    """Gets dict of STIX2.0 object (one in a time)
+def get_bundle_objects(bundle):
+    """Gets the STIX2 objects of a bundle, or the object itself if it's a single STIX2 object
 
     Args:
-        data: (dict) of STIX2 object. can be
+        bundle (dict): STIX2 bundle or object
 
     Returns:
-        (dict, dict):
-            First dict contains indicator types to indicator value
-            Second dict contains indicators value to STIX object defining them
+        list: STIX2 objects
+    """
+    if "objects" in bundle:
+        objects = bundle.get("objects")
+        return objects if isinstance(objects, list) else [objects]
+    # If its STIX
+    if all(key in bundle for key in MUST_HAVE_IN_STIX):
+        return [bundle]
+    return_error("No STIX2 object could be parsed")
+
+
+class JSONStream(object):
+    """Walks over a JSON text, decoding one value at a time instead of the whole text."""
+
+    def __init__(self, text):
+        self.text = text
+        self.index = 0
+        self.decoder = json.JSONDecoder()
+
+    def peek(self):
+        self.index = WHITESPACE_REGEX.match(self.text, self.index).end()
+        return self.text[self.index:self.index + 1]
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError("Expecting '{}' at char {}".format(char, self.index))
+        self.index += 1
+
+    def decode(self):
+        self.peek()
+        value, self.index = self.decoder.raw_decode(self.text, self.index)
+        return value
+
+    def iter_array(self):
+        """Yields once for every element of the array, the caller should read the element before continuing."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.index += 1
+            return
+        while True:
+            yield
+            if self.peek() != ",":
+                self.expect("]")
+                return
+            self.index += 1
+
+    def iter_object(self):
+        """Yields the keys of the object, the caller should read the value of the key before continuing."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.index += 1
+            return
+        while True:
+            key = self.decode()
+            self.expect(":")
+            yield key
+            if self.peek() != ",":
+                self.expect("}")
+                return
+            self.index += 1
+
+
+def iter_stream_bundle(stream):
+    """Parses a STIX2 bundle from the stream, decoding its objects one at a time
 
+    Args:
+        stream (JSONStream): stream positioned at the bundle
+
+    Yields:
+        (str, dict): bundle id and STIX2 object
     """
-    must_have_in_stix = [
-        "created",
-        "id",
-        "labels",
-        "modified",
-        "pattern",
-        "score",
-        "source",
-        "type",
-        "valid_from"
-    ]
-    if isinstance(data, dict):
-        # Check if is `objects` keyword exists
-        if "objects" in data:
-            objects = data.get("objects")
-        # If its STIX
-        elif all(key in data for key in must_have_in_stix):
-            objects = data
+    bundle = dict()  # type: dict
+    has_objects = False
+    objects_index = None
+    for key in stream.iter_object():
+        if key == "objects" and stream.peek() == "[":
+            has_objects = True
+            if "id" in bundle:
+                for _ in stream.iter_array():
+                    yield bundle["id"], stream.decode()
+            else:
+                # The bundle id comes after the objects, they are read again once it is known
+                objects_index = stream.index
+                for _ in stream.iter_array():
+                    stream.decode()
         else:
-            return_error("No STIX2 object could be parsed")
-        # Use regex to extract indicators
-        patterns_lists, entries_dict = get_indicators(objects)
+            bundle[key] = stream.decode()
+
+    if objects_index is not None:
+        end_index = stream.index
+        stream.index = objects_index
+        for _ in stream.iter_array():
+            yield bundle.get("id"), stream.decode()
+        stream.index = end_index
+    elif not has_objects:
+        for stix_object in get_bundle_objects(bundle):
+            yield bundle.get("id"), stix_object
+
 
-        # Make all the values unique
-        for key, value in patterns_lists.items():
-            patterns_lists[key] = list(set(value))  # type: ignore
+def iter_stix2_objects(text):
+    """Incrementally parses a STIX2 json text, which may be a bundle, a single STIX2 object or a list of them
 
-        return patterns_lists, entries_dict
+    Args:
+        text (str): STIX2 json text
+
+    Yields:
+        (str, dict): bundle id and STIX2 object
+    """
+    stream = JSONStream(text)
+    if stream.peek() == "[":
+        for _ in stream.iter_array():
+            for bundle_object in iter_stream_bundle(stream):
+                yield bundle_object
     else:
-        return_error("No STIX2 object could be parsed")
+        for bundle_object in iter_stream_bundle(stream):
+            yield bundle_object
+
+
+def iter_parsed_stix2_objects(stx_obj):
+    """Gets the STIX2 objects of a json object, which may be a bundle, a single STIX2 object or a list of them
+
+    Args:
+        stx_obj (dict or list): STIX2 json object
+
+    Yields:
+        (str, dict): bundle id and STIX2 object
+    """
+    bundles = stx_obj if isinstance(stx_obj, list) else [stx_obj]
+    for bundle in bundles:
+        if not isinstance(bundle, dict):
+            return_error("No STIX2 object could be parsed")
+        for stix_object in get_bundle_objects(bundle):
+            yield bundle.get("id"), stix_object
+
+
+def iter_indicator_batches(stix_objects, batch_size=BATCH_SIZE):
+    """Creates the indicator entries of STIX2 objects, every indicator once per package
+
+    Args:
+        stix_objects (iterable): bundle id and STIX2 object pairs
+        batch_size (int): number of entries in a batch
+
+    Yields:
+        list: indicator entries
+    """
+    batch = list()  # type: list
+    seen_indicators = set()  # type: set
+    for pkg_id, stix_object in stix_objects:
+        for indicator_type, value in parse_indicators(stix_object):
+            indicator_key = (pkg_id, indicator_type, value)
+            if indicator_key in seen_indicators:
+                continue
+            seen_indicators.add(indicator_key)
+            batch.append(create_entry(stix_object, indicator_type, value, pkg_id))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = list()
+    if batch:
+        yield batch
 
 
 def stix2_to_demisto(stx_obj):
     """Converts stix2 json to demisto object
 
     Args:
-        stx_obj: json object
+        stx_obj: json object, or an iterable of bundle id and STIX2 object pairs (see iter_stix2_objects)
     """
-    data = list()
-    if isinstance(stx_obj, dict):
-        indicators, indicators_dict = extract_indicators(stx_obj)
-        entry = build_entry(indicators, indicators_dict, stx_obj.get("id"))
-        if isinstance(entry, list):
-            data.extend(entry)
-        else:
-            data.append(entry)
-    elif isinstance(stx_obj, list):
-        for obj in stx_obj:
-            indicators, indicators_dict = extract_indicators(obj)
-            entry = build_entry(obj, indicators, obj.get("id"))
-            if entry:
-                if isinstance(entry, list):
-                    data.extend(entry)
-                else:
-                    data.append(entry)
-    dumped = json.dumps(data)
-    demisto.results(dumped)
+    if isinstance(stx_obj, (dict, list)):
+        stx_obj = iter_parsed_stix2_objects(stx_obj)
+    # Every batch is serialized as soon as it is created, so only the output text is kept
+    dumped_batches = [json.dumps(batch)[1:-1] for batch in iter_indicator_batches(stx_obj)]
+    demisto.results("[" + ", ".join(dumped_batches) + "]")
 
 
 """ STIX 1 """
@@ -351,10 +459,12 @@ def create_new_ioc(data, i, timestamp, pkg_id, ind_id):
 
 
 def main():
-    txt = demisto.args().get("iocXml").encode("utf-8")
-    stx = convert_to_json(txt)
-    if stx:
-        stix2_to_demisto(stx)
+    txt = demisto.args().get("iocXml")
+    if txt.lstrip()[:1] in ("{", "["):
+        try:
+            stix2_to_demisto(iter_stix2_objects(txt))
+        except ValueError as e:
+            return_error("Could not parse the STIX2 json: {}".format(str(e)))
     else:
         with tempfile.NamedTemporaryFile() as temp:
             temp.write(demisto.args()["iocXml"].encode("utf-8"))
@@ -239,3 +239,61 @@ def test_missing_firstSeen(mocker):
     from StixParser import main
     TestStix1.mock_demisto_with_file("./TestData/missing_firstSeen.json", mocker)
     main()
+
+
+def test_iter_stix2_objects_id_after_objects():
+    """
+    Given: a STIX2 bundle whose id comes after its objects
+    When: incrementally parsing the bundle
+    Then: every object is returned with the bundle id
+    """
+    from StixParser import iter_stix2_objects
+    with open("./TestData/stix2.json") as f:
+        bundle = json.load(f)
+    text = '{"objects": ' + json.dumps(bundle["objects"]) + ', "id": "' + bundle["id"] + '"}'
+    assert list(iter_stix2_objects(text)) == [(bundle["id"], stix_object) for stix_object in bundle["objects"]]
+
+
+def test_iter_indicator_batches():
+    """
+    Given: a STIX2 object with hashes of a quoted property and a value that looks like an indicator
+    When: creating the indicator entries in batches of 2
+    Then: every indicator of the pattern is returned once, in batches of at most 2 entries
+    """
+    from StixParser import iter_indicator_batches
+    stix_object = {
+        "id": "indicator--1",
+        "created": "2019-05-26T16:18:51.000Z",
+        "pattern": "[file:hashes.'SHA-256' = 'abcd' OR file:hashes.md5 = 'ef01' OR file:hashes.md5 = 'ef01' OR "
+                   "mutex:name = 'file:x' OR url:value = 'http://a.com/file:b']"
+    }
+    batches = list(iter_indicator_batches([("bundle--1", stix_object)], batch_size=2))
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert [(entry["indicator_type"], entry["value"]) for batch in batches for entry in batch] == [
+        ("File", "abcd"), ("File", "ef01"), ("URL", "http://a.com/file:b")
+    ]
+    assert batches[0][0]["CustomFields"] == {"indicatorId": "indicator--1", "stixPackageId": "bundle--1"}
+
+
+@pytest.mark.parametrize("pattern, expected", [
+    ("[file:hashes.'SHA 256' = 'cc']", [("File", "cc")]),
+    ("[file:hashes.'SHA-256' = 'aa' AND file:hashes.'SHA 1' = 'bb']", [("File", "aa"), ("File", "bb")]),
+    ("[mutex:name = 'file:x' OR file:name = 'y']", [("File", "y")]),
+])
+def test_parse_indicators_quoted_properties(pattern, expected):
+    from StixParser import parse_indicators
+    assert list(parse_indicators({"pattern": pattern})) == expected
+
+
+def test_main_list_of_stix2_objects(mocker):
+    """
+    Given: a list of STIX2 objects
+    When: running the script
+    Then: the indicators of every object are returned
+    """
+    from StixParser import main
+    mock_demisto(mocker)
+    TestStix1.mock_demisto_with_file("./TestData/little_stix2.json", mocker)
+    main()
+    results = json.loads(demisto.results.call_args[0][0])
+    assert sorted(result["value"] for result in results) == ["http://demisto.com", "user@example.com"]
@@ -0,0 +1,123 @@
+"""
+Benchmark of the STIX2 parsing - compares loading the whole bundle and scanning every pattern term for every
+indicator type (as StixParser did) against the incremental parser with the compiled pattern term grammar, over a
+generated bundle of 200k indicators, and verifies both return the same indicators.
+Each variant runs in its own process, so its peak memory is measured separately.
+
+Run from the script directory (next to CommonServerPython.py and demistomock.py) with python 2:
+    python TestData/stix_parser_benchmark.py
+"""
+import json
+import os
+import random
+import re
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import demistomock as demisto  # noqa: E402
+from StixParser import (PATTERNS_DICT, create_indicator_entry, dbot_score, get_score,  # noqa: E402
+                        ip_parser, iter_stix2_objects, stix2_to_demisto)
+
+INDICATORS = 200000
+PATTERNS = (
+    "[ipv4-addr:value = 'ip-{a}-{b}-{c}-{d}']",
+    "[domain-name:value = 'host{n}.example.com']",
+    "[url:value = 'http://host{n}.example.com/path']",
+    "[file:hashes.md5 = '{hash}' OR file:hashes.'SHA-256' = '{hash}{hash}']",
+    "[email-addr:value = 'user{n}@example.com']",
+    "[user-account:account_login = 'user{n}']",
+)
+
+
+def create_bundle(file_path):
+    objects = []
+    for n in range(INDICATORS):
+        pattern = random.choice(PATTERNS).format(n=n, hash='%032x' % random.getrandbits(128),
+                                                 a=n >> 24, b=n >> 16 & 255, c=n >> 8 & 255, d=n & 255)
+        objects.append({
+            "created": "2019-05-26T16:18:51.000Z",
+            "id": "indicator--{}".format(n),
+            "labels": ["benchmark"],
+            "modified": "2019-05-26T16:18:51.000Z",
+            "pattern": pattern,
+            "description": "IMPACT:High, benchmark indicator",
+            "type": "indicator",
+            "valid_from": "2019-05-28T16:38:17.771225Z"
+        })
+    with open(file_path, 'w') as bundle_file:
+        json.dump({"type": "bundle", "id": "bundle--benchmark", "spec_version": "2.0", "objects": objects},
+                  bundle_file)
+
+
+def legacy_stix2_to_demisto(stx_obj):
+    regex = re.compile("(\\w.*?) = '(.*?)'")
+    patterns_lists = dict((value, list()) for value in PATTERNS_DICT.values())
+    entries_dict = dict()
+    for stix_indicator in stx_obj.get("objects"):
+        groups = regex.findall(stix_indicator.get("pattern"))
+        for key, value in PATTERNS_DICT.items():
+            for term in groups:
+                if len(term) == 2 and key in term[0]:
+                    new_indicator = term[1]
+                    if value in ("IP", "URL", "Domain"):
+                        new_indicator = ip_parser(new_indicator)
+                    patterns_lists[value].append(new_indicator)
+                    entries_dict[new_indicator] = stix_indicator
+    data = list()
+    for key, indicators_list in patterns_lists.items():
+        for indicator in set(indicators_list):
+            obj = entries_dict.get(indicator)
+            score = dbot_score(obj.get("score")) if "score" in obj else get_score(obj.get("description"))
+            data.append(create_indicator_entry(key, indicator, stx_obj.get("id"), obj.get("id"), obj.get("created"),
+                                               obj.get("source"), score))
+    demisto.results(json.dumps(data))
+
+
+def run(variant, file_path, output_path):
+    results = []
+    demisto.results = results.append
+    start = time.time()
+    with open(file_path) as bundle_file:
+        text = bundle_file.read().decode('utf-8')
+    if variant == 'before':
+        legacy_stix2_to_demisto(json.loads(text))
+    else:
+        stix2_to_demisto(iter_stix2_objects(text))
+    elapsed = time.time() - start
+    with open(output_path, 'w') as output_file:
+        output_file.write(results[0])
+    print('{:.2f} s, peak RSS {:.0f} MB'.format(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0))
+
+
+def main():
+    if len(sys.argv) == 4:
+        run(*sys.argv[1:])
+        return
+
+    random.seed(0)
+    temp_dir = tempfile.mkdtemp()
+    bundle_path = os.path.join(temp_dir, 'bundle.json')
+    try:
+        create_bundle(bundle_path)
+        print('{} indicators ({:.0f} MB bundle)'.format(INDICATORS, os.path.getsize(bundle_path) / 1024.0 / 1024))
+        outputs = []
+        for variant in ('before', 'after'):
+            output_path = os.path.join(temp_dir, variant + '.json')
+            output = subprocess.check_output([sys.executable, __file__, variant, bundle_path, output_path])
+            print('    {}: {}'.format(variant, output.strip()))
+            with open(output_path) as output_file:
+                outputs.append(sorted(json.dumps(entry, sort_keys=True) for entry in json.load(output_file)))
+        assert outputs[0] == outputs[1]
+    finally:
+        for file_name in os.listdir(temp_dir):
+            os.remove(os.path.join(temp_dir, file_name))
+        os.rmdir(temp_dir)
+
+
+if __name__ == '__main__':
+    main()
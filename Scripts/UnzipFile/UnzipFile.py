@@ -6,9 +6,16 @@ import os
 from os.path import isdir
 from os.path import isfile
 from subprocess import Popen, PIPE
-from tempfile import mkdtemp
+from tempfile import mkdtemp, NamedTemporaryFile
+from fnmatch import fnmatch
 import shutil
 import shlex
+import zipfile
+
+# size of the chunks the extracted files are copied to the war room in
+CHUNK_SIZE = 1024 * 1024
+# compression methods the zipfile module can decompress, other archives are extracted with 7z
+ZIP_SUPPORTED_COMPRESSION = (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED)
 
 
 def get_zip_path(args):
@@ -66,11 +73,143 @@ def get_zip_path(args):
     return res[0]['Contents']['path']
 
 
-def extract(file_path, dir_path, password=None):
+def check_archive_limits(members, archive_size, max_files=None, max_total_size=None, max_ratio=None):
+    """
+    Checks the archive members against the extraction limits, before anything is extracted.
+
+    :param members: list of (member name, uncompressed size) of the members to extract
+    :param archive_size: the size of the archive file in bytes
+    :param max_files: the maximal number of members
+    :param max_total_size: the maximal total uncompressed size of the members in bytes
+    :param max_ratio: the maximal ratio between the total uncompressed size and the archive size
+    """
+    total_size = sum(size for _, size in members)
+    if max_files and len(members) > max_files:
+        raise ValueError('The archive has {} files, more than the limit of {} files'.format(len(members), max_files))
+    if max_total_size and total_size > max_total_size:
+        raise ValueError('The archive files size is {} bytes, more than the limit of {} bytes'.format(
+            total_size, max_total_size))
+    if max_ratio and total_size > max_ratio * max(archive_size, 1):
+        raise ValueError('The archive compression ratio is {:.0f}, more than the limit of {}'.format(
+            float(total_size) / max(archive_size, 1), max_ratio))
+
+
+def filter_members(member_names, file_filter=None):
+    """
+    :param member_names: the member paths in the archive
+    :param file_filter: glob the member paths must match, e.g. *.exe
+    :return: the matching member paths
+    """
+    if not file_filter:
+        return member_names
+    return [name for name in member_names if fnmatch(name, file_filter)]
+
+
+def copy_to_war_room(file_name, input_file, max_size=None):
+    """
+    Copies a file object to a war room file in chunks, without reading it to memory as a whole.
+
+    :param file_name: the name of the war room file
+    :param input_file: file object to copy
+    :param max_size: the maximal number of bytes to copy, the copy is aborted and removed if the file is larger
+    :return: the war room file entry
+    """
+    file_id = demisto.uniqueFile()
+    war_room_file_path = demisto.investigation()['id'] + '_' + file_id
+    copied_size = 0
+    with open(war_room_file_path, 'wb') as output_file:
+        while True:
+            chunk = input_file.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            copied_size += len(chunk)
+            if max_size is not None and copied_size > max_size:
+                output_file.close()
+                os.remove(war_room_file_path)
+                raise ValueError('The file {} is larger than {} bytes'.format(file_name, max_size))
+            output_file.write(chunk)
+    return {'Contents': '', 'ContentsFormat': formats['text'], 'Type': entryTypes['file'], 'File': file_name,
+            'FileID': file_id}
+
+
+def is_zip_streamable(file_path):
+    """
+    :param file_path: the archive file path.
+    :return: whether the archive is a zip file that the zipfile module can extract
+    """
+    if not zipfile.is_zipfile(file_path):
+        return False
+    with zipfile.ZipFile(file_path) as zip_file:
+        return all(info.compress_type in ZIP_SUPPORTED_COMPRESSION for info in zip_file.infolist())
+
+
+def upload_zip_members(file_path, dir_path, password=None, file_filter=None, **limits):
+    """
+    Extracts the zip file member by member straight to the war room, each member is streamed in chunks.
+
+    :param file_path: the zip file path.
+    :param dir_path: directory the files are displayed as extracted to
+    :param password: password if the zip file is encrypted
+    :param file_filter: glob the extracted member paths must match
+    :param limits: the limits of check_archive_limits
+    :return: dict of the extracted files paths to their names
+    """
+    if isinstance(password, unicode):
+        password = password.encode('utf-8')
+    files_dic = {}
+    with zipfile.ZipFile(file_path) as zip_file:
+        infos = {info.filename: info for info in zip_file.infolist() if not info.filename.endswith('/')}
+        member_names = filter_members(list(infos.keys()), file_filter)
+        archive_size = os.path.getsize(file_path)
+        check_archive_limits([(name, infos[name].file_size) for name in member_names], archive_size, **limits)
+        # the sizes in the archive are not trusted, the decompressed bytes are counted against them and the limits
+        remaining_size = min(limits.get('max_total_size') or float('inf'),
+                             (limits.get('max_ratio') or float('inf')) * max(archive_size, 1))
+        for name in member_names:
+            try:
+                with zip_file.open(infos[name], pwd=password) as member:
+                    file_name = os.path.basename(name)
+                    max_size = int(min(infos[name].file_size, remaining_size))
+                    entry = copy_to_war_room(file_name, member, max_size)
+                    remaining_size -= infos[name].file_size
+                    demisto.results(entry)
+            except RuntimeError as e:
+                demisto.debug(str(e))
+                return_error("Data Error in encrypted file. Wrong password?")
+            files_dic[os.path.join(dir_path, name)] = file_name
+    return files_dic
+
+
+def list_archive(file_path, password=None):
+    """
+    The sizes are the ones written in the archive, which 7z does not verify while extracting, so the limits checked
+    against them do not protect from an archive with false sizes.
+
+    :param file_path: the archive file path.
+    :param password: password if the archive is encrypted
+    :return: list of (member path, uncompressed size) of the files in the archive, as listed by 7z
+    """
+    cmd = '7z l -slt -p{} {}'.format(password, file_path)
+    process = Popen(shlex.split(cmd), stdout=PIPE, stderr=PIPE)
+    stdout, stderr = process.communicate()
+    if stderr:
+        return_error(str(stderr))
+    members = []
+    # the technical listing has a block of "key = value" lines per member, after the ---------- line
+    for block in str(stdout).split('----------', 1)[-1].split('\n\n'):
+        properties = dict(line.split(' = ', 1) for line in block.splitlines() if ' = ' in line)
+        if 'Path' in properties and properties.get('Folder') != '+':
+            members.append((properties['Path'], int(properties.get('Size') or 0)))
+    return members
+
+
+def extract(file_path, dir_path, password=None, file_filter=None, **limits):
     """
     :param file_path: the zip file path.
     :param dir_path: directory  that the file will be extract to
     :param password: password if the zip file is encrypted
+    :param file_filter: glob the extracted member paths must match
+    :param limits: the limits of check_archive_limits
     :return:
         excluded_dirs: the excluded dirs which are in dir_path
         excluded_files: the excludedfiles which are in dir_path
@@ -78,11 +217,27 @@ def extract(file_path, dir_path, password=None):
     # remembering which files and dirs we currently have so we add them later as newly extracted files.
     excluded_files = [f for f in os.listdir('.') if isfile(f)]
     excluded_dirs = [d for d in os.listdir('.') if isdir(d)]
+    include_args = ''
+    if file_filter or limits:
+        members = list_archive(file_path, password)
+        member_names = filter_members([name for name, _ in members], file_filter)
+        check_archive_limits([member for member in members if member[0] in member_names],
+                             os.path.getsize(file_path), **limits)
+        if file_filter:
+            if not member_names:
+                return excluded_dirs, excluded_files
+            # the members to extract are passed to 7z in a list file
+            list_file = NamedTemporaryFile(delete=False)
+            list_file.write('\n'.join(member_names))
+            list_file.close()
+            include_args = ' -spd -scsUTF-8 -i@{}'.format(list_file.name)
     # extracting the zip file
-    cmd = '7z x -p{} -o{} {}'.format(password, dir_path, file_path)
+    cmd = '7z x -p{} -o{}{} {}'.format(password, dir_path, include_args, file_path)
     process = Popen(shlex.split(cmd), stdout=PIPE, stderr=PIPE)
     # process = Popen([cmd], shell=True, stdout=PIPE, stderr=PIPE)
     stdout, stderr = process.communicate()
+    if include_args:
+        os.remove(list_file.name)
     if stderr:
         return_error(str(stderr))
     stdout = str(stdout)
@@ -97,10 +252,9 @@ def upload_files(excluded_dirs, excluded_files, dir_path):
     :param excluded_dirs: excluded dirs
     :param excluded_files: excluded files
     :param dir_path: dir path for the files
-    :return:
+    :return: dict of the extracted files paths to their names
     """
     filenames = []  # type: ignore
-    file_entry_id = dir_path
     # recursive call over the file system top down
     for root, directories, files in os.walk(dir_path):
         # removing the previously existing dirs from the search
@@ -111,7 +265,23 @@ def upload_files(excluded_dirs, excluded_files, dir_path):
             if f not in excluded_files and isfile(os.path.join(root, f)):
                 filenames.append(os.path.join(root, f))
 
-    if len(filenames) == 0:
+    # extracted files can be in sub directories so we save the base names of
+    # the files and also the full path of the file
+    files_dic = {file_path: os.path.basename(file_path) for file_path in filenames}
+    for file_path, file_name in files_dic.items():
+        with open(file_path, 'rb') as _file:
+            demisto.results(copy_to_war_room(file_name, _file))
+        # the file is in the war room, it is no longer needed on the disk
+        os.remove(file_path)
+    return files_dic
+
+
+def return_extracted_files(files_dic, file_entry_id):
+    """
+    :param files_dic: dict of the extracted files paths to their names
+    :param file_entry_id: the entry id of the extracted files in the context
+    """
+    if len(files_dic) == 0:
         demisto.results({
             'Type': entryTypes['error'],
             'ContentsFormat': formats['text'],
@@ -119,13 +289,7 @@ def upload_files(excluded_dirs, excluded_files, dir_path):
         })
     else:
         results = []
-        # extracted files can be in sub directories so we save the base names of
-        # the files and also the full path of the file
-        files_base_names = [os.path.basename(file_path) for file_path in filenames]  # noqa[F812]
-        files_dic = {file_path: os.path.basename(file_path) for file_path in filenames}
-        for file_path, file_name in files_dic.items():
-            with open(file_path, 'rb') as _file:
-                demisto.results(fileResult(file_name, _file.read()))
+        files_base_names = list(files_dic.values())
         results.append(
             {
                 'Type': entryTypes['note'],
@@ -142,13 +306,36 @@ def upload_files(excluded_dirs, excluded_files, dir_path):
         demisto.results(results)
 
 
+def get_limits(args):
+    """
+    :param args: arg from demisto
+    :return: the extraction limits of check_archive_limits
+    """
+    limits = {}
+    if args.get('maxFiles'):
+        limits['max_files'] = int(args['maxFiles'])
+    if args.get('maxTotalSizeMB'):
+        limits['max_total_size'] = int(float(args['maxTotalSizeMB']) * 1024 * 1024)
+    if args.get('maxCompressionRatio'):
+        limits['max_ratio'] = float(args['maxCompressionRatio'])
+    return limits
+
+
 def main():
     dir_path = mkdtemp()
     try:
         args = demisto.args()
         file_path = get_zip_path(args)
-        excluded_dirs, excluded_files = extract(file_path=file_path, dir_path=dir_path, password=args.get('password'))
-        upload_files(excluded_dirs, excluded_files, dir_path)
+        limits = get_limits(args)
+        if is_zip_streamable(file_path):
+            files_dic = upload_zip_members(file_path, dir_path, password=args.get('password'),
+                                           file_filter=args.get('fileFilter'), **limits)
+        else:
+            excluded_dirs, excluded_files = extract(file_path=file_path, dir_path=dir_path,
+                                                    password=args.get('password'), file_filter=args.get('fileFilter'),
+                                                    **limits)
+            files_dic = upload_files(excluded_dirs, excluded_files, dir_path)
+        return_extracted_files(files_dic, dir_path)
 
     except Exception as e:
         return_error(str(e))
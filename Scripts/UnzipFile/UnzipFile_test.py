@@ -77,3 +77,117 @@ def test_unzip_with_password(file_name, password):
     # - ensure that the saved file has expected content data
     assert expected_data == actual_file_data,\
         'failed unzipping file: ' + zipped_file_path + ' with password: ' + password
+
+
+def read_war_room_files(results_mock):
+    """
+    Reads and removes the war room files of the demisto.results calls
+    """
+    files = {}
+    for call in results_mock.call_args_list:
+        entry = call[0][0]
+        if isinstance(entry, dict) and entry.get('FileID'):
+            war_room_file_path = demisto.investigation()['id'] + '_' + entry['FileID']
+            with open(war_room_file_path, 'rb') as f:
+                files[entry['File']] = f.read()
+            os.remove(war_room_file_path)
+    return files
+
+
+@pytest.mark.parametrize('file_name, password', [('testZip.yml', None), ('fix_unzip.png', 'demisto')])
+def test_upload_zip_members(mocker, file_name, password):
+    """
+    Given
+    - valid zip file, with or without a password
+    When
+    - run upload_zip_members on that zip file, with a filter matching the file
+    Then
+    - ensure the file is uploaded to the war room with the original filename and content
+    """
+    mocker.patch.object(demisto, 'results')
+    main_dir = '/'.join(__file__.split('/')[0:-1])
+    expected_file_unzipped = os.path.join(main_dir + '/data_test', file_name)
+    files_dic = upload_zip_members(expected_file_unzipped + '.zip', '/tmp/dir', password, file_filter='*.*')
+    with open(expected_file_unzipped, 'rb') as f:
+        expected_data = f.read()
+    assert files_dic == {'/tmp/dir/' + file_name: file_name}
+    assert read_war_room_files(demisto.results) == {file_name: expected_data}
+
+
+def test_upload_zip_members_filter(mocker):
+    """
+    Given
+    - zip file with a file and a __MACOSX directory
+    When
+    - run upload_zip_members with a filter matching only the png files
+    Then
+    - ensure only the png file is uploaded
+    """
+    mocker.patch.object(demisto, 'results')
+    main_dir = '/'.join(__file__.split('/')[0:-1])
+    files_dic = upload_zip_members(main_dir + '/data_test/item.png.zip', '/tmp/dir', file_filter='item*.png')
+    assert list(files_dic.values()) == ['item.png']
+    assert list(read_war_room_files(demisto.results).keys()) == ['item.png']
+
+
+@pytest.mark.parametrize('zip_name, limits, error', [
+    ('item.png.zip', {'max_files': 1}, 'more than the limit of 1 files'),
+    ('item.png.zip', {'max_total_size': 1000}, 'more than the limit of 1000 bytes'),
+    ('testZip.yml.zip', {'max_ratio': 2}, 'more than the limit of 2'),
+])
+def test_upload_zip_members_limits(mocker, zip_name, limits, error):
+    """
+    Given
+    - zip file exceeding a limit - item.png.zip has 2 files of 8887 bytes, testZip.yml.zip is 5374 bytes
+      compressed to less than half
+    When
+    - run upload_zip_members with that limit
+    Then
+    - ensure nothing is uploaded and the limit error is raised
+    """
+    mocker.patch.object(demisto, 'results')
+    main_dir = '/'.join(__file__.split('/')[0:-1])
+    with pytest.raises(ValueError, match=error):
+        upload_zip_members(main_dir + '/data_test/' + zip_name, '/tmp/dir', **limits)
+    assert not demisto.results.called
+
+
+def tamper_zip_sizes(zip_path, size):
+    """
+    Writes a false uncompressed size to the local and central directory headers of the zip members
+    """
+    import struct
+    with open(zip_path, 'rb') as f:
+        data = bytearray(f.read())
+    for signature, size_offset in ((b'PK\x03\x04', 22), (b'PK\x01\x02', 24)):
+        offset = data.find(signature)
+        while offset != -1:
+            data[offset + size_offset:offset + size_offset + 4] = struct.pack('<I', size)
+            offset = data.find(signature, offset + 4)
+    with open(zip_path, 'wb') as f:
+        f.write(data)
+
+
+def test_upload_zip_members_false_size(mocker, tmpdir):
+    """
+    Given
+    - zip file with a 1 MB file whose declared size was changed to 1 KB
+    When
+    - run upload_zip_members on that zip file, within the size limits of the declared size
+    Then
+    - ensure the extraction is aborted once the file is larger than its declared size, and no file is left
+    """
+    mocker.patch.object(demisto, 'results')
+    mocker.patch.object(demisto, 'uniqueFile', return_value='false_size')
+    zip_path = str(tmpdir.join('bomb.zip'))
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        zip_file.writestr('bomb.txt', b'\0' * 1024 * 1024)
+    tamper_zip_sizes(zip_path, 1024)
+    with zipfile.ZipFile(zip_path) as zip_file:
+        assert zip_file.getinfo('bomb.txt').file_size == 1024
+
+    mocker.patch('UnzipFile.CHUNK_SIZE', 4096)
+    with pytest.raises(ValueError, match='larger than 1024 bytes'):
+        upload_zip_members(zip_path, '/tmp/dir', max_total_size=2048, max_ratio=1000)
+    assert not demisto.results.called
+    assert not os.path.exists(demisto.investigation()['id'] + '_false_size')
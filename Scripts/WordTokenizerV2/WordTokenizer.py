@@ -1,7 +1,6 @@
+from collections import OrderedDict
 from HTMLParser import HTMLParser
 
-import spacy
-
 from CommonServerPython import *
 
 CLEAN_HTML = (demisto.args()['cleanHtml'] == 'yes')
@@ -18,6 +17,7 @@ REPLACE_URLS = demisto.args()['replaceUrls'] == 'yes'
 REPLACE_NUMBERS = demisto.args()['replaceNumbers'] == 'yes'
 LEMMATIZER = demisto.args()['useLemmatization'] == 'yes'
 VALUE_IS_JSON = demisto.args()['isValueJson'] == 'yes'
+BATCH_SIZE = 1000
 
 HTML_PATTERNS = [
     re.compile(r"(?is)<(script|style).*?>.*?(</\1>)"),
@@ -29,7 +29,16 @@ HTML_PATTERNS = [
 
 # define global parsers
 html_parser = HTMLParser()
-nlp = spacy.load('en_core_web_sm', disable=['tagger', 'parser', 'ner', 'textcat'])
+nlp = None
+hashed_words = {}  # type: dict
+
+
+def get_nlp():
+    global nlp
+    if nlp is None:
+        import spacy
+        nlp = spacy.load('en_core_web_sm', disable=['tagger', 'parser', 'ner', 'textcat'])
+    return nlp
 
 
 def clean_html(text):
@@ -53,15 +62,40 @@ def remove_multiple_whitespaces(text):
 
 
 def hash_word(word):
-    return str(hash_djb2(word, int(HASH_SEED)))
+    if word not in hashed_words:
+        hashed_words[word] = str(hash_djb2(word, int(HASH_SEED)))
+    return hashed_words[word]
 
 
-def tokenize_text(text):
+def to_unicode(text):
     try:
-        unicode_text = unicode(text)
+        return unicode(text)
     except Exception:
-        unicode_text = text
-    doc = nlp(unicode(unicode_text))
+        return text
+
+
+def tokenize_text(text):
+    return tokenize_texts([text])[0]
+
+
+def tokenize_texts(texts):
+    """
+    Tokenizes a list of texts, passing the distinct texts through the nlp pipeline in batches.
+
+    :type texts: ``list``
+    :param texts: The texts to tokenize
+
+    :return: The tokenize_text result of every text, in the order of texts
+    :rtype: ``list``
+    """
+    unicode_texts = [unicode(to_unicode(text)) for text in texts]
+    distinct_texts = list(OrderedDict.fromkeys(unicode_texts))
+    docs = get_nlp().pipe(distinct_texts, batch_size=BATCH_SIZE)
+    results = {text: tokenize_doc(doc, text) for text, doc in zip(distinct_texts, docs)}
+    return [results[text] for text in unicode_texts]
+
+
+def tokenize_doc(doc, unicode_text):
     original_text_indices_to_words = map_indices_to_words(unicode_text)
     tokens_list = []
     original_words_to_tokens = {}  # type: ignore
@@ -130,13 +164,12 @@ def word_tokenize(text):
     if not isinstance(text, list):
         text = [text]
 
+    cleaned_texts = [remove_multiple_whitespaces(clean_html(remove_line_breaks(t))) for t in text]
+    tokenized_texts = tokenize_texts(cleaned_texts)
+
     result = []
-    for t in text:
-        original_text = t
-        t = remove_line_breaks(t)
-        t = clean_html(t)
-        t = remove_multiple_whitespaces(t)
-        tokenized_text, hash_tokenized_text, original_words_to_tokens, words_to_hashed_tokens = tokenize_text(t)
+    for original_text, tokenized in zip(text, tokenized_texts):
+        tokenized_text, hash_tokenized_text, original_words_to_tokens, words_to_hashed_tokens = tokenized
         text_result = {
             'originalText': original_text,
             'tokenizedText': tokenized_text,
@@ -0,0 +1,78 @@
+"""
+Throughput benchmark of WordTokenizer - compares tokenizing every text with its own nlp call against the batched
+tokenize_texts, over a synthetic corpus of incident bodies with repeating texts.
+
+Run from the script directory (next to CommonServerPython.py and demistomock.py), in the demisto/dl image:
+    python test_data/word_tokenizer_benchmark.py
+"""
+import random
+import time
+from collections import defaultdict
+
+import demistomock as demisto
+
+
+def get_args():
+    args = defaultdict(lambda: 'yes')
+    args['encoding'] = 'utf8'
+    args['removeNonEnglishWords'] = 'no'
+    args['hashWordWithSeed'] = '5381'
+    return args
+
+
+demisto.args = get_args
+
+from CommonServerPython import hash_djb2  # noqa: E402
+import WordTokenizer  # noqa: E402
+
+TEXTS = 5000
+DISTINCT_TEXTS = 3000
+WORDS = ['password', 'account', 'verify', 'click', 'here', 'invoice', 'urgent', 'bank', 'update', 'your', 'the',
+         'login', 'user@example.com', 'http://example.com/login', '2019', 'payment', 'attached', 'please', 'review']
+
+
+def get_corpus():
+    rand = random.Random(0)
+    distinct_texts = [' '.join(rand.choice(WORDS) for _ in range(rand.randint(20, 200)))
+                      for _ in range(DISTINCT_TEXTS)]
+    return [rand.choice(distinct_texts) for _ in range(TEXTS)]
+
+
+def legacy_hash_word(word):
+    return str(hash_djb2(word, int(WordTokenizer.HASH_SEED)))
+
+
+def legacy_tokenize(texts):
+    hash_word = WordTokenizer.hash_word
+    WordTokenizer.hash_word = legacy_hash_word
+    try:
+        unicode_texts = [WordTokenizer.to_unicode(t) for t in texts]
+        return [WordTokenizer.tokenize_doc(WordTokenizer.nlp(t), t) for t in unicode_texts]
+    finally:
+        WordTokenizer.hash_word = hash_word
+
+
+def batched_tokenize(texts):
+    WordTokenizer.hashed_words.clear()
+    return WordTokenizer.tokenize_texts(texts)
+
+
+def measure(func, texts):
+    start = time.time()
+    result = func(texts)
+    return result, time.time() - start
+
+
+def main():
+    texts = get_corpus()
+    WordTokenizer.get_nlp()
+    before, before_time = measure(legacy_tokenize, texts)
+    after, after_time = measure(batched_tokenize, texts)
+    assert before == after
+    print('%d texts (%d distinct)' % (TEXTS, DISTINCT_TEXTS))
+    print('    before: %.2f s, %.0f texts/s' % (before_time, TEXTS / before_time))
+    print('    after:  %.2f s, %.0f texts/s' % (after_time, TEXTS / after_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -13,8 +13,10 @@ def get_args():
 
 demistomock.args = get_args
 
-from WordTokenizer import remove_line_breaks, clean_html, tokenize_text, word_tokenize,\
-    remove_multiple_whitespaces, map_indices_to_words  # noqa
+import WordTokenizer  # noqa
+from WordTokenizer import remove_line_breaks, clean_html, tokenize_text, tokenize_texts, word_tokenize,\
+    remove_multiple_whitespaces, map_indices_to_words, hash_word  # noqa
+from CommonServerPython import hash_djb2  # noqa
 
 
 def test_remove_line_breaks():
@@ -57,3 +59,25 @@ def test_inclusion():
     text = 'a aa  aaa'
     indices_to_words = map_indices_to_words(text)
     assert indices_to_words == {0: 'a', 2: 'aa', 3: 'aa', 6: 'aaa', 7: 'aaa', 8: 'aaa'}
+
+
+def test_tokenize_texts(mocker):
+    pipe = mocker.spy(WordTokenizer.get_nlp(), 'pipe')
+    texts = ["test@demisto.com is 100 going to http://google.com bla bla", "going to bla", "going to bla"]
+    results = tokenize_texts(texts)
+    assert pipe.call_count == 1
+    assert list(pipe.call_args[0][0]) == texts[:2]
+    assert [r[0] for r in results] == ["EMAIL_PATTERN NUMBER_PATTERN go URL_PATTERN bla bla", "go bla", "go bla"]
+    assert results == [tokenize_text(t) for t in texts]
+
+
+def test_word_tokenize_list():
+    texts = ["going to bla", "<html>going to bla</html>", "going\nto bla"]
+    entry = word_tokenize(texts)
+    assert [r['originalText'] for r in entry['Contents']] == texts
+    assert all(r['tokenizedText'] == "go bla" for r in entry['Contents'])
+
+
+def test_hash_word():
+    assert hash_word('bla') == hash_word('bla') == str(hash_djb2('bla', 5381))
+    assert WordTokenizer.hashed_words['bla'] == '193487380'
@@ -46,3 +46,68 @@ def test_main(mocker):
     assert results[0]['Type'] == entryTypes['note']
     assert results[0]['Contents'][0]['HasMatch']
     assert results[0]['Contents'][0]['Matches'][0]['RuleName'] == 'PE_file_identifier'
+
+
+def test_compile_rules_cache(mocker, tmp_path):
+    import yara
+    from YaraScan import compile_rules
+    rule = 'rule MZ { strings: $MZ = "MZ" ascii condition: $MZ at 0 }'
+    rules = compile_rules(rule, str(tmp_path))
+    assert len(list(tmp_path.iterdir())) == 1
+    # the second time the rules are loaded from the cache
+    mocker.patch.object(yara, 'compile', side_effect=AssertionError('compiled again'))
+    cached_rules = compile_rules(rule, str(tmp_path))
+    assert [match.rule for match in cached_rules.match(filepath='test_data/unzip.exe')] == \
+        [match.rule for match in rules.match(filepath='test_data/unzip.exe')] == ['MZ']
+
+
+def test_compile_rules_cache_not_trusted(mocker, tmp_path):
+    import os
+    import yara
+    from YaraScan import compile_rules
+    rule = 'rule MZ { strings: $MZ = "MZ" ascii condition: $MZ at 0 }'
+    cache_dir = tmp_path / 'cache'
+    compile_rules(rule, str(cache_dir))
+    assert oct(cache_dir.stat().st_mode & 0o777) == oct(0o700)
+    compile = mocker.spy(yara, 'compile')
+    # cached rules written by another user are compiled again
+    mocker.patch('os.getuid', return_value=os.getuid() + 1)
+    compile_rules(rule, str(cache_dir))
+    assert compile.call_count == 1
+    mocker.stopall()
+    # and so are cached rules which other users can write
+    compile = mocker.spy(yara, 'compile')
+    cached_file = next(cache_dir.iterdir())
+    cached_file.chmod(0o666)
+    compile_rules(rule, str(cache_dir))
+    assert compile.call_count == 1
+
+
+def test_compile_rules_cache_size(tmp_path):
+    import os
+    from YaraScan import compile_rules
+    for i in range(4):
+        for cached_file in tmp_path.iterdir():
+            mtime = cached_file.stat().st_mtime - 10
+            os.utime(str(cached_file), (mtime, mtime))
+        compile_rules('rule r%d { condition: true }' % i, str(tmp_path), cache_size=2)
+    # the least recently used rules are removed
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_main_compile_error(mocker):
+    def executeCommand(name, args=None):
+        return [{'Type': entryTypes['note'],
+                 'Contents': {'path': 'test_data/unzip.exe', 'name': 'unzip.exe', 'ID': args['id']}}]
+
+    mocker.patch.object(demisto, 'args', return_value={
+        'entryIDs': 'test1,test2',
+        'yaraRule': 'rule {',
+        'cacheCompiledRules': 'false'
+    })
+    mocker.patch.object(demisto, 'executeCommand', side_effect=executeCommand)
+    mocker.patch.object(demisto, 'results')
+    main()
+    contents = demisto.results.call_args[0][0]['Contents']
+    assert [result['fileID'] for result in contents] == ['test1', 'test2']
+    assert all(result['HasError'] and result['Errors'] for result in contents)